@@ -0,0 +1,123 @@
+import asyncio
+import os
+import sys
+import time
+
+import django
+import numpy as np
+from django.conf import settings
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+# Standalone cache-only settings, mirroring fuel_project.settings.CACHES, so
+# the benchmark needs nothing but a Redis server.
+CACHE_URL = os.getenv("CACHE_URL", "redis://127.0.0.1:6379/15")
+settings.configure(
+    CACHES={
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": CACHE_URL,
+            "OPTIONS": {
+                "CLIENT_CLASS": "django_redis.client.DefaultClient",
+                "SERIALIZER": "fuel_route_api.core.codecs.CacheSerializer",
+                "CONNECTION_POOL_KWARGS": {"max_connections": 10},
+            },
+        }
+    }
+)
+django.setup()
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from django.core.cache import cache  # noqa: E402
+
+from fuel_route_api.core.async_redis_cache import async_cache  # noqa: E402
+from fuel_route_api.core.polyline import pack_route  # noqa: E402
+
+COROUTINES = 500
+OPS_PER_COROUTINE = 40
+_rng = np.random.default_rng(7)
+_lats = 35.0 + np.cumsum(_rng.normal(0.004, 0.002, 2500))
+_lons = -97.0 + np.cumsum(_rng.normal(0.006, 0.002, 2500))
+# A fuel plan entry, and a cached route (packed polyline, ~2.5k vertices).
+VALUES = {
+    "plan": {"fuel_stops": [{"name": "Stop", "retail_price": 3.49}] * 3},
+    "route": pack_route(
+        {
+            "routes": [
+                {
+                    "summary": {"lengthInMeters": 1_900_000, "travelTimeInSeconds": 70_000},
+                    "points": [
+                        {"latitude": float(lat), "longitude": float(lon)}
+                        for lat, lon in zip(_lats, _lons)
+                    ],
+                }
+            ]
+        }
+    ),
+}
+
+
+def thread_hop_ops():
+    return (
+        sync_to_async(cache.get, thread_sensitive=False),
+        sync_to_async(cache.set, thread_sensitive=False),
+    )
+
+
+def async_ops():
+    return async_cache.get, async_cache.set
+
+
+async def worker(i, op, get, set_, value):
+    for n in range(OPS_PER_COROUTINE):
+        key = f"bench:{i}:{n % 4}"
+        if op == "get":
+            await get(key)
+        else:
+            await set_(key, value, 60)
+
+
+async def lag_probe(stop, lags):
+    # How late the loop wakes a 1 ms sleeper: time spent blocking it.
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - started - 0.001)
+
+
+async def run(ops, op, value):
+    get, set_ = ops()
+    stop, lags = asyncio.Event(), []
+    probe = asyncio.ensure_future(lag_probe(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i, op, get, set_, value) for i in range(COROUTINES)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+    return COROUTINES * OPS_PER_COROUTINE / elapsed, max(lags) * 1000 if lags else 0.0
+
+
+async def main():
+    # Round trip through both clients first: each must read the other's value.
+    await async_cache.set("bench:compat", VALUES["route"], 60)
+    assert await sync_to_async(cache.get)("bench:compat") == VALUES["route"]
+    await sync_to_async(cache.set)("bench:compat", 7, 60)
+    assert await async_cache.get("bench:compat") == 7
+
+    print(f"{COROUTINES} coroutines x {OPS_PER_COROUTINE} ops, {CACHE_URL}")
+    print(f"{'value':>6} {'op':>4} {'client':>28} {'ops/sec':>9} {'max loop lag ms':>16}")
+    for value_name, value in VALUES.items():
+        for op in ("set", "get"):
+            for name, ops in (
+                ("sync_to_async(django cache)", thread_hop_ops),
+                ("redis.asyncio", async_ops),
+            ):
+                rate, lag = await run(ops, op, value)
+                print(f"{value_name:>6} {op:>4} {name:>28} {rate:>9.0f} {lag:>16.1f}")
+    await async_cache.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
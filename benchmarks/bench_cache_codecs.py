@@ -0,0 +1,125 @@
+import gzip
+import json
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from fuel_route_api.core.codecs import COMPRESSORS, decode, encode  # noqa: E402
+from fuel_route_api.core.polyline import pack_route  # noqa: E402
+
+RUNS = 20
+
+
+def route_payload(count):
+    # Same shape GeoapifyService caches: TomTom-style summary plus points.
+    rng = np.random.default_rng(7)
+    lats = 34.0 + np.cumsum(rng.normal(0.0004, 0.0002, count))
+    lons = -118.0 + np.cumsum(rng.normal(0.0006, 0.0002, count))
+    return {
+        "routes": [
+            {
+                "summary": {
+                    "lengthInMeters": 3_120_455.2,
+                    "travelTimeInSeconds": 105_310,
+                    "trafficDelayInSeconds": 0,
+                    "fuelConsumptionInLiters": 243.4,
+                },
+                "points": [
+                    {"latitude": a, "longitude": o}
+                    for a, o in zip(lats.tolist(), lons.tolist())
+                ],
+            }
+        ]
+    }
+
+
+def summary_payload():
+    stop = {
+        "station_id": 48213,
+        "name": "PILOT TRAVEL CENTER #1234",
+        "retail_price": 3.459,
+        "distance_from_route_miles": 0.42,
+        "location": {"lat": 35.21, "lon": -101.83},
+        "milepost": 512.3,
+        "gallons": 71.2,
+        "cost": 246.28,
+    }
+    return {
+        "fuel_stops": [stop] * 4,
+        "total_fuel_cost": 1032.11,
+        "total_distance_miles": 1938.5,
+        "number_of_stops": 4,
+        "average_price": 3.41,
+        "gallons_needed": 298.2,
+        "gallons_purchased": 301.7,
+        "planner": "min_cost",
+        "success": True,
+    }
+
+
+def timed(fn, *args):
+    samples = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return result, samples[len(samples) // 2]
+
+
+def main():
+    payloads = [
+        ("summary", summary_payload()),
+        ("packed route", pack_route(route_payload(20_000))),
+        ("raw route 20k pts", route_payload(20_000)),
+    ]
+    codecs = [
+        (
+            "pickle (old default)",
+            lambda v: pickle.dumps(v, pickle.HIGHEST_PROTOCOL),
+            pickle.loads,
+        ),
+        (
+            "gzip-9 json (old)",
+            lambda v: gzip.compress(json.dumps(v).encode("utf-8")),
+            lambda b: json.loads(gzip.decompress(b)),
+        ),
+        ("msgpack", lambda v: encode(v, "msgpack", "none"), decode),
+        ("orjson", lambda v: encode(v, "json", "none"), decode),
+    ]
+    for compressor in ("zlib", "zstd", "lz4"):
+        if compressor in COMPRESSORS:
+            codecs += [
+                (
+                    f"msgpack+{compressor}",
+                    lambda v, c=compressor: encode(v, "msgpack", c, threshold=0),
+                    decode,
+                ),
+                (
+                    f"orjson+{compressor}",
+                    lambda v, c=compressor: encode(v, "json", c, threshold=0),
+                    decode,
+                ),
+            ]
+        else:
+            print(f"{compressor} not installed; skipped")
+    codecs.append(("default encode()", encode, decode))
+
+    for label, payload in payloads:
+        print(f"\n{label}")
+        print(f"{'codec':>22} {'bytes':>10} {'enc p50 ms':>11} {'dec p50 ms':>11}")
+        for name, dumps, loads in codecs:
+            blob, encode_ms = timed(dumps, payload)
+            _, decode_ms = timed(loads, blob)
+            print(f"{name:>22} {len(blob):>10} {encode_ms:>11.3f} {decode_ms:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+import time
+from hashlib import md5
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from fuel_route_api.core.cache_keys import cache_keys  # noqa: E402
+
+POINTS = 20_000
+RUNS = 20
+
+
+def synthetic_route():
+    rng = np.random.default_rng(7)
+    lats = 34.0 + np.cumsum(rng.normal(0.0004, 0.0002, POINTS))
+    lons = -118.0 + np.cumsum(rng.normal(0.0006, 0.0002, POINTS))
+    return [
+        {"latitude": lat, "longitude": lon}
+        for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
+
+
+def json_md5(payload):
+    # The key builder CacheKeyDependencies used before.
+    return md5(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def timed(fn, *args):
+    samples = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2], samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+
+
+def main():
+    points = synthetic_route()
+    payload = {"type": "min_cost", "route_points": points, "mpg": 6.5, "corridor": 10}
+    print(f"{POINTS}-point route, {RUNS} runs")
+    print(f"{'builder':>18} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, fn in [
+        ("json + md5", json_md5),
+        ("packed + blake2b", lambda p: cache_keys.build("fuel_stops", p, 1)),
+    ]:
+        p50, p99 = timed(fn, payload)
+        print(f"{name:>18} {p50:>8.2f} {p99:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from fuel_route_api.core.http_pool import HttpPool  # noqa: E402
+
+REQUESTS = 2000
+CONCURRENCY = 32
+# Stand-in for a provider round trip; keeps the server side constant so the
+# difference is connection setup alone.
+SERVER_DELAY_SECONDS = 0.002
+
+
+async def geocode_handler(request):
+    await asyncio.sleep(SERVER_DELAY_SECONDS)
+    return web.json_response({"results": [{"lat": 36.54, "lon": -95.22}]})
+
+
+async def start_server():
+    app = web.Application()
+    app.router.add_get("/geocode", geocode_handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/geocode"
+
+
+async def per_request_session(url):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            await response.json()
+
+
+def pooled_session(pool):
+    async def call(url):
+        async with pool.client("bench") as session:
+            async with session.get(url) as response:
+                await response.json()
+
+    return call
+
+
+async def run(call, url):
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    timings = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await call(url)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(REQUESTS)))
+    timings.sort()
+    return timings[len(timings) // 2], timings[int(len(timings) * 0.99) - 1]
+
+
+async def main():
+    runner, url = await start_server()
+    pool = HttpPool(limit_per_host=CONCURRENCY)
+    try:
+        print(f"{REQUESTS} requests, concurrency {CONCURRENCY}, local HTTP server")
+        print(f"{'client':>22} {'p50 ms':>10} {'p99 ms':>10}")
+        for name, call in (
+            ("session per request", per_request_session),
+            ("pooled session", pooled_session(pool)),
+        ):
+            p50, p99 = await run(call, url)
+            print(f"{name:>22} {p50:>10.3f} {p99:>10.3f}")
+    finally:
+        await pool.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
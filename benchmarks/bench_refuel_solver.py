@@ -0,0 +1,45 @@
+import os
+import random
+import statistics
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from fuel_route_api.core.refuel_solver import plan_refuel  # noqa: E402
+
+ROUTE_MILES = 3000
+TANK_GALLONS = 150
+MPG = 6.5
+RUNS = 200
+
+
+def synthetic_corridor(n_stations, rng):
+    mileposts = sorted(rng.uniform(0, ROUTE_MILES) for _ in range(n_stations))
+    prices = [round(rng.uniform(2.8, 4.2), 3) for _ in mileposts]
+    return mileposts, prices
+
+
+def bench(n_stations):
+    rng = random.Random(n_stations)
+    corridors = [synthetic_corridor(n_stations, rng) for _ in range(RUNS)]
+    timings = []
+    for mileposts, prices in corridors:
+        started = time.perf_counter()
+        plan_refuel(mileposts, prices, ROUTE_MILES, TANK_GALLONS, MPG)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return (
+        statistics.median(timings),
+        timings[int(len(timings) * 0.99) - 1],
+    )
+
+
+if __name__ == "__main__":
+    print(f"{ROUTE_MILES}-mile route, {TANK_GALLONS} gal tank @ {MPG} mpg")
+    print(f"{'stations':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for n in (100, 300, 500, 1000, 5000):
+        p50, p99 = bench(n)
+        print(f"{n:>10} {p50:>10.3f} {p99:>10.3f}")
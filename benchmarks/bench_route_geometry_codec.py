@@ -0,0 +1,77 @@
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from fuel_route_api.core.compression import compress_data, decompress_data  # noqa: E402
+from fuel_route_api.core.polyline import decode_points, encode_points  # noqa: E402
+
+ROUTE_MILES = 2000
+# Geoapify returns a vertex every ~50 m on interstates before simplification.
+POINT_SPACING_MILES = 0.03
+RUNS = 5
+
+
+def synthetic_route():
+    count = int(ROUTE_MILES / POINT_SPACING_MILES)
+    rng = np.random.default_rng(7)
+    heading = np.cumsum(rng.normal(0, 0.05, count))
+    step = POINT_SPACING_MILES / 69.0
+    lats = 34.0 + np.cumsum(step * np.sin(heading) * 0.5 + step * 0.3)
+    lons = -118.0 + np.cumsum(step * np.cos(heading))
+    return [
+        {"latitude": lat, "longitude": lon}
+        for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
+
+
+def timed(fn, *args):
+    best = float("inf")
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - started)
+    return result, best * 1000
+
+
+def main():
+    points = synthetic_route()
+    print(f"{ROUTE_MILES}-mile route, {len(points)} points")
+    print(f"{'codec':>22} {'bytes':>10} {'encode ms':>10} {'decode ms':>10}")
+
+    codecs = [
+        (
+            "pickle (cache default)",
+            lambda: pickle.dumps({"route": points}),
+            lambda blob: pickle.loads(blob),
+        ),
+        (
+            "compress_data",
+            lambda: compress_data({"route": points}),
+            lambda blob: decompress_data(blob),
+        ),
+        (
+            "polyline p5",
+            lambda: encode_points(points, 5),
+            lambda blob: decode_points(blob, 5),
+        ),
+        (
+            "polyline p6",
+            lambda: encode_points(points, 6),
+            lambda blob: decode_points(blob, 6),
+        ),
+    ]
+    for name, encode, decode in codecs:
+        blob, encode_ms = timed(encode)
+        _, decode_ms = timed(decode, blob)
+        print(f"{name:>22} {len(blob):>10} {encode_ms:>10.2f} {decode_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
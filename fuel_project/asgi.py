@@ -17,7 +17,9 @@ from starlette.middleware.sessions import SessionMiddleware
 from starlette.routing import Mount
 from starlette.staticfiles import StaticFiles
 
+from fuel_route_api.core.async_redis_cache import async_cache
 from fuel_route_api.core.env import SECRET_KEY
+from fuel_route_api.core.http_pool import http_pool
 from fuel_route_api.loaders.fuel_station_loader import FuelStationLoader
 
 django_app = get_asgi_application()
@@ -26,9 +28,15 @@ django_app = get_asgi_application()
 async def startup():
     loader = FuelStationLoader()
     # result = await loader.async_load()
+    await http_pool.open()
     print(f"[Startup]")
 
 
+async def shutdown():
+    await http_pool.close()
+    await async_cache.close()
+
+
 application = Starlette(
     routes=[
         Mount(
@@ -40,4 +48,5 @@ application = Starlette(
         Middleware(SessionMiddleware, secret_key=SECRET_KEY),
     ],
     on_startup=[startup],
+    on_shutdown=[shutdown],
 )
@@ -5,6 +5,7 @@ import sys
 
 import django
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from dotenv import load_dotenv
 
 
@@ -37,9 +38,23 @@ app.conf.update(
 )
 
 
+from fuel_route_api.core.http_session import close_session, open_session
+
+
+@worker_process_init.connect
+def init_http_session(**kwargs):
+    open_session()
+
+
+@worker_process_shutdown.connect
+def shutdown_http_session(**kwargs):
+    close_session()
+
 
 from fuel_route_api.tasks import calculate_route_tasks
+from fuel_route_api.tasks import refresh_cache_tasks
 from fuel_route_api.tasks import send_verify_tasks
+from fuel_route_api.tasks import warm_cache_tasks
 
 
 if __name__ == "__main__":
@@ -15,7 +15,7 @@ from datetime import timedelta
 from pathlib import Path
 import dj_database_url
 from dotenv import load_dotenv
-from fuel_route_api.core.env import ALLOWED_ORIGINS, CORS_ALLOWED_HOSTS, CSRF_TRUSTED_HOSTS
+from fuel_route_api.core.env import ALLOWED_ORIGINS, CORS_ALLOWED_HOSTS, CSRF_TRUSTED_HOSTS, WARM_INTERVAL_SECONDS
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -139,6 +139,7 @@ CACHES = {
         "LOCATION": os.getenv("CACHE_URL"),
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            "SERIALIZER": "fuel_route_api.core.codecs.CacheSerializer",
             "CONNECTION_POOL_KWARGS": {
                 "max_connections": 10,
             },
@@ -203,6 +204,13 @@ CELERY_BROKER_POOL_LIMIT = 5
 CELERY_REDIS_MAX_CONNECTIONS = 10
 CELERY_WORKER_CONCURRENCY = 1
 
+CELERY_BEAT_SCHEDULE = {
+    "warm-popular-lanes": {
+        "task": "warm_popular_lanes",
+        "schedule": WARM_INTERVAL_SECONDS,
+    },
+}
+
 # USE ONLY IN DEVELOPMENT FOR WINDOWS
 # GDAL_LIBRARY_PATH = r"C:/OSGeo4W/bin/gdal311.dll"
 # if os.name == "nt":
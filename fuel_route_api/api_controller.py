@@ -6,6 +6,7 @@ from ninja_extra import NinjaExtraAPI
 from fuel_route_api.routes.route_controller_routes import RouteController
 from fuel_route_api.routes.fuel_route import FuelRoutes
 from fuel_route_api.routes.geocode_routes import GetAndGeocodeRoutes
+from fuel_route_api.routes.metrics_routes import MetricsController
 from fuel_route_api.routes.user_routes import AuthController
 
 from .tokens import TokenRequest
@@ -23,7 +24,8 @@ api.register_controllers(
     AuthController,
     FuelRoutes,
     RouteController,
-    GetAndGeocodeRoutes
+    GetAndGeocodeRoutes,
+    MetricsController,
 )
 
 
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class FuelRouteApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "fuel_route_api"
+
+    def ready(self):
+        from fuel_route_api import signals  # noqa: F401
@@ -0,0 +1,14 @@
+import re
+
+
+def clean_address(address: str) -> str:
+    if not address:
+        return ""
+    address = re.sub(r"EXIT\s*\d+", "", address, flags=re.IGNORECASE)
+    address = address.replace("&", "and").replace(",", "")
+    return address.strip()
+
+
+def normalize_address(address: str, city: str, state: str) -> str:
+    parts = [clean_address(address.strip('" ')), city.strip('" '), state.strip('" ')]
+    return "|".join(" ".join(part.lower().split()) for part in parts)
@@ -0,0 +1,144 @@
+import asyncio
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from fuel_route_api.core.env import ASYNC_CACHE_MAX_CONNECTIONS
+
+
+class AsyncRedisCache:
+    # Async-native twin of the django-redis default cache. Keys, versions and
+    # value encoding (ints raw, everything else via the configured
+    # serializer/compressor) go through django-redis itself, so both clients
+    # read each other's entries. Each event loop gets its own pool because
+    # redis.asyncio connections are bound to the loop that opened them.
+
+    def __init__(self, alias: str = "default", max_connections: int = ASYNC_CACHE_MAX_CONNECTIONS):
+        self.alias = alias
+        self.max_connections = max_connections
+        self._clients: Dict[asyncio.AbstractEventLoop, Redis] = {}
+
+    @property
+    def available(self) -> bool:
+        config = settings.CACHES.get(self.alias, {})
+        return config.get("BACKEND", "").startswith("django_redis") and bool(
+            self._url()
+        )
+
+    def _url(self) -> Optional[str]:
+        location = settings.CACHES.get(self.alias, {}).get("LOCATION")
+        if isinstance(location, (list, tuple)):
+            location = location[0] if location else None
+        if isinstance(location, str):
+            location = location.split(",")[0].strip()
+        return location or None
+
+    def client(self) -> Redis:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # Blocking: past max_connections callers wait for a free
+            # connection instead of failing with "Too many connections".
+            pool = BlockingConnectionPool.from_url(
+                self._url(), max_connections=self.max_connections
+            )
+            client = Redis(connection_pool=pool)
+            self._clients = {
+                owner: c for owner, c in self._clients.items() if not owner.is_closed()
+            }
+            self._clients[loop] = client
+        return client
+
+    def _codec(self):
+        return cache.client
+
+    def make_key(self, key: str):
+        return self._codec().make_key(key)
+
+    def _timeout_ms(self, timeout) -> Tuple[bool, Optional[int]]:
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = cache.default_timeout
+        if timeout is None:
+            return True, None
+        ms = int(timeout * 1000)
+        return ms > 0, ms
+
+    async def get(self, key: str, default: Any = None) -> Any:
+        value = await self.client().get(self.make_key(key))
+        return default if value is None else self._codec().decode(value)
+
+    async def set(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT) -> bool:
+        alive, ms = self._timeout_ms(timeout)
+        if not alive:
+            return bool(await self.delete(key))
+        codec = self._codec()
+        return bool(
+            await self.client().set(codec.make_key(key), codec.encode(value), px=ms)
+        )
+
+    async def add(self, key: str, value: Any, timeout=DEFAULT_TIMEOUT) -> bool:
+        alive, ms = self._timeout_ms(timeout)
+        if not alive:
+            return not await self.client().exists(self.make_key(key))
+        codec = self._codec()
+        return bool(
+            await self.client().set(
+                codec.make_key(key), codec.encode(value), px=ms, nx=True
+            )
+        )
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        if not keys:
+            return {}
+        codec = self._codec()
+        values = await self.client().mget([codec.make_key(k) for k in keys])
+        return {
+            key: codec.decode(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
+
+    async def _set_pipelined(self, mapping: Dict[str, Any], timeout, nx: bool):
+        alive, ms = self._timeout_ms(timeout)
+        codec = self._codec()
+        async with self.client().pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                if alive:
+                    pipe.set(codec.make_key(key), codec.encode(value), px=ms, nx=nx)
+                elif nx:
+                    pipe.exists(codec.make_key(key))
+                else:
+                    pipe.delete(codec.make_key(key))
+            results = await pipe.execute()
+        if not alive and nx:
+            return {key: not exists for key, exists in zip(mapping, results)}
+        return {key: bool(result) for key, result in zip(mapping, results)}
+
+    async def set_many(self, mapping: Dict[str, Any], timeout=DEFAULT_TIMEOUT):
+        if mapping:
+            await self._set_pipelined(mapping, timeout, nx=False)
+
+    async def add_many(self, mapping: Dict[str, Any], timeout=DEFAULT_TIMEOUT) -> Dict[str, bool]:
+        if not mapping:
+            return {}
+        return await self._set_pipelined(mapping, timeout, nx=True)
+
+    async def delete(self, key: str) -> int:
+        return await self.client().delete(self.make_key(key))
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self.client().publish(channel, message)
+
+    async def close(self):
+        clients, self._clients = self._clients, {}
+        loop = asyncio.get_running_loop()
+        for owner, client in clients.items():
+            if owner is loop:
+                await client.aclose()
+
+
+async_cache = AsyncRedisCache()
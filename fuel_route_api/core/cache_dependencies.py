@@ -1,47 +1,200 @@
 import json
+import time
 from hashlib import md5
 
 from asgiref.sync import sync_to_async
-from django.core.cache import cache
+
+from fuel_route_api.core.async_redis_cache import async_cache
+from fuel_route_api.core.cache_keys import cache_keys
+from fuel_route_api.core.cache_metrics import cache_metrics
+from fuel_route_api.core.codecs import encoded_sizes
+from fuel_route_api.core.local_cache import MISSING, two_tier_cache
+from fuel_route_api.core.price_version import get_price_version
+from fuel_route_api.core.quantize import snapper
 
 
 class AsyncCacheDependencies:
+    # Talks to Redis through redis.asyncio when the cache is django-redis;
+    # other backends (locmem in tests) fall back to sync_to_async. Every
+    # call is recorded in cache_metrics under the key's namespace.
+
     async def get_from_cache(self, key):
-        return await sync_to_async(cache.get, thread_sensitive=False)(key)
+        started = time.perf_counter()
+        # Local hits are answered without a thread hop or network round trip.
+        value = two_tier_cache.get_local(key)
+        local = value is not MISSING
+        if not local and async_cache.available:
+            value = await two_tier_cache.aget_remote(key)
+        elif not local:
+            value = await sync_to_async(two_tier_cache.get_remote, thread_sensitive=False)(key)
+        cache_metrics.record_get(key, value, time.perf_counter() - started, local)
+        return value
 
     async def add_from_cache(self, key, value, timeout=600):
-        return await sync_to_async(
-            cache.add,
-            thread_sensitive=False
-        )(key, value, timeout)
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            if async_cache.available:
+                added = await two_tier_cache.aadd(key, value, timeout)
+            else:
+                added = await sync_to_async(
+                    two_tier_cache.add,
+                    thread_sensitive=False
+                )(key, value, timeout)
+        cache_metrics.record_write(key, time.perf_counter() - started, added, _size(sizes))
+        return added
 
     async def set_from_cache(self, key, value, timeout=60 * 10):
-        return await sync_to_async(cache.set, thread_sensitive=False)(key, value, timeout)
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            if async_cache.available:
+                await two_tier_cache.aset(key, value, timeout)
+            else:
+                await sync_to_async(two_tier_cache.set, thread_sensitive=False)(
+                    key, value, timeout
+                )
+        cache_metrics.record_write(key, time.perf_counter() - started, size=_size(sizes))
 
     async def delete_from_cache(self, key):
-        return await sync_to_async(cache.delete, thread_sensitive=False)(key)
+        started = time.perf_counter()
+        if async_cache.available:
+            await two_tier_cache.adelete(key)
+        else:
+            await sync_to_async(two_tier_cache.delete, thread_sensitive=False)(key)
+        cache_metrics.record_delete(key, time.perf_counter() - started)
+
+    async def get_many(self, keys):
+        keys = list(keys)
+        started = time.perf_counter()
+        local, missing = two_tier_cache.get_local_many(keys)
+        # One MGET for every key the local tier cannot answer.
+        if not missing:
+            found = {}
+        elif async_cache.available:
+            found = await two_tier_cache.aget_many(missing)
+        else:
+            found = await sync_to_async(two_tier_cache.get_many, thread_sensitive=False)(
+                missing
+            )
+        found.update(local)
+        cache_metrics.record_get_many(keys, found, time.perf_counter() - started, local)
+        return found
+
+    async def set_many(self, mapping, timeout=60 * 10):
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            if async_cache.available:
+                await two_tier_cache.aset_many(mapping, timeout)
+            else:
+                await sync_to_async(two_tier_cache.set_many, thread_sensitive=False)(
+                    mapping, timeout
+                )
+        _record_many(mapping, dict.fromkeys(mapping, True), started, sizes)
+
+    async def add_many(self, mapping, timeout=600):
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            if async_cache.available:
+                added = await two_tier_cache.aadd_many(mapping, timeout)
+            else:
+                added = await sync_to_async(two_tier_cache.add_many, thread_sensitive=False)(
+                    mapping, timeout
+                )
+        _record_many(mapping, added, started, sizes)
+        return added
 
 
 class SyncCacheDependencies:
     def get_from_cache(self, key):
-        return cache.get(key)
+        started = time.perf_counter()
+        value = two_tier_cache.get_local(key)
+        local = value is not MISSING
+        if not local:
+            value = two_tier_cache.get_remote(key)
+        cache_metrics.record_get(key, value, time.perf_counter() - started, local)
+        return value
 
     def add_to_cache(self, key, value, timeout=600):
-        return cache.add(key, value, timeout=timeout)
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            added = two_tier_cache.add(key, value, timeout=timeout)
+        cache_metrics.record_write(key, time.perf_counter() - started, added, _size(sizes))
+        return added
 
     def set_from_cache(self, key, value, timeout=60 * 10):
-        return cache.set(key, value, timeout=timeout)
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            two_tier_cache.set(key, value, timeout=timeout)
+        cache_metrics.record_write(key, time.perf_counter() - started, size=_size(sizes))
 
     def delete_from_cache(self, key):
-        return cache.delete(key)
+        started = time.perf_counter()
+        two_tier_cache.delete(key)
+        cache_metrics.record_delete(key, time.perf_counter() - started)
+
+    def get_many(self, keys):
+        keys = list(keys)
+        started = time.perf_counter()
+        local, missing = two_tier_cache.get_local_many(keys)
+        found = two_tier_cache.get_many(missing) if missing else {}
+        found.update(local)
+        cache_metrics.record_get_many(keys, found, time.perf_counter() - started, local)
+        return found
+
+    def set_many(self, mapping, timeout=60 * 10):
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            two_tier_cache.set_many(mapping, timeout=timeout)
+        _record_many(mapping, dict.fromkeys(mapping, True), started, sizes)
+
+    def add_many(self, mapping, timeout=600):
+        started = time.perf_counter()
+        with encoded_sizes() as sizes:
+            added = two_tier_cache.add_many(mapping, timeout=timeout)
+        _record_many(mapping, added, started, sizes)
+        return added
+
+
+def _size(sizes):
+    # Encoded length of a single-value write; ints are stored raw by
+    # django-redis and other backends do not report sizes at all.
+    return sizes[0] if sizes else None
+
+
+def _record_many(mapping, added, started, sizes):
+    seconds = (time.perf_counter() - started) / max(1, len(mapping))
+    # Sizes arrive in encode order, one per value that went through the
+    # serializer (django-redis writes plain ints raw).
+    serialized = [
+        key for key, value in mapping.items()
+        if isinstance(value, bool) or not isinstance(value, int)
+    ]
+    by_key = dict(zip(serialized, sizes)) if len(serialized) == len(sizes) else {}
+    for key in mapping:
+        cache_metrics.record_write(key, seconds, added.get(key, False), by_key.get(key))
 
 
 class CacheKeyDependencies:
-    async def generate_cache_key(self, data: dict) -> str:
-        return md5(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
-
-    def sync_generate_cache_key(self, data: dict) -> str:
-        return md5(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+    async def generate_cache_key(
+        self, data, namespace: str = "default", price_versioned: bool = False
+    ) -> str:
+        price_version = (
+            await sync_to_async(get_price_version, thread_sensitive=False)()
+            if price_versioned
+            else None
+        )
+        return self._build_key(data, namespace, price_version)
+
+    def sync_generate_cache_key(
+        self, data, namespace: str = "default", price_versioned: bool = False
+    ) -> str:
+        price_version = get_price_version() if price_versioned else None
+        return self._build_key(data, namespace, price_version)
+
+    def _build_key(self, data, namespace: str, price_version) -> str:
+        # Route endpoints are snapped so nearby requests share an entry.
+        if isinstance(data, dict):
+            data, _ = snapper.snap_endpoints(data)
+        return cache_keys.build(namespace, data, price_version)
 
     async def validate_usa_coordinates(self, latitude: float, longitude: float) -> bool:
         usa_bounds = {
@@ -0,0 +1,123 @@
+import struct
+from hashlib import blake2b
+from numbers import Integral, Real
+from typing import Any, Optional
+
+import numpy as np
+
+from fuel_route_api.core.env import CACHE_KEY_SCHEMA_VERSION
+
+POINT_FIELDS = (("latitude", "longitude"), ("lat", "lon"))
+
+_pack_int = struct.Struct("<q").pack
+_pack_float = struct.Struct("<d").pack
+_pack_len = struct.Struct("<I").pack
+
+
+class CacheKeyBuilder:
+    # Keys are "<namespace>:v<schema>[:p<price version>]:<digest>". The digest
+    # is blake2b over a type-tagged binary encoding of the payload: dicts in
+    # key order, and point lists (dicts with latitude/longitude or lat/lon, or
+    # numeric pairs) packed as one float64 array instead of walked per point.
+    # Bumping the schema version moves every key without flushing Redis.
+
+    def __init__(self, schema_version: int = CACHE_KEY_SCHEMA_VERSION, digest_size: int = 16):
+        self.schema_version = schema_version
+        self.digest_size = digest_size
+
+    def build(self, namespace: str, payload: Any, price_version: Optional[int] = None) -> str:
+        digest = blake2b(digest_size=self.digest_size)
+        self._feed(digest, payload)
+        prefix = f"{namespace}:v{self.schema_version}"
+        if price_version is not None:
+            prefix += f":p{price_version}"
+        return f"{prefix}:{digest.hexdigest()}"
+
+    def _feed(self, digest, value):
+        if value is None:
+            digest.update(b"N")
+        elif isinstance(value, bool):
+            digest.update(b"T" if value else b"F")
+        elif isinstance(value, Integral):
+            value = int(value)
+            if -(2**63) <= value < 2**63:
+                digest.update(b"i" + _pack_int(value))
+            else:
+                self._feed_text(digest, b"I", str(value))
+        elif isinstance(value, Real):
+            # + 0.0 folds -0.0 into 0.0.
+            digest.update(b"f" + _pack_float(float(value) + 0.0))
+        elif isinstance(value, str):
+            self._feed_text(digest, b"s", value)
+        elif isinstance(value, bytes):
+            digest.update(b"b" + _pack_len(len(value)) + value)
+        elif isinstance(value, dict):
+            digest.update(b"d" + _pack_len(len(value)))
+            for key in sorted(value, key=str):
+                self._feed_text(digest, b"s", str(key))
+                self._feed(digest, value[key])
+        elif isinstance(value, np.ndarray):
+            self._feed_array(digest, value)
+        elif isinstance(value, (list, tuple)):
+            points = _as_points(value)
+            if points is not None:
+                digest.update(b"P")
+                self._feed_array(digest, points)
+                return
+            digest.update(b"l" + _pack_len(len(value)))
+            for item in value:
+                self._feed(digest, item)
+        elif hasattr(value, "dict"):
+            self._feed(digest, value.dict())
+        else:
+            raise TypeError(f"Cannot build a cache key from {type(value).__name__}")
+
+    def _feed_text(self, digest, tag: bytes, text: str):
+        data = text.encode("utf-8")
+        digest.update(tag + _pack_len(len(data)) + data)
+
+    def _feed_array(self, digest, array: np.ndarray):
+        if array.dtype.kind == "f":
+            array = array.astype("<f8") + 0.0
+        array = np.ascontiguousarray(array)
+        header = f"{array.dtype.str}{array.shape}".encode("ascii")
+        digest.update(b"a" + _pack_len(len(header)) + header)
+        digest.update(array.tobytes())
+
+
+def _as_points(values) -> Optional[np.ndarray]:
+    # (n, 2) float64 array when every item is a point, otherwise None.
+    # Coordinates are read as numbers, so "40.1" and 40.1 hash alike.
+    if not values:
+        return None
+    first = values[0]
+    count = len(values)
+    if isinstance(first, dict):
+        for lat_field, lon_field in POINT_FIELDS:
+            if lat_field in first and lon_field in first:
+                break
+        else:
+            return None
+        try:
+            if any(len(p) != 2 for p in values):
+                return None
+            points = np.empty((count, 2), dtype=np.float64)
+            points[:, 0] = np.fromiter((p[lat_field] for p in values), np.float64, count)
+            points[:, 1] = np.fromiter((p[lon_field] for p in values), np.float64, count)
+        except (KeyError, TypeError, ValueError):
+            return None
+        return points
+    if isinstance(first, (list, tuple)) and len(first) == 2:
+        if not all(isinstance(c, Real) and not isinstance(c, bool) for c in first):
+            return None
+        try:
+            points = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        if points.shape != (count, 2):
+            return None
+        return points
+    return None
+
+
+cache_keys = CacheKeyBuilder()
@@ -0,0 +1,259 @@
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+
+from fuel_route_api.core.env import CACHE_METRICS_FLUSH_SECONDS
+from fuel_route_api.core.latency import LatencyHistogram
+from fuel_route_api.core.log import logger
+
+# Cache calls are far faster than provider calls: 50 us .. ~13 s.
+CACHE_LATENCY_BUCKETS: List[float] = [0.00005 * 1.25**i for i in range(56)]
+# Serialized payload sizes: 64 B .. 128 MB.
+SIZE_BUCKETS: List[float] = [float(2**i) for i in range(6, 28)]
+
+REPORT_PREFIX = "cache_metrics:proc"
+COUNTERS = ("hits", "local_hits", "misses", "writes", "add_conflicts", "deletes")
+OPERATIONS = ("get", "write", "delete")
+
+
+class SizeHistogram(LatencyHistogram):
+    def __init__(self):
+        super().__init__(SIZE_BUCKETS)
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.count,
+            "mean_bytes": round(self.total / self.count) if self.count else None,
+            "p50_bytes": self.percentile(50),
+            "p95_bytes": self.percentile(95),
+            "p99_bytes": self.percentile(99),
+        }
+
+
+def key_namespace(key: str) -> str:
+    # route:v1:<digest>              -> route
+    # route:trip:v1:<digest>:summary -> route_summary
+    # trip:v1:<digest>:task          -> task_lock
+    # <any key>:refresh              -> refresh_lock
+    # route:flight:<key>             -> flight_lock
+    parts = str(key).split(":")
+    if len(parts) == 1:
+        return parts[0]
+    if parts[1] == "flight":
+        return "flight_lock"
+    if parts[-1] in ("summary", "geometry"):
+        return f"{parts[0]}_{parts[-1]}"
+    if parts[-1] == "task":
+        return "task_lock"
+    if parts[-1] == "refresh":
+        return "refresh_lock"
+    return parts[0]
+
+
+class NamespaceMetrics:
+    def __init__(self):
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.latency = {
+            op: LatencyHistogram(CACHE_LATENCY_BUCKETS) for op in OPERATIONS
+        }
+        self.sizes = SizeHistogram()
+
+
+class CacheMetrics:
+    # Per-process counters, latency and payload sizes per key namespace.
+    # Sizes are the encoded lengths CacheSerializer reports (see
+    # codecs.encoded_sizes), so nothing is serialized twice. A daemon thread
+    # writes the raw histograms to the cache every flush interval so
+    # collect() can merge all web and worker processes.
+
+    def __init__(self, flush_interval: float = CACHE_METRICS_FLUSH_SECONDS):
+        self.flush_interval = flush_interval
+        self.namespaces: Dict[str, NamespaceMetrics] = defaultdict(NamespaceMetrics)
+        self._flusher_pid = None
+        self._lock = threading.Lock()
+
+    def record_get(self, key: str, value: Any, seconds: float, local: bool = False):
+        metrics = self._metrics(key)
+        if value is None:
+            metrics.counts["misses"] += 1
+        else:
+            metrics.counts["hits"] += 1
+            if local:
+                metrics.counts["local_hits"] += 1
+        metrics.latency["get"].record(seconds)
+
+    def record_get_many(
+        self, keys: Iterable[str], found: Dict, seconds: float, local: Iterable[str] = ()
+    ):
+        keys = list(keys)
+        local = set(local)
+        for key in keys:
+            metrics = self._metrics(key)
+            if found.get(key) is None:
+                metrics.counts["misses"] += 1
+            else:
+                metrics.counts["hits"] += 1
+                if key in local:
+                    metrics.counts["local_hits"] += 1
+            # The round trip is shared, so each key is charged its share.
+            metrics.latency["get"].record(seconds / max(1, len(keys)))
+
+    def record_write(
+        self, key: str, seconds: float, added: bool = True, size: Optional[int] = None
+    ):
+        metrics = self._metrics(key)
+        metrics.counts["writes" if added else "add_conflicts"] += 1
+        metrics.latency["write"].record(seconds)
+        if added and size is not None:
+            metrics.sizes.record(size)
+
+    def record_delete(self, key: str, seconds: float):
+        metrics = self._metrics(key)
+        metrics.counts["deletes"] += 1
+        metrics.latency["delete"].record(seconds)
+
+    def _metrics(self, key: str) -> NamespaceMetrics:
+        self._ensure_flusher()
+        return self.namespaces[key_namespace(key)]
+
+    def export(self) -> Dict:
+        # Raw, mergeable form: counters and bucket counts.
+        return {
+            namespace: {
+                "counts": dict(m.counts),
+                "latency": {
+                    op: {"counts": list(h.counts), "total": h.total}
+                    for op, h in m.latency.items()
+                },
+                "sizes": {"counts": list(m.sizes.counts), "total": m.sizes.total},
+            }
+            for namespace, m in list(self.namespaces.items())
+        }
+
+    def snapshot(self) -> Dict:
+        return summarize(self.export())
+
+    @staticmethod
+    def report_key() -> str:
+        return f"{REPORT_PREFIX}:{socket.gethostname()}:{os.getpid()}"
+
+    def flush(self):
+        try:
+            cache.set(
+                self.report_key(),
+                self.export(),
+                timeout=max(60, int(self.flush_interval * 3)),
+            )
+        except Exception as e:
+            logger.warning(f"Cache metrics flush failed: {e}")
+
+    def _ensure_flusher(self):
+        if self._flusher_pid == os.getpid() or not self.flush_interval:
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            # A forked child starts from zero rather than re-reporting the
+            # parent's numbers under its own pid.
+            self.namespaces.clear()
+            threading.Thread(target=self._flush_forever, daemon=True).start()
+
+    def _flush_forever(self):
+        pid = os.getpid()
+        while self._flusher_pid == pid:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+
+def merge(reports: Iterable[Dict]) -> Dict:
+    merged: Dict[str, Dict] = {}
+    for report in reports:
+        for namespace, data in report.items():
+            into = merged.setdefault(
+                namespace,
+                {
+                    "counts": dict.fromkeys(COUNTERS, 0),
+                    "latency": {
+                        op: {"counts": [0] * (len(CACHE_LATENCY_BUCKETS) + 1), "total": 0.0}
+                        for op in OPERATIONS
+                    },
+                    "sizes": {"counts": [0] * (len(SIZE_BUCKETS) + 1), "total": 0.0},
+                },
+            )
+            for name, value in data["counts"].items():
+                into["counts"][name] = into["counts"].get(name, 0) + value
+            for op, histogram in data["latency"].items():
+                _add_histogram(into["latency"][op], histogram)
+            _add_histogram(into["sizes"], data["sizes"])
+    return merged
+
+
+def _add_histogram(into: Dict, histogram: Dict):
+    into["counts"] = [a + b for a, b in zip(into["counts"], histogram["counts"])]
+    into["total"] += histogram["total"]
+
+
+def _load(histogram: LatencyHistogram, data: Dict) -> LatencyHistogram:
+    histogram.counts = list(data["counts"])
+    histogram.count = sum(histogram.counts)
+    histogram.total = data["total"]
+    return histogram
+
+
+def summarize(raw: Dict) -> Dict:
+    summary = {}
+    for namespace, data in sorted(raw.items()):
+        counts = data["counts"]
+        lookups = counts["hits"] + counts["misses"]
+        summary[namespace] = {
+            **counts,
+            "lookups": lookups,
+            "hit_rate": round(counts["hits"] / lookups, 4) if lookups else 0.0,
+            "latency": {
+                op: _latency_snapshot(_load(LatencyHistogram(CACHE_LATENCY_BUCKETS), histogram))
+                for op, histogram in data["latency"].items()
+            },
+            "payload_size": _load(SizeHistogram(), data["sizes"]).snapshot(),
+        }
+    return summary
+
+
+def _latency_snapshot(histogram: LatencyHistogram) -> Dict:
+    # Cache calls are sub-millisecond, so keep three decimals.
+    return {
+        "count": histogram.count,
+        "mean_ms": round(histogram.total / histogram.count * 1000, 3)
+        if histogram.count
+        else None,
+        "p50_ms": _round_ms(histogram.percentile(50)),
+        "p95_ms": _round_ms(histogram.percentile(95)),
+        "p99_ms": _round_ms(histogram.percentile(99)),
+    }
+
+
+def _round_ms(seconds):
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+def collect() -> Dict:
+    # Every process that reported within the last few flush intervals, with
+    # this process's live numbers in place of its last report.
+    reports = []
+    if hasattr(cache, "iter_keys"):
+        own = CacheMetrics.report_key()
+        keys = [k for k in cache.iter_keys(f"{REPORT_PREFIX}:*") if k != own]
+        reports = [r for r in cache.get_many(keys).values() if r]
+    reports.append(cache_metrics.export())
+    return {
+        "processes": len(reports),
+        "namespaces": summarize(merge(reports)),
+    }
+
+
+cache_metrics = CacheMetrics()
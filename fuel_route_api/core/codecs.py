@@ -0,0 +1,171 @@
+import pickle
+import threading
+import zlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import msgpack
+import orjson
+from django_redis.serializers.base import BaseSerializer
+
+from fuel_route_api.core.env import (
+    CACHE_CODEC_COMPRESSOR,
+    CACHE_CODEC_SERIALIZER,
+    CACHE_CODEC_THRESHOLD_BYTES,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+# Encoded payloads are MAGIC, one tag byte (serializer id in the high nibble,
+# compressor id in the low one), then the body. Anything else is a legacy
+# entry: gzip JSON from compress_data or a django-redis pickle.
+MAGIC = b"\xfc"
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class Codec(NamedTuple):
+    tag: int
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+SERIALIZERS: Dict[str, Codec] = {}
+COMPRESSORS: Dict[str, Codec] = {}
+_serializer_tags: Dict[int, Codec] = {}
+_compressor_tags: Dict[int, Codec] = {}
+
+
+def register_serializer(codec: Codec):
+    SERIALIZERS[codec.name] = _serializer_tags[codec.tag] = codec
+
+
+def register_compressor(codec: Codec):
+    COMPRESSORS[codec.name] = _compressor_tags[codec.tag] = codec
+
+
+register_serializer(
+    Codec(0, "pickle", lambda v: pickle.dumps(v, pickle.HIGHEST_PROTOCOL), pickle.loads)
+)
+# strict_types makes tuples, dict subclasses and numpy scalars fall back to
+# pickle instead of coming back as a different type.
+register_serializer(
+    Codec(
+        1,
+        "msgpack",
+        lambda v: msgpack.packb(v, use_bin_type=True, strict_types=True),
+        lambda b: msgpack.unpackb(b, raw=False, strict_map_key=False),
+    )
+)
+register_serializer(Codec(2, "json", orjson.dumps, orjson.loads))
+register_serializer(Codec(3, "raw", bytes, bytes))
+
+register_compressor(Codec(0, "none", bytes, bytes))
+register_compressor(Codec(1, "zlib", lambda b: zlib.compress(b, 1), zlib.decompress))
+if zstandard is not None:
+    # A ZstdCompressor must not be used from two threads at once, and encodes
+    # run on pool, Celery and listener threads: keep one per thread.
+    _zstd = threading.local()
+
+    def _zstd_compress(data: bytes) -> bytes:
+        compressor = getattr(_zstd, "compressor", None)
+        if compressor is None:
+            compressor = _zstd.compressor = zstandard.ZstdCompressor(level=3)
+        return compressor.compress(data)
+
+    register_compressor(
+        Codec(
+            2,
+            "zstd",
+            _zstd_compress,
+            lambda b: zstandard.ZstdDecompressor().decompress(b),
+        )
+    )
+if lz4_frame is not None:
+    register_compressor(Codec(3, "lz4", lz4_frame.compress, lz4_frame.decompress))
+
+DEFAULT_COMPRESSOR = (
+    CACHE_CODEC_COMPRESSOR if CACHE_CODEC_COMPRESSOR in COMPRESSORS else "zlib"
+)
+
+
+def encode(
+    value: Any,
+    serializer: str = CACHE_CODEC_SERIALIZER,
+    compressor: str = DEFAULT_COMPRESSOR,
+    threshold: int = CACHE_CODEC_THRESHOLD_BYTES,
+) -> bytes:
+    if isinstance(value, bytes):
+        ser = SERIALIZERS["raw"]
+        body = value
+        # Already encoded or gzipped; compressing again only costs time.
+        if value[:1] == MAGIC or value[:2] == GZIP_MAGIC:
+            threshold = len(value) + 1
+    else:
+        ser = SERIALIZERS[serializer]
+        try:
+            body = ser.dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            ser = SERIALIZERS["pickle"]
+            body = ser.dumps(value)
+
+    comp = COMPRESSORS["none"]
+    if len(body) >= threshold:
+        compressed = COMPRESSORS[compressor].dumps(body)
+        if len(compressed) < len(body):
+            comp, body = COMPRESSORS[compressor], compressed
+    return MAGIC + bytes([ser.tag << 4 | comp.tag]) + body
+
+
+def decode(data: bytes) -> Any:
+    if data[:1] != MAGIC:
+        raise ValueError("Not an encoded cache payload")
+    ser = _serializer_tags.get(data[1] >> 4)
+    comp = _compressor_tags.get(data[1] & 0x0F)
+    if ser is None or comp is None:
+        raise ValueError(f"Cache payload codec {data[1]:#04x} is not available")
+    return ser.loads(comp.loads(data[2:]))
+
+
+_encoded_sizes: ContextVar[Optional[List[int]]] = ContextVar(
+    "cache_encoded_sizes", default=None
+)
+
+
+@contextmanager
+def encoded_sizes():
+    # Collects the length of every payload CacheSerializer encodes inside the
+    # block, in order, so metrics can size writes without encoding twice.
+    # Context-local: concurrent tasks and sync_to_async threads do not mix.
+    sizes: List[int] = []
+    token = _encoded_sizes.set(sizes)
+    try:
+        yield sizes
+    finally:
+        _encoded_sizes.reset(token)
+
+
+class CacheSerializer(BaseSerializer):
+    # django-redis SERIALIZER: registry codecs for new writes, while values
+    # pickled by the default serializer keep loading until they expire.
+
+    def dumps(self, value: Any) -> bytes:
+        data = encode(value)
+        sizes = _encoded_sizes.get()
+        if sizes is not None:
+            sizes.append(len(data))
+        return data
+
+    def loads(self, value: bytes) -> Any:
+        if value[:1] == MAGIC:
+            return decode(value)
+        return pickle.loads(value)
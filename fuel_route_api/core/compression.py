@@ -1,10 +1,15 @@
 import gzip
 import json
 
+from fuel_route_api.core.codecs import GZIP_MAGIC, decode, encode
+
 
 def compress_data(data: dict) -> bytes:
-    return gzip.compress(json.dumps(data).encode("utf-8"))
+    return encode(data)
 
 
 def decompress_data(data: bytes) -> dict:
-    return json.loads(gzip.decompress(data).decode("utf-8"))
\ No newline at end of file
+    if data[:2] == GZIP_MAGIC:
+        # Written before the codec registry.
+        return json.loads(gzip.decompress(data).decode("utf-8"))
+    return decode(data)
@@ -34,4 +34,42 @@ CORS_ALLOWED_HOSTS_RAW:str = os.getenv("CORS_ALLOWED_HOSTS", "")
 CSRF_TRUSTED_HOSTS_RAW:str=os.getenv("CSRF_TRUSTED_HOSTS", "")
 ALLOWED_ORIGINS = parser.parsers_list(ALLOWED_ORIGIN_RAW)
 CORS_ALLOWED_HOSTS = parser.parsers_list(CORS_ALLOWED_HOSTS_RAW)
-CSRF_TRUSTED_HOSTS = parser.parsers_list(CSRF_TRUSTED_HOSTS_RAW)
\ No newline at end of file
+CSRF_TRUSTED_HOSTS = parser.parsers_list(CSRF_TRUSTED_HOSTS_RAW)
+ROUTE_SIMPLIFY_TOLERANCE_MILES = float(
+    os.getenv("ROUTE_SIMPLIFY_TOLERANCE_MILES", "0.05")
+)
+GAZETTEER_PATH = os.getenv("GAZETTEER_PATH", "fuel_route_api/data/us_places.gaz")
+HTTP_POOL_LIMIT_PER_HOST = int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "32"))
+HTTP_POOL_TIMEOUT_SECONDS = float(os.getenv("HTTP_POOL_TIMEOUT_SECONDS", "30"))
+ROUTING_PROVIDERS = [
+    p.strip()
+    for p in os.getenv("ROUTING_PROVIDERS", "geoapify,tomtom,mapbox").split(",")
+    if p.strip()
+]
+HEDGE_DEFAULT_DELAY_SECONDS = float(os.getenv("HEDGE_DEFAULT_DELAY_SECONDS", "1.0"))
+ROUTE_KEY_SNAP = os.getenv("ROUTE_KEY_SNAP", "grid")
+ROUTE_KEY_PRECISION = int(os.getenv("ROUTE_KEY_PRECISION", "3"))
+ROUTE_KEY_GEOHASH_LENGTH = int(os.getenv("ROUTE_KEY_GEOHASH_LENGTH", "7"))
+ROUTE_POLYLINE_PRECISION = int(os.getenv("ROUTE_POLYLINE_PRECISION", "5"))
+ROAD_GRAPH_PATH = os.getenv("ROAD_GRAPH_PATH", "")
+LOCAL_CACHE_ENABLED = os.getenv("LOCAL_CACHE_ENABLED", "true").lower() == "true"
+LOCAL_CACHE_MAX_BYTES = int(os.getenv("LOCAL_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+LOCAL_CACHE_TTL_SECONDS = float(os.getenv("LOCAL_CACHE_TTL_SECONDS", "30"))
+ASYNC_CACHE_MAX_CONNECTIONS = int(os.getenv("ASYNC_CACHE_MAX_CONNECTIONS", "50"))
+SWR_MAX_STALE_SECONDS = int(os.getenv("SWR_MAX_STALE_SECONDS", "3600"))
+SWR_REFRESH_LOCK_SECONDS = int(os.getenv("SWR_REFRESH_LOCK_SECONDS", "120"))
+CACHE_KEY_SCHEMA_VERSION = int(os.getenv("CACHE_KEY_SCHEMA_VERSION", "1"))
+CACHE_CODEC_SERIALIZER = os.getenv("CACHE_CODEC_SERIALIZER", "msgpack")
+CACHE_CODEC_COMPRESSOR = os.getenv("CACHE_CODEC_COMPRESSOR", "zstd")
+CACHE_CODEC_THRESHOLD_BYTES = int(os.getenv("CACHE_CODEC_THRESHOLD_BYTES", "1024"))
+CACHE_METRICS_FLUSH_SECONDS = float(os.getenv("CACHE_METRICS_FLUSH_SECONDS", "10"))
+LANE_WINDOW_DAYS = int(os.getenv("LANE_WINDOW_DAYS", "7"))
+WARM_TOP_K = int(os.getenv("WARM_TOP_K", "300"))
+WARM_INTERVAL_SECONDS = int(os.getenv("WARM_INTERVAL_SECONDS", "900"))
+WARM_BEFORE_EXPIRY_SECONDS = int(os.getenv("WARM_BEFORE_EXPIRY_SECONDS", "1200"))
+WARM_RATE_LIMIT = os.getenv("WARM_RATE_LIMIT", "20/m")
+WARM_DAILY_QUOTA = int(os.getenv("WARM_DAILY_QUOTA", "2000"))
+STATION_SNAPSHOT_TTL_SECONDS = int(os.getenv("STATION_SNAPSHOT_TTL_SECONDS", str(7 * 24 * 3600)))
+STATION_SNAPSHOT_CHECK_SECONDS = float(os.getenv("STATION_SNAPSHOT_CHECK_SECONDS", "30"))
+COUNT_ESTIMATE_TTL_SECONDS = int(os.getenv("COUNT_ESTIMATE_TTL_SECONDS", "300"))
+KEYSET_MAX_LIMIT = int(os.getenv("KEYSET_MAX_LIMIT", "100"))
@@ -0,0 +1,108 @@
+import os
+import re
+import struct
+from hashlib import blake2b
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from fuel_route_api.core.env import GAZETTEER_PATH
+from fuel_route_api.core.log import logger
+
+# File layout: header, then `count` sorted uint64 place keys, then `count`
+# float32 (lat, lon) pairs in the same order.
+MAGIC = b"GAZ1"
+HEADER = struct.Struct("<4sI")
+
+
+def _normalize(value: str) -> str:
+    value = re.sub(r"[.'\"]", "", value or "").lower()
+    return " ".join(value.split())
+
+
+def place_key(city: str, state: str) -> int:
+    digest = blake2b(
+        f"{_normalize(city)}|{_normalize(state)}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Gazetteer:
+    def __init__(self, path: str = GAZETTEER_PATH):
+        self.path = path
+        self.keys = None
+        self.coords = None
+
+    def _load(self):
+        if self.keys is not None:
+            return
+        if not os.path.exists(self.path):
+            logger.warning(f"Gazetteer file not found at {self.path}; fallback disabled")
+            self.keys = np.empty(0, dtype="<u8")
+            self.coords = np.empty((0, 2), dtype="<f4")
+            return
+
+        with open(self.path, "rb") as f:
+            magic, count = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a gazetteer file")
+
+        self.keys = np.memmap(
+            self.path, dtype="<u8", mode="r", offset=HEADER.size, shape=(count,)
+        )
+        self.coords = np.memmap(
+            self.path,
+            dtype="<f4",
+            mode="r",
+            offset=HEADER.size + 8 * count,
+            shape=(count, 2),
+        )
+
+    def __len__(self):
+        self._load()
+        return len(self.keys)
+
+    def lookup(self, city: str, state: str) -> Optional[Tuple[float, float]]:
+        return self.lookup_many([(city, state)])[0]
+
+    def lookup_many(
+        self, places: Iterable[Tuple[str, str]]
+    ) -> List[Optional[Tuple[float, float]]]:
+        self._load()
+        wanted = np.fromiter(
+            (place_key(city, state) for city, state in places), dtype="<u8"
+        )
+        if not len(self.keys):
+            return [None] * len(wanted)
+
+        positions = np.searchsorted(self.keys, wanted).clip(0, len(self.keys) - 1)
+        found = self.keys[positions] == wanted
+        return [
+            (float(self.coords[i, 0]), float(self.coords[i, 1])) if hit else None
+            for i, hit in zip(positions, found)
+        ]
+
+    @staticmethod
+    def write(path: str, places: Iterable[Tuple[str, str, float, float]]) -> int:
+        # Duplicate city/state names are averaged into one centroid.
+        sums = {}
+        for city, state, lat, lon in places:
+            key = place_key(city, state)
+            lat_sum, lon_sum, n = sums.get(key, (0.0, 0.0, 0))
+            sums[key] = (lat_sum + lat, lon_sum + lon, n + 1)
+
+        keys = np.array(sorted(sums), dtype="<u8")
+        coords = np.array(
+            [(sums[k][0] / sums[k][2], sums[k][1] / sums[k][2]) for k in keys.tolist()],
+            dtype="<f4",
+        ).reshape(-1, 2)
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(keys)))
+            f.write(keys.tobytes())
+            f.write(coords.tobytes())
+        return len(keys)
+
+
+gazetteer = Gazetteer()
@@ -0,0 +1,91 @@
+from hashlib import md5
+from typing import Awaitable, Callable, Tuple
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+from fuel_route_api.core.address import normalize_address
+from fuel_route_api.core.cache_dependencies import AsyncCacheDependencies
+from fuel_route_api.core.single_flight import geocode_flight
+from fuel_route_api.models.models import GeocodeCache
+
+GEOCODE_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+STATS_KEY = "geocode_cache:stats:{}"
+STATS_FIELDS = ("redis_hits", "db_hits", "misses")
+
+
+def _record(field: str):
+    key = STATS_KEY.format(field)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+class GeocodeCacheDependencies:
+    def __init__(self):
+        self.cache_deps = AsyncCacheDependencies()
+
+    def cache_key(self, normalized: str) -> str:
+        return f"geocode:{md5(normalized.encode('utf-8')).hexdigest()}"
+
+    async def get_or_geocode(
+        self,
+        address: str,
+        city: str,
+        state: str,
+        provider: str,
+        fetch: Callable[[], Awaitable[Tuple[float, float]]],
+    ) -> Tuple[float, float]:
+        normalized = normalize_address(address, city, state)
+        key = self.cache_key(normalized)
+
+        cached = await self.cache_deps.get_from_cache(key)
+        if cached:
+            await sync_to_async(_record, thread_sensitive=False)("redis_hits")
+            return cached
+
+        return await geocode_flight.do(
+            key,
+            lambda: self._load_or_fetch(normalized, key, provider, fetch),
+            lambda: self.cache_deps.get_from_cache(key),
+        )
+
+    async def _load_or_fetch(
+        self,
+        normalized: str,
+        key: str,
+        provider: str,
+        fetch: Callable[[], Awaitable[Tuple[float, float]]],
+    ) -> Tuple[float, float]:
+        stored = await GeocodeCache.objects.filter(
+            normalized_address=normalized
+        ).afirst()
+        if stored:
+            result = (stored.latitude, stored.longitude)
+            await self.cache_deps.set_from_cache(
+                key, result, timeout=GEOCODE_CACHE_TIMEOUT
+            )
+            await sync_to_async(_record, thread_sensitive=False)("db_hits")
+            return result
+
+        await sync_to_async(_record, thread_sensitive=False)("misses")
+        lat, lon = await fetch()
+        await GeocodeCache.objects.aupdate_or_create(
+            normalized_address=normalized,
+            defaults={"latitude": lat, "longitude": lon, "provider": provider},
+        )
+        await self.cache_deps.set_from_cache(
+            key, (lat, lon), timeout=GEOCODE_CACHE_TIMEOUT
+        )
+        return lat, lon
+
+    def stats(self) -> dict:
+        counts = cache.get_many([STATS_KEY.format(f) for f in STATS_FIELDS])
+        stats = {f: int(counts.get(STATS_KEY.format(f), 0)) for f in STATS_FIELDS}
+        lookups = sum(stats.values())
+        hits = stats["redis_hits"] + stats["db_hits"]
+        stats["lookups"] = lookups
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        return stats
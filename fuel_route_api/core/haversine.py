@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 
 def haversine_distance(lat1, lon1, lat2, lon2):
     R = 3958.8
@@ -17,3 +19,21 @@ def haversine_distance(lat1, lon1, lat2, lon2):
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
     return R * c
+
+
+def haversine_distances(lat, lon, lats, lons):
+    R = 3958.8
+
+    phi1 = np.radians(lat)
+    phi2 = np.radians(lats)
+
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(np.asarray(lons, dtype=np.float64) - lon)
+
+    a = (
+        np.sin(d_phi / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    )
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+    return R * c
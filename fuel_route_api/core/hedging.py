@@ -0,0 +1,81 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fuel_route_api.core.latency import LatencyHistogram, provider_latency
+from fuel_route_api.core.log import logger
+
+Call = Callable[[], Awaitable[Any]]
+
+
+class HedgePolicy:
+    # Hedge after the primary's observed p95, clamped to [min_delay,
+    # max_delay]; until min_samples answers are seen, use default_delay.
+    # Providers record only their upstream fetches, so cache hits do not
+    # drag the p95 down.
+
+    def __init__(
+        self,
+        default_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: float = 5.0,
+        min_samples: int = 20,
+        histograms: Optional[Dict[str, LatencyHistogram]] = None,
+    ):
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.histograms = provider_latency if histograms is None else histograms
+
+    def delay(self, provider: str) -> float:
+        histogram = self.histograms[provider]
+        if histogram.count < self.min_samples:
+            return self.default_delay
+        return min(max(histogram.percentile(95), self.min_delay), self.max_delay)
+
+
+async def hedged(
+    calls: List[Tuple[str, Call]],
+    policy: HedgePolicy,
+    accept: Callable[[Any], Any] = lambda result: result,
+) -> Tuple[str, Any]:
+    # Runs calls in order, starting the next one when the newest in-flight
+    # call outlives its hedge delay or any call fails. The first result that
+    # `accept` turns into a value wins; everything still running is cancelled.
+    # If all fail, the first provider's error is raised.
+    remaining = list(calls)
+    pending: Dict[asyncio.Task, str] = {}
+    errors: Dict[str, BaseException] = {}
+
+    def launch():
+        provider, call = remaining.pop(0)
+        pending[asyncio.ensure_future(call())] = provider
+        return provider
+
+    newest = launch()
+    try:
+        while pending:
+            timeout = policy.delay(newest) if remaining else None
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                newest = launch()
+                logger.info(f"Hedging route request to {newest}")
+                continue
+
+            for task in done:
+                provider = pending.pop(task)
+                try:
+                    return provider, accept(task.result())
+                except Exception as e:
+                    logger.warning(f"Route provider {provider} failed: {e}")
+                    errors[provider] = e
+
+            if remaining:
+                newest = launch()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    raise next(errors[provider] for provider, _ in calls if provider in errors)
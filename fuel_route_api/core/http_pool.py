@@ -0,0 +1,109 @@
+import asyncio
+import ssl
+from contextlib import asynccontextmanager
+from typing import Dict, Iterable, Tuple
+
+import aiohttp
+import certifi
+
+from fuel_route_api.core.env import (
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_POOL_TIMEOUT_SECONDS,
+)
+from fuel_route_api.core.log import logger
+
+ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+PROVIDERS = ("geoapify", "tomtom", "mapbox")
+
+
+class HttpPool:
+    # One keep-alive ClientSession per (event loop, provider). Sessions are
+    # bound to the loop that created them, so a caller on another loop
+    # (Celery async_to_sync, management commands) gets its own set, closed
+    # when that loop shuts down; entries of closed loops are dropped.
+
+    def __init__(
+        self,
+        limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+        total_timeout: float = HTTP_POOL_TIMEOUT_SECONDS,
+        connect_timeout: float = 5.0,
+        ttl_dns_cache: int = 300,
+        keepalive_timeout: float = 30.0,
+    ):
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout
+        )
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.sessions: Dict[Tuple[asyncio.AbstractEventLoop, str], aiohttp.ClientSession] = {}
+        self._watchers: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    def _create(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    def session(self, provider: str) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        session = self.sessions.get((loop, provider))
+        if session is None or session.closed:
+            if loop not in self._watchers:
+                self._prune()
+                self._watchers[loop] = loop.create_task(self._close_at_shutdown())
+            session = self.sessions[(loop, provider)] = self._create()
+        return session
+
+    def _prune(self):
+        # A closed loop can no longer run its sessions' close(); by then its
+        # sockets are gone with it, so only the references are dropped.
+        self.sessions = {
+            key: session for key, session in self.sessions.items() if not key[0].is_closed()
+        }
+        self._watchers = {
+            loop: task for loop, task in self._watchers.items() if not loop.is_closed()
+        }
+
+    async def _close_at_shutdown(self):
+        # asyncio.run() (and so async_to_sync) cancels leftover tasks before
+        # closing the loop, which gives this one the chance to close the
+        # loop's sessions while it still runs.
+        try:
+            await asyncio.get_running_loop().create_future()
+        except asyncio.CancelledError:
+            await self._close_loop(asyncio.get_running_loop())
+            raise
+
+    async def _close_loop(self, loop: asyncio.AbstractEventLoop):
+        for key in [key for key in self.sessions if key[0] is loop]:
+            session = self.sessions.pop(key)
+            if not session.closed:
+                await session.close()
+
+    @asynccontextmanager
+    async def client(self, provider: str):
+        # Drop-in for `async with aiohttp.ClientSession() as session` that
+        # leaves the pooled session open afterwards.
+        yield self.session(provider)
+
+    async def open(self, providers: Iterable[str] = PROVIDERS):
+        for provider in providers:
+            self.session(provider)
+        logger.info(f"HTTP pool opened for {', '.join(providers)}")
+
+    async def close(self):
+        loop = asyncio.get_running_loop()
+        await self._close_loop(loop)
+        watcher = self._watchers.pop(loop, None)
+        if watcher is not None:
+            watcher.cancel()
+        self._prune()
+        logger.info("HTTP pool closed")
+
+
+http_pool = HttpPool()
@@ -0,0 +1,60 @@
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from fuel_route_api.core.log import logger
+
+# Mirrors calculate_route_task's retry policy (retry_backoff=True,
+# max_retries=3): up to three retries with 1s, 2s, 4s exponential backoff.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 1
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 10) -> requests.Session:
+    retry = Retry(
+        total=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        # Hand the last response back so callers keep their status handling.
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def open_session() -> requests.Session:
+    global _session
+    with _lock:
+        if _session is None:
+            _session = create_session()
+            logger.info("HTTP session opened")
+        return _session
+
+
+def get_session() -> requests.Session:
+    # Celery workers open the session in worker_process_init; anything else
+    # (shell, management commands) gets one lazily on first use.
+    return _session or open_session()
+
+
+def close_session():
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+            logger.info("HTTP session closed")
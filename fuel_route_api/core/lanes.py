@@ -0,0 +1,113 @@
+import asyncio
+import json
+import time
+from typing import Dict, List, Tuple
+
+from django.core.cache import cache
+
+from fuel_route_api.core.async_redis_cache import async_cache
+from fuel_route_api.core.env import LANE_WINDOW_DAYS, WARM_DAILY_QUOTA
+from fuel_route_api.core.log import logger
+
+DAY_SECONDS = 86400
+
+# Strong references to lane writes still in flight.
+_recording = set()
+
+
+def _redis():
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except Exception:
+        # Not a django-redis backend (e.g. locmem in tests).
+        return None
+
+
+class LaneTracker:
+    # Counts calculate requests per lane (the snapped request payload) in one
+    # Redis sorted set per UTC day; top() unions the last window_days sets.
+
+    def __init__(self, prefix: str = "lanes", window_days: int = LANE_WINDOW_DAYS):
+        self.prefix = prefix
+        self.window_days = window_days
+
+    def _day_key(self, day: int) -> str:
+        return f"{self.prefix}:{day}"
+
+    def _today(self) -> int:
+        return int(time.time() // DAY_SECONDS)
+
+    def _queue_record(self, pipe, payload: Dict):
+        key = self._day_key(self._today())
+        pipe.zincrby(key, 1, json.dumps(payload, sort_keys=True))
+        pipe.expire(key, (self.window_days + 1) * DAY_SECONDS)
+
+    def record(self, payload: Dict):
+        connection = _redis()
+        if connection is None:
+            return
+        try:
+            with connection.pipeline(transaction=False) as pipe:
+                self._queue_record(pipe, payload)
+                pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not record lane: {e}")
+
+    async def arecord(self, payload: Dict):
+        if not async_cache.available:
+            return
+        try:
+            async with async_cache.client().pipeline(transaction=False) as pipe:
+                self._queue_record(pipe, payload)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not record lane: {e}")
+
+    def record_later(self, payload: Dict):
+        # Popularity is a statistic: the request, cache hits included,
+        # never waits on it.
+        task = asyncio.ensure_future(self.arecord(payload))
+        _recording.add(task)
+        task.add_done_callback(_recording.discard)
+
+    def top(self, k: int) -> List[Tuple[Dict, int]]:
+        connection = _redis()
+        if connection is None or k <= 0:
+            return []
+        today = self._today()
+        days = [self._day_key(today - i) for i in range(self.window_days)]
+        merged = f"{self.prefix}:top:{today}"
+        with connection.pipeline(transaction=False) as pipe:
+            pipe.zunionstore(merged, days)
+            pipe.zrevrange(merged, 0, k - 1, withscores=True)
+            pipe.delete(merged)
+            _, lanes, _ = pipe.execute()
+        return [(json.loads(member), int(score)) for member, score in lanes]
+
+
+class DailyQuota:
+    # Shared counter of provider calls the warmer may spend per UTC day.
+
+    def __init__(self, name: str, limit: int = WARM_DAILY_QUOTA):
+        self.name = name
+        self.limit = limit
+
+    def _key(self) -> str:
+        return f"quota:{self.name}:{int(time.time() // DAY_SECONDS)}"
+
+    def remaining(self) -> int:
+        return max(self.limit - (cache.get(self._key()) or 0), 0)
+
+    def take(self) -> bool:
+        key = self._key()
+        cache.add(key, 0, timeout=2 * DAY_SECONDS)
+        try:
+            return cache.incr(key) <= self.limit
+        except ValueError:
+            return False
+
+
+lane_tracker = LaneTracker()
+warm_quota = DailyQuota("warm")
@@ -0,0 +1,53 @@
+import bisect
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# Log-spaced bucket upper bounds in seconds, 5 ms .. ~82 s.
+BUCKETS: List[float] = [0.005 * 1.25**i for i in range(44)]
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: List[float] = BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        index = bisect.bisect_left(self.buckets, seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += seconds
+
+    def percentile(self, q: float) -> Optional[float]:
+        # Upper bound of the bucket holding the q-th percentile sample.
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return (
+                    self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                )
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 2) if self.count else None,
+            "p50_ms": _ms(self.percentile(50)),
+            "p95_ms": _ms(self.percentile(95)),
+            "p99_ms": _ms(self.percentile(99)),
+        }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return round(seconds * 1000, 2) if seconds is not None else None
+
+
+provider_latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
@@ -0,0 +1,327 @@
+import json
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from django.core.cache import cache
+
+from fuel_route_api.core.async_redis_cache import async_cache
+from fuel_route_api.core.env import (
+    LOCAL_CACHE_ENABLED,
+    LOCAL_CACHE_MAX_BYTES,
+    LOCAL_CACHE_TTL_SECONDS,
+)
+from fuel_route_api.core.log import logger
+
+MISSING = object()
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+
+class LocalCache:
+    # Size-bounded LRU with per-entry expiry. Values are kept pickled so a
+    # caller mutating a returned object can never corrupt the cached copy,
+    # and so eviction can account for real sizes.
+
+    def __init__(self, max_bytes: int, max_item_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes or max_bytes // 16
+        self.size = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, blob = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return MISSING
+            self._entries.move_to_end(key)
+        return pickle.loads(blob)
+
+    def set(self, key: str, value: Any, ttl: float):
+        if ttl <= 0:
+            self.delete(key)
+            return
+        blob = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._remove(key)
+            if len(blob) > self.max_item_bytes:
+                return
+            self._entries[key] = (time.monotonic() + ttl, blob)
+            self.size += len(blob)
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def delete_many(self, keys: Iterable[str]):
+        with self._lock:
+            for key in keys:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+
+class TwoTierCache:
+    # Per-process LocalCache in front of the Django (Redis) cache. Writes go
+    # to Redis and are announced on a pub/sub channel so other processes drop
+    # their local copies; the local TTL bounds staleness if a message is lost.
+    # Misses are never cached locally, so polled keys see new values at once.
+
+    def __init__(
+        self,
+        enabled: bool = LOCAL_CACHE_ENABLED,
+        max_bytes: int = LOCAL_CACHE_MAX_BYTES,
+        local_ttl: float = LOCAL_CACHE_TTL_SECONDS,
+    ):
+        self.enabled = enabled
+        self.local = LocalCache(max_bytes)
+        self.local_ttl = local_ttl
+        self.sender = f"{os.getpid()}:{uuid.uuid4().hex}"
+        self.counts = {"local_hits": 0, "redis_hits": 0, "misses": 0}
+        self._listener_pid = None
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def _ttl(self, timeout) -> float:
+        return self.local_ttl if timeout is None else min(timeout, self.local_ttl)
+
+    def get_local(self, key: str):
+        if not self.enabled:
+            return MISSING
+        self._ensure_listener()
+        value = self.local.get(key)
+        if value is not MISSING:
+            self.counts["local_hits"] += 1
+        return value
+
+    def _remember(self, value, key: str, timeout: Optional[float] = None):
+        if value is None:
+            self.counts["misses"] += 1
+            return None
+        self.counts["redis_hits"] += 1
+        if self.enabled:
+            # Redis does not report the remaining TTL cheaply, so remote hits
+            # are kept for the local TTL alone.
+            self.local.set(key, value, self._ttl(timeout))
+        return value
+
+    def get_remote(self, key: str, timeout: Optional[float] = None):
+        return self._remember(cache.get(key), key, timeout)
+
+    async def aget_remote(self, key: str, timeout: Optional[float] = None):
+        return self._remember(await async_cache.get(key), key, timeout)
+
+    def get(self, key: str):
+        value = self.get_local(key)
+        return self.get_remote(key) if value is MISSING else value
+
+    def set(self, key: str, value: Any, timeout=None):
+        cache.set(key, value, timeout)
+        if self.enabled:
+            self._ensure_listener()
+            self.local.set(key, value, self._ttl(timeout))
+            self._publish([key])
+
+    async def aset(self, key: str, value: Any, timeout=None):
+        await async_cache.set(key, value, timeout)
+        if self.enabled:
+            self._ensure_listener()
+            self.local.set(key, value, self._ttl(timeout))
+            await self._apublish([key])
+
+    async def aadd(self, key: str, value: Any, timeout=None) -> bool:
+        added = await async_cache.add(key, value, timeout)
+        if added and self.enabled:
+            self.local.delete(key)
+            await self._apublish([key])
+        return added
+
+    async def adelete(self, key: str):
+        await async_cache.delete(key)
+        if self.enabled:
+            self.local.delete(key)
+            await self._apublish([key])
+
+    def add(self, key: str, value: Any, timeout=None) -> bool:
+        # Locks and other add() keys live only in Redis.
+        added = cache.add(key, value, timeout)
+        if added and self.enabled:
+            self.local.delete(key)
+            self._publish([key])
+        return added
+
+    def delete(self, key: str):
+        cache.delete(key)
+        if self.enabled:
+            self.local.delete(key)
+            self._publish([key])
+
+    def get_local_many(self, keys: Iterable[str]):
+        found, missing = {}, []
+        for key in keys:
+            value = self.get_local(key)
+            if value is MISSING:
+                missing.append(key)
+            else:
+                found[key] = value
+        return found, missing
+
+    def _remember_many(self, found: Dict, missing, remote: Dict) -> Dict:
+        for key in missing:
+            value = self._remember(remote.get(key), key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    def get_many(self, keys: Iterable[str]) -> Dict:
+        found, missing = self.get_local_many(keys)
+        remote = cache.get_many(missing) if missing else {}
+        return self._remember_many(found, missing, remote)
+
+    async def aget_many(self, keys: Iterable[str]) -> Dict:
+        found, missing = self.get_local_many(keys)
+        remote = await async_cache.get_many(missing) if missing else {}
+        return self._remember_many(found, missing, remote)
+
+    def _store_many(self, mapping: Dict, timeout):
+        if self.enabled:
+            self._ensure_listener()
+            for key, value in mapping.items():
+                self.local.set(key, value, self._ttl(timeout))
+
+    def set_many(self, mapping: Dict, timeout=None):
+        cache.set_many(mapping, timeout)
+        self._store_many(mapping, timeout)
+        if self.enabled:
+            self._publish(list(mapping))
+
+    async def aset_many(self, mapping: Dict, timeout=None):
+        await async_cache.set_many(mapping, timeout)
+        self._store_many(mapping, timeout)
+        if self.enabled:
+            await self._apublish(list(mapping))
+
+    def add_many(self, mapping: Dict, timeout=None) -> Dict[str, bool]:
+        connection = self._redis()
+        if connection is None or timeout is not None and timeout <= 0:
+            added = {key: cache.add(key, value, timeout) for key, value in mapping.items()}
+        else:
+            codec = cache.client
+            ms = None if timeout is None else int(timeout * 1000)
+            with connection.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(codec.make_key(key), codec.encode(value), px=ms, nx=True)
+                added = {key: bool(r) for key, r in zip(mapping, pipe.execute())}
+        keys = self._forget_added(added)
+        if keys and self.enabled:
+            self._publish(keys)
+        return added
+
+    async def aadd_many(self, mapping: Dict, timeout=None) -> Dict[str, bool]:
+        added = await async_cache.add_many(mapping, timeout)
+        keys = self._forget_added(added)
+        if keys and self.enabled:
+            await self._apublish(keys)
+        return added
+
+    def _forget_added(self, added: Dict[str, bool]):
+        keys = [key for key, ok in added.items() if ok]
+        if self.enabled:
+            self.local.delete_many(keys)
+        return keys
+
+    def stats(self) -> Dict:
+        counts = dict(self.counts)
+        lookups = sum(counts.values())
+        counts["lookups"] = lookups
+        counts["local_hit_rate"] = (
+            round(counts["local_hits"] / lookups, 4) if lookups else 0.0
+        )
+        counts["redis_hit_rate"] = (
+            round(counts["redis_hits"] / lookups, 4) if lookups else 0.0
+        )
+        counts["local_entries"] = len(self.local)
+        counts["local_bytes"] = self.local.size
+        return counts
+
+    def _redis(self):
+        try:
+            from django_redis import get_redis_connection
+
+            return get_redis_connection("default")
+        except Exception:
+            # Not a django-redis backend (e.g. locmem in tests).
+            return None
+
+    def _publish(self, keys):
+        connection = self._redis()
+        if connection is None:
+            return
+        try:
+            connection.publish(
+                INVALIDATION_CHANNEL, json.dumps({"sender": self.sender, "keys": keys})
+            )
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    async def _apublish(self, keys):
+        try:
+            await async_cache.publish(
+                INVALIDATION_CHANNEL, json.dumps({"sender": self.sender, "keys": keys})
+            )
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    def _on_message(self, message):
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, ValueError):
+            return
+        if payload.get("sender") != self.sender:
+            self.local.delete_many(payload.get("keys", []))
+
+    def _ensure_listener(self):
+        # Started lazily per process so forked Celery/uvicorn workers each
+        # get their own subscriber thread.
+        if self._listener_pid == os.getpid():
+            return
+        with self._lock:
+            if self._listener_pid == os.getpid():
+                return
+            self._listener_pid = os.getpid()
+            self.sender = f"{os.getpid()}:{uuid.uuid4().hex}"
+            self.local.clear()
+            connection = self._redis()
+            if connection is None:
+                logger.warning("No Redis connection for cache invalidation; local TTL only")
+                return
+            try:
+                pubsub = connection.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{INVALIDATION_CHANNEL: self._on_message})
+                self._listener = pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed to start: {e}")
+
+
+two_tier_cache = TwoTierCache()
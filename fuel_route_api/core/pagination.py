@@ -1,8 +1,14 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
+from django.db import connections
 from ninja import Schema
 from ninja_extra.pagination import PaginationBase
 
+from fuel_route_api.core.cache_dependencies import SyncCacheDependencies
+from fuel_route_api.core.cache_keys import cache_keys
+from fuel_route_api.core.env import COUNT_ESTIMATE_TTL_SECONDS, KEYSET_MAX_LIMIT
+from fuel_route_api.core.price_version import get_price_version
+
 T = TypeVar("T")
 
 
@@ -26,3 +32,63 @@ class CustomPagination(PaginationBase):
             "total": total,
             "per_page": limit,
         }
+
+
+class KeysetPaginatedOutput(Schema, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[int] = None
+    total: int
+    per_page: int
+
+
+class KeysetPagination(PaginationBase):
+    # WHERE id > cursor ORDER BY id LIMIT n + 1 on the queryset the view
+    # returns: every page is one primary key range scan, so deep pages cost
+    # the same as the first. The extra row only tells whether a next page
+    # exists. total is an estimate (see estimated_count).
+
+    class Input(Schema):
+        cursor: Optional[int] = None
+        limit: int = 6
+
+    def paginate_queryset(self, queryset, pagination: Input, **params):
+        limit = max(1, min(pagination.limit, KEYSET_MAX_LIMIT))
+        page = queryset
+        if pagination.cursor is not None:
+            page = page.filter(pk__gt=pagination.cursor)
+        items = list(page.order_by("pk")[: limit + 1])
+        next_cursor = items[limit - 1].pk if len(items) > limit else None
+        return {
+            "items": items[:limit],
+            "next_cursor": next_cursor,
+            "total": estimated_count(queryset),
+            "per_page": limit,
+        }
+
+
+def estimated_count(queryset) -> int:
+    # Cached per query and price version, so a COUNT(*) is paid at most once
+    # per price load and TTL. Unfiltered tables use the planner's estimate.
+    cache_deps = SyncCacheDependencies()
+    key = cache_keys.build("count", str(queryset.query), get_price_version())
+    total = cache_deps.get_from_cache(key)
+    if total is None:
+        total = None if queryset.query.where else _table_estimate(queryset)
+        if total is None:
+            total = queryset.count()
+        cache_deps.set_from_cache(key, total, timeout=COUNT_ESTIMATE_TTL_SECONDS)
+    return total
+
+
+def _table_estimate(queryset) -> Optional[int]:
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 (0 before PostgreSQL 14) until the first ANALYZE.
+    return int(row[0]) if row and row[0] > 0 else None
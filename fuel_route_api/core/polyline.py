@@ -0,0 +1,91 @@
+import numpy as np
+
+from fuel_route_api.core.env import ROUTE_POLYLINE_PRECISION
+
+# Google encoded polyline: each coordinate is scaled to an integer, delta
+# encoded against the previous point, zigzagged and written as 5-bit chunks
+# offset into printable ASCII. Both directions are vectorized over the route.
+
+MAX_CHUNKS = 7
+
+
+def encode(lats, lons, precision: int = ROUTE_POLYLINE_PRECISION) -> str:
+    if not len(lats):
+        return ""
+    scale = 10.0**precision
+    coords = np.empty((len(lats), 2), dtype=np.int64)
+    coords[:, 0] = np.round(np.asarray(lats, dtype=np.float64) * scale)
+    coords[:, 1] = np.round(np.asarray(lons, dtype=np.float64) * scale)
+
+    deltas = np.diff(coords, axis=0, prepend=np.zeros((1, 2), dtype=np.int64)).ravel()
+    values = ((deltas << 1) ^ (deltas >> 63)).astype(np.uint64)
+
+    shifts = np.arange(MAX_CHUNKS, dtype=np.uint64) * np.uint64(5)
+    shifted = values[:, None] >> shifts
+    chunks = shifted & np.uint64(31)
+    # One chunk per non-empty 5-bit group, and always at least one.
+    needed = np.maximum(1, (shifted != 0).sum(axis=1))
+    positions = np.arange(MAX_CHUNKS)
+    chunks |= np.where(positions < needed[:, None] - 1, 0x20, 0).astype(np.uint64)
+    chunks += np.uint64(63)
+    return chunks[positions < needed[:, None]].astype(np.uint8).tobytes().decode("ascii")
+
+
+def decode(polyline: str, precision: int = ROUTE_POLYLINE_PRECISION):
+    if not polyline:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+    raw = np.frombuffer(polyline.encode("ascii"), dtype=np.uint8).astype(np.int64) - 63
+
+    ends = np.flatnonzero((raw & 0x20) == 0)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    group = np.repeat(np.arange(len(starts)), ends - starts + 1)
+    shifts = 5 * (np.arange(len(raw)) - starts[group])
+    values = np.add.reduceat((raw & 31) << shifts, starts)
+
+    deltas = (values >> 1) ^ -(values & 1)
+    coords = np.cumsum(deltas.reshape(-1, 2), axis=0) / 10.0**precision
+    return coords[:, 0].copy(), coords[:, 1].copy()
+
+
+def encode_points(points, precision: int = ROUTE_POLYLINE_PRECISION) -> str:
+    count = len(points)
+    lats = np.fromiter((p["latitude"] for p in points), np.float64, count)
+    lons = np.fromiter((p["longitude"] for p in points), np.float64, count)
+    return encode(lats, lons, precision)
+
+
+def decode_points(polyline: str, precision: int = ROUTE_POLYLINE_PRECISION):
+    lats, lons = decode(polyline, precision)
+    return [
+        {"latitude": lat, "longitude": lon}
+        for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
+
+
+def pack_route(route_data, precision: int = ROUTE_POLYLINE_PRECISION):
+    # Cache form of a TomTom-style route: each points list becomes a polyline.
+    routes = []
+    for route in route_data.get("routes", []):
+        if "points" in route:
+            packed = {k: v for k, v in route.items() if k != "points"}
+            packed["polyline"] = encode_points(route["points"], precision)
+            packed["precision"] = precision
+            route = packed
+        routes.append(route)
+    return {**route_data, "routes": routes}
+
+
+def unpack_route(cached):
+    # Inverse of pack_route; entries cached before packing pass through.
+    if not cached or not any("polyline" in r for r in cached.get("routes", [])):
+        return cached
+    routes = []
+    for route in cached["routes"]:
+        if "polyline" in route:
+            unpacked = {
+                k: v for k, v in route.items() if k not in ("polyline", "precision")
+            }
+            unpacked["points"] = decode_points(route["polyline"], route["precision"])
+            route = unpacked
+        routes.append(route)
+    return {**cached, "routes": routes}
@@ -0,0 +1,19 @@
+from django.core.cache import cache
+
+PRICE_VERSION_KEY = "fuel_prices_version"
+
+
+def get_price_version() -> int:
+    version = cache.get(PRICE_VERSION_KEY)
+    if version is None:
+        cache.add(PRICE_VERSION_KEY, 1, timeout=None)
+        version = cache.get(PRICE_VERSION_KEY, 1)
+    return int(version)
+
+
+def bump_price_version() -> int:
+    try:
+        return cache.incr(PRICE_VERSION_KEY)
+    except ValueError:
+        cache.add(PRICE_VERSION_KEY, 1, timeout=None)
+        return cache.incr(PRICE_VERSION_KEY)
@@ -0,0 +1,144 @@
+import math
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
+from fuel_route_api.core.env import (
+    ROUTE_KEY_GEOHASH_LENGTH,
+    ROUTE_KEY_PRECISION,
+    ROUTE_KEY_SNAP,
+)
+from fuel_route_api.core.haversine import haversine_distance
+
+METERS_PER_MILE = 1609.34
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Endpoint fields as they appear in request bodies ({"start_lat": ...}) and in
+# provider cache payloads ({"start": [lat, lon]}).
+ENDPOINT_FIELDS = (("start_lat", "start_lon"), ("finish_lat", "finish_lon"))
+ENDPOINT_PAIRS = ("start", "finish")
+
+
+def geohash_encode(lat: float, lon: float, length: int) -> str:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, value, even = [], 0, 0, True
+    while len(chars) < length:
+        rng, coord = (lon_range, lon) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        value <<= 1
+        if coord >= mid:
+            value |= 1
+            rng[0] = mid
+        else:
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            bits = value = 0
+    return "".join(chars)
+
+
+def geohash_center(geohash: str) -> Tuple[float, float]:
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            rng = lon_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if value >> shift & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return (lat_range[0] + lat_range[1]) / 2, (lon_range[0] + lon_range[1]) / 2
+
+
+class EndpointSnapper:
+    # Snaps route endpoints to a shared cell so nearby requests share a cache
+    # key. "grid" rounds to `precision` decimal degrees (3 ~ 110 m), "geohash"
+    # moves to the centre of a `geohash_length` cell (7 ~ 150 m), "off" keeps
+    # the raw coordinates.
+
+    def __init__(
+        self,
+        mode: str = ROUTE_KEY_SNAP,
+        precision: int = ROUTE_KEY_PRECISION,
+        geohash_length: int = ROUTE_KEY_GEOHASH_LENGTH,
+    ):
+        if mode not in ("grid", "geohash", "off"):
+            raise ValueError(f"Unknown snap mode: {mode}")
+        self.mode = mode
+        self.precision = precision
+        self.geohash_length = geohash_length
+
+    def snap(self, lat: float, lon: float) -> Tuple[float, float]:
+        if self.mode == "grid":
+            step = 10.0 ** -self.precision
+            return (
+                round(math.floor(lat / step + 0.5) * step, self.precision),
+                round(math.floor(lon / step + 0.5) * step, self.precision),
+            )
+        if self.mode == "geohash":
+            return geohash_center(geohash_encode(lat, lon, self.geohash_length))
+        return lat, lon
+
+    def snap_endpoints(self, data: Dict) -> Tuple[Dict, float]:
+        # Copy of data with every endpoint snapped, plus the largest distance
+        # in metres any endpoint moved.
+        snapped = dict(data)
+        error = 0.0
+        points = [
+            (lat_key, lon_key, data[lat_key], data[lon_key])
+            for lat_key, lon_key in ENDPOINT_FIELDS
+            if data.get(lat_key) is not None and data.get(lon_key) is not None
+        ]
+        for lat_key, lon_key, lat, lon in points:
+            snapped[lat_key], snapped[lon_key] = self.snap(lat, lon)
+            error = max(error, self._error(lat, lon, snapped[lat_key], snapped[lon_key]))
+
+        for key in ENDPOINT_PAIRS:
+            pair = data.get(key)
+            if isinstance(pair, (list, tuple)) and len(pair) == 2:
+                lat, lon = self.snap(*pair)
+                snapped[key] = [lat, lon]
+                error = max(error, self._error(pair[0], pair[1], lat, lon))
+        return snapped, round(error, 2)
+
+    def _error(self, lat, lon, snapped_lat, snapped_lon) -> float:
+        return haversine_distance(lat, lon, snapped_lat, snapped_lon) * METERS_PER_MILE
+
+
+def replay_hit_rate(
+    requests: Iterable[Dict], snapper: EndpointSnapper, capacity: int = 0
+) -> Dict:
+    # Replays request bodies through an LRU of `capacity` keys (0 = unbounded)
+    # keyed by snapped endpoints, as the route cache would see them.
+    seen: OrderedDict = OrderedDict()
+    hits = total = 0
+    errors = []
+    for body in requests:
+        snapped, error = snapper.snap_endpoints(body)
+        key = tuple(snapped.get(f) for pair in ENDPOINT_FIELDS for f in pair)
+        total += 1
+        errors.append(error)
+        if key in seen:
+            hits += 1
+            seen.move_to_end(key)
+        else:
+            seen[key] = True
+            if capacity and len(seen) > capacity:
+                seen.popitem(last=False)
+
+    errors.sort()
+    return {
+        "requests": total,
+        "hits": hits,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+        "distinct_keys": len(seen),
+        "p50_snap_error_m": errors[len(errors) // 2] if errors else 0.0,
+        "max_snap_error_m": errors[-1] if errors else 0.0,
+    }
+
+
+snapper = EndpointSnapper()
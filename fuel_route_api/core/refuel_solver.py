@@ -0,0 +1,113 @@
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence
+
+
+class RefuelInfeasible(ValueError):
+    pass
+
+
+def _next_cheaper(prices: Sequence[float]) -> List[int]:
+    # Index of the first later station with a strictly lower price, or len(prices).
+    result = [len(prices)] * len(prices)
+    stack: List[int] = []
+    for i, price in enumerate(prices):
+        while stack and prices[stack[-1]] > price:
+            result[stack.pop()] = i
+        stack.append(i)
+    return result
+
+
+def _min_price_table(prices: Sequence[float]) -> List[List[int]]:
+    # Sparse table of argmin indices; ties resolve to the farther station.
+    table = [list(range(len(prices)))]
+    span = 1
+    while span * 2 <= len(prices):
+        prev = table[-1]
+        row = []
+        for i in range(len(prices) - span * 2 + 1):
+            a, b = prev[i], prev[i + span]
+            row.append(a if prices[a] < prices[b] else b)
+        table.append(row)
+        span *= 2
+    return table
+
+
+def _argmin(table, prices, lo: int, hi: int) -> int:
+    level = (hi - lo + 1).bit_length() - 1
+    a, b = table[level][lo], table[level][hi - (1 << level) + 1]
+    return a if prices[a] < prices[b] else b
+
+
+def plan_refuel(
+    mileposts: Sequence[float],
+    prices: Sequence[float],
+    route_miles: float,
+    tank_capacity_gallons: float,
+    mpg: float,
+    start_fuel_gallons: Optional[float] = None,
+) -> Dict:
+    # Mileposts must be sorted ascending. At each stop the truck either buys
+    # just enough to reach the next cheaper station within one tank, or fills
+    # up and moves on to the cheapest station in range.
+    if start_fuel_gallons is None:
+        start_fuel_gallons = tank_capacity_gallons
+
+    n = len(mileposts)
+    max_range = tank_capacity_gallons * mpg
+    positions = list(mileposts) + [route_miles]
+    costs = list(prices) + [float("-inf")]
+    next_cheaper = _next_cheaper(costs)
+    table = _min_price_table(costs)
+
+    stops: List[Dict] = []
+    fuel = start_fuel_gallons
+
+    if route_miles <= fuel * mpg:
+        return _summary(stops, fuel - route_miles / mpg)
+    if not n or positions[0] > fuel * mpg:
+        raise RefuelInfeasible(
+            "No fuel station reachable from the start of the route."
+        )
+
+    fuel -= positions[0] / mpg
+    i = 0
+    while i < n:
+        reach = bisect_right(positions, positions[i] + max_range) - 1
+        if reach <= i:
+            raise RefuelInfeasible(
+                f"Gap after milepost {positions[i]:.1f} exceeds the "
+                f"{max_range:.0f}-mile tank range."
+            )
+
+        j = next_cheaper[i]
+        if j <= reach:
+            needed = (positions[j] - positions[i]) / mpg
+            bought = max(0.0, needed - fuel)
+        else:
+            j = _argmin(table, costs, i + 1, reach)
+            needed = (positions[j] - positions[i]) / mpg
+            bought = tank_capacity_gallons - fuel
+
+        if bought > 1e-9:
+            stops.append(
+                {
+                    "index": i,
+                    "milepost": positions[i],
+                    "price": costs[i],
+                    "gallons": bought,
+                    "cost": bought * costs[i],
+                }
+            )
+        fuel = max(0.0, fuel + bought - needed)
+        i = j
+
+    return _summary(stops, fuel)
+
+
+def _summary(stops: List[Dict], arrival_fuel: float) -> Dict:
+    return {
+        "stops": stops,
+        "gallons_purchased": sum(s["gallons"] for s in stops),
+        "total_cost": sum(s["cost"] for s in stops),
+        "arrival_fuel_gallons": arrival_fuel,
+    }
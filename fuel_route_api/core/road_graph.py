@@ -0,0 +1,268 @@
+import heapq
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from fuel_route_api.core.haversine import haversine_distances
+
+DEFAULT_SPEED_KPH = 88.0
+INF = float("inf")
+# OSM oneway tag values; anything else (no, blank, reversible) is two-way.
+ONEWAY_FORWARD = {"yes", "true", "1", "1.0"}
+ONEWAY_REVERSE = {"-1", "-1.0", "reverse"}
+
+
+class _Adjacency:
+    # CSR adjacency kept as Python lists: the search loops index them one
+    # element at a time, which is far cheaper on lists than on numpy arrays.
+
+    def __init__(self, count, sources, targets, lengths, times):
+        order = np.argsort(sources, kind="stable")
+        offsets = np.searchsorted(sources[order], np.arange(count + 1))
+        self.offsets = offsets.tolist()
+        self.targets = targets[order].tolist()
+        self.lengths = lengths[order].tolist()
+        self.times = times[order].tolist()
+
+
+class RoadGraph:
+    # Directed road graph answering shortest-distance queries with A* over
+    # ALT landmark bounds (plus the straight-line bound), so a query only
+    # settles nodes in a narrow band around the optimal path.
+
+    def __init__(self, lats, lons, sources, targets, lengths, times=None):
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.float64)
+        if times is None:
+            times = lengths / (DEFAULT_SPEED_KPH / 3.6)
+        times = np.asarray(times, dtype=np.float64)
+
+        self._lat_rad = np.radians(self.lats).tolist()
+        self._lon_rad = np.radians(self.lons).tolist()
+        self._cos_lat = np.cos(np.radians(self.lats)).tolist()
+
+        count = len(self.lats)
+        self.forward = _Adjacency(count, sources, targets, lengths, times)
+        self.reverse = _Adjacency(count, targets, sources, lengths, times)
+        self.edges = (sources, targets, lengths, times)
+        self.landmarks: List[int] = []
+        self.from_landmark: List[List[float]] = []
+        self.to_landmark: List[List[float]] = []
+
+    def __len__(self):
+        return len(self.lats)
+
+    @classmethod
+    def from_edge_list(cls, path: str) -> "RoadGraph":
+        # CSV with source, target, length_m, source_lat, source_lon,
+        # target_lat, target_lon and optional oneway / speed_kph columns, as
+        # exported from OSM ways split at intersections.
+        import pandas as pd
+
+        df = pd.read_csv(path)
+        node_ids, inverse = np.unique(
+            np.concatenate([df["source"].to_numpy(), df["target"].to_numpy()]),
+            return_inverse=True,
+        )
+        sources, targets = inverse[: len(df)], inverse[len(df):]
+
+        lats = np.empty(len(node_ids))
+        lons = np.empty(len(node_ids))
+        lats[sources] = df["source_lat"].to_numpy()
+        lons[sources] = df["source_lon"].to_numpy()
+        lats[targets] = df["target_lat"].to_numpy()
+        lons[targets] = df["target_lon"].to_numpy()
+
+        lengths = df["length_m"].to_numpy(dtype=np.float64)
+        speeds = (
+            df["speed_kph"].fillna(DEFAULT_SPEED_KPH).to_numpy(dtype=np.float64)
+            if "speed_kph" in df
+            else np.full(len(df), DEFAULT_SPEED_KPH)
+        )
+        times = lengths / (speeds / 3.6)
+
+        forward, backward = _directions(df["oneway"] if "oneway" in df else None, len(df))
+        return cls(
+            lats,
+            lons,
+            np.concatenate([sources[forward], targets[backward]]),
+            np.concatenate([targets[forward], sources[backward]]),
+            np.concatenate([lengths[forward], lengths[backward]]),
+            np.concatenate([times[forward], times[backward]]),
+        )
+
+    def save(self, path: str):
+        sources, targets, lengths, times = self.edges
+        np.savez_compressed(
+            path,
+            lats=self.lats,
+            lons=self.lons,
+            sources=sources,
+            targets=targets,
+            lengths=lengths,
+            times=times,
+            landmarks=np.asarray(self.landmarks, dtype=np.int64),
+            from_landmark=np.asarray(self.from_landmark, dtype=np.float64),
+            to_landmark=np.asarray(self.to_landmark, dtype=np.float64),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "RoadGraph":
+        data = np.load(path)
+        graph = cls(
+            data["lats"],
+            data["lons"],
+            data["sources"],
+            data["targets"],
+            data["lengths"],
+            data["times"],
+        )
+        graph.landmarks = data["landmarks"].tolist()
+        graph.from_landmark = data["from_landmark"].tolist()
+        graph.to_landmark = data["to_landmark"].tolist()
+        return graph
+
+    def _dijkstra(self, adjacency: _Adjacency, source: int) -> List[float]:
+        dist = [INF] * len(self)
+        dist[source] = 0.0
+        heap = [(0.0, source)]
+        offsets, targets, lengths = adjacency.offsets, adjacency.targets, adjacency.lengths
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                nd = d + lengths[i]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+        return dist
+
+    def build_landmarks(self, count: int = 8):
+        # Farthest-point selection: each new landmark is the node farthest
+        # (by road) from all landmarks chosen so far.
+        self.landmarks, self.from_landmark, self.to_landmark = [], [], []
+        if not len(self):
+            return
+        nearest = [INF] * len(self)
+        candidate = 0
+        for _ in range(min(count, len(self))):
+            self.landmarks.append(candidate)
+            from_dist = self._dijkstra(self.forward, candidate)
+            self.from_landmark.append(from_dist)
+            self.to_landmark.append(self._dijkstra(self.reverse, candidate))
+            nearest = [min(a, b) for a, b in zip(nearest, from_dist)]
+            reachable = [(d, v) for v, d in enumerate(nearest) if d < INF]
+            candidate = max(reachable)[1]
+
+    def _heuristic(self, target: int):
+        lat_rad, lon_rad, cos_lat = self._lat_rad, self._lon_rad, self._cos_lat
+        target_lat, target_lon, target_cos = (
+            lat_rad[target], lon_rad[target], cos_lat[target]
+        )
+        bounds = [
+            (from_dist, to_dist, from_dist[target], to_dist[target])
+            for from_dist, to_dist in zip(self.from_landmark, self.to_landmark)
+        ]
+        # Slightly shrunk so float rounding never makes it inadmissible.
+        diameter = 2 * 6371008.8 * 0.999
+
+        def h(v: int) -> float:
+            # d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L).
+            best = 0.0
+            for from_dist, to_dist, from_t, to_t in bounds:
+                if from_dist[v] < INF and from_t < INF:
+                    best = max(best, from_t - from_dist[v])
+                if to_dist[v] < INF and to_t < INF:
+                    best = max(best, to_dist[v] - to_t)
+            a = (
+                math.sin((target_lat - lat_rad[v]) / 2) ** 2
+                + cos_lat[v] * target_cos * math.sin((target_lon - lon_rad[v]) / 2) ** 2
+            )
+            return max(best, diameter * math.asin(min(1.0, math.sqrt(a))))
+
+        return h
+
+    def shortest_path(self, source: int, target: int) -> Optional[Dict]:
+        h = self._heuristic(target)
+        offsets = self.forward.offsets
+        targets, lengths, times = self.forward.targets, self.forward.lengths, self.forward.times
+        dist = {source: 0.0}
+        elapsed = {source: 0.0}
+        previous = {}
+        heap = [(h(source), 0.0, source)]
+        settled = 0
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            if d > dist[u]:
+                continue
+            settled += 1
+            if u == target:
+                break
+            for i in range(offsets[u], offsets[u + 1]):
+                v = targets[i]
+                nd = d + lengths[i]
+                if nd < dist.get(v, INF):
+                    dist[v] = nd
+                    elapsed[v] = elapsed[u] + times[i]
+                    previous[v] = u
+                    heapq.heappush(heap, (nd + h(v), nd, v))
+        else:
+            return None
+
+        path = [target]
+        while path[-1] != source:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return {
+            "nodes": path,
+            "length_m": dist[target],
+            "time_s": elapsed[target],
+            "settled": settled,
+        }
+
+    def nearest_node(self, lat: float, lon: float, max_miles: float = 10.0) -> int:
+        distances = haversine_distances(lat, lon, self.lats, self.lons)
+        node = int(distances.argmin())
+        if distances[node] > max_miles:
+            raise ValueError(f"No road within {max_miles} miles of ({lat}, {lon})")
+        return node
+
+    def route(self, start_lat, start_lon, finish_lat, finish_lon) -> Dict:
+        # Same normalized structure the routing providers return.
+        result = self.shortest_path(
+            self.nearest_node(start_lat, start_lon),
+            self.nearest_node(finish_lat, finish_lon),
+        )
+        if result is None:
+            raise ValueError("No road route between the requested points")
+        return {
+            "routes": [
+                {
+                    "summary": {
+                        "lengthInMeters": round(result["length_m"], 1),
+                        "travelTimeInSeconds": round(result["time_s"]),
+                    },
+                    "points": [
+                        {"latitude": float(self.lats[v]), "longitude": float(self.lons[v])}
+                        for v in result["nodes"]
+                    ],
+                }
+            ]
+        }
+
+
+def _directions(oneway, count: int):
+    # Masks of edges traversable source -> target and target -> source.
+    if oneway is None:
+        both = np.ones(count, dtype=bool)
+        return both, both
+    tags = oneway.astype(str).str.strip().str.lower()
+    forward_only = tags.isin(ONEWAY_FORWARD).to_numpy()
+    reverse_only = tags.isin(ONEWAY_REVERSE).to_numpy()
+    return ~reverse_only, ~forward_only
@@ -0,0 +1,132 @@
+import numpy as np
+
+from fuel_route_api.core.haversine import haversine_distances
+
+MILES_PER_DEGREE = 69.0
+
+
+def route_arrays(route_points):
+    # Accepts {"latitude", "longitude"} dicts, {"lat", "lon"} dicts or
+    # [lon, lat] pairs and returns contiguous float64 lat/lon arrays.
+    count = len(route_points)
+    if not count:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+
+    first = route_points[0]
+    if isinstance(first, dict):
+        lat_key, lon_key = (
+            ("latitude", "longitude") if "latitude" in first else ("lat", "lon")
+        )
+        lats = np.fromiter((p[lat_key] for p in route_points), np.float64, count)
+        lons = np.fromiter((p[lon_key] for p in route_points), np.float64, count)
+        return lats, lons
+
+    coords = np.asarray(route_points, dtype=np.float64).reshape(count, -1)
+    return np.ascontiguousarray(coords[:, 1]), np.ascontiguousarray(coords[:, 0])
+
+
+def cumulative_miles(lats, lons):
+    mileposts = np.zeros(len(lats), dtype=np.float64)
+    if len(lats) > 1:
+        np.cumsum(
+            haversine_distances(lats[:-1], lons[:-1], lats[1:], lons[1:]),
+            out=mileposts[1:],
+        )
+    return mileposts
+
+
+def resample(lats, lons, mileposts, spacing_miles: float):
+    # Points every spacing_miles along the route, always including both ends.
+    if not len(lats):
+        return lats, lons, mileposts
+
+    total = mileposts[-1]
+    targets = np.arange(0.0, total, spacing_miles) if spacing_miles > 0 else np.empty(0)
+    targets = np.append(targets, total)
+    return (
+        np.interp(targets, mileposts, lats),
+        np.interp(targets, mileposts, lons),
+        targets,
+    )
+
+
+def simplify(lats, lons, tolerance_miles: float):
+    # Douglas-Peucker over the route arrays; returns indices of kept vertices.
+    # Each segment is measured in a local equirectangular frame in miles, so
+    # every dropped vertex stays within tolerance_miles of the simplified line.
+    count = len(lats)
+    if count < 3 or tolerance_miles <= 0:
+        return np.arange(count)
+
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+
+        x_scale = MILES_PER_DEGREE * np.cos(np.radians((lats[a] + lats[b]) / 2))
+        dx = (lons[b] - lons[a]) * x_scale
+        dy = (lats[b] - lats[a]) * MILES_PER_DEGREE
+        px = (lons[a + 1 : b] - lons[a]) * x_scale
+        py = (lats[a + 1 : b] - lats[a]) * MILES_PER_DEGREE
+
+        length_sq = dx * dx + dy * dy
+        t = (
+            np.clip((px * dx + py * dy) / length_sq, 0.0, 1.0)
+            if length_sq
+            else np.zeros(len(px))
+        )
+        offsets = np.hypot(px - t * dx, py - t * dy)
+
+        i = int(offsets.argmax())
+        if offsets[i] > tolerance_miles:
+            k = a + 1 + i
+            keep[k] = True
+            stack.append((a, k))
+            stack.append((k, b))
+
+    return np.flatnonzero(keep)
+
+
+def simplify_coordinates(coordinates, tolerance_miles: float):
+    # [lon, lat] pairs in, the kept subset of the same pairs out.
+    if len(coordinates) < 3 or tolerance_miles <= 0:
+        return coordinates
+    lats, lons = route_arrays(coordinates)
+    return [coordinates[i] for i in simplify(lats, lons, tolerance_miles)]
+
+
+def normalize_route(route_data):
+    # Any provider's payload to the TomTom-style structure the planners use:
+    # {"routes": [{"summary": {...}, "points": [{"latitude", "longitude"}]}]}.
+    route = route_data["routes"][0]
+    summary = dict(route.get("summary") or {})
+
+    if "points" in route:
+        points = route["points"]
+    elif "legs" in route:
+        points = [p for leg in route["legs"] for p in leg.get("points", [])]
+    else:
+        points = [
+            {"latitude": lat, "longitude": lon}
+            for lon, lat in route.get("geometry", {}).get("coordinates", [])
+        ]
+
+    summary.setdefault("lengthInMeters", route.get("distance", 0))
+    summary.setdefault("travelTimeInSeconds", route.get("duration", 0))
+    if not points or not summary["lengthInMeters"]:
+        raise ValueError("Route response has no geometry or length")
+    return {"routes": [{"summary": summary, "points": points}]}
+
+
+def simplify_route(route_data, tolerance_miles: float):
+    # A normalize_route() result with its points thinned by simplify().
+    route = route_data["routes"][0]
+    points = route["points"]
+    if len(points) < 3 or tolerance_miles <= 0:
+        return route_data
+    lats, lons = route_arrays(points)
+    kept = simplify(lats, lons, tolerance_miles)
+    return {"routes": [{**route, "points": [points[i] for i in kept]}]}
@@ -0,0 +1,89 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fuel_route_api.core.cache_dependencies import AsyncCacheDependencies
+from fuel_route_api.core.log import logger
+
+Call = Callable[[], Awaitable[Any]]
+
+
+class SingleFlight:
+    # Concurrent callers with the same key share one in-flight task. The work
+    # runs as its own task, so a cancelled caller never cancels the others.
+
+    def __init__(self):
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+
+    def in_flight(self, key: str) -> bool:
+        return (asyncio.get_running_loop(), key) in self._calls
+
+    async def do(self, key: str, fn: Call):
+        flight = (asyncio.get_running_loop(), key)
+        task = self._calls.get(flight)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[flight] = task
+            task.add_done_callback(lambda t: self._done(flight, t))
+        return await asyncio.shield(task)
+
+    def _done(self, flight, task: asyncio.Task):
+        self._calls.pop(flight, None)
+        if not task.cancelled():
+            # Mark the exception retrieved; waiters re-raise it themselves.
+            task.exception()
+
+
+class DistributedSingleFlight:
+    # SingleFlight within the process, plus a cache `add` lock across
+    # processes, taken through AsyncCacheDependencies so it shows up in
+    # cache_metrics. A worker that loses the lock polls `read` for the leader's
+    # result; if the leader dies (lock gone) or takes longer than
+    # wait_timeout, it runs fn itself.
+
+    def __init__(
+        self,
+        prefix: str,
+        cache_deps: Optional[AsyncCacheDependencies] = None,
+        lock_timeout: int = 30,
+        wait_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+    ):
+        self.prefix = prefix
+        self.cache_deps = cache_deps or AsyncCacheDependencies()
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self.local = SingleFlight()
+
+    async def do(self, key: str, fn: Call, read: Callable[[], Awaitable[Optional[Any]]]):
+        return await self.local.do(key, lambda: self._across_workers(key, fn, read))
+
+    async def _across_workers(self, key: str, fn: Call, read):
+        lock_key = f"{self.prefix}:flight:{key}"
+        if await self.cache_deps.add_from_cache(lock_key, 1, self.lock_timeout):
+            try:
+                return await fn()
+            finally:
+                await self.cache_deps.delete_from_cache(lock_key)
+
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            result = await read()
+            if result is not None:
+                return result
+            if await self.cache_deps.get_from_cache(lock_key) is None:
+                # The leader may have finished between the two reads.
+                result = await read()
+                if result is not None:
+                    return result
+                break
+
+        logger.info(f"Single-flight leader for {lock_key} gave no result; running locally")
+        return await fn()
+
+
+route_flight = DistributedSingleFlight("route")
+geocode_flight = DistributedSingleFlight("geocode")
+fuel_stop_flight = SingleFlight()
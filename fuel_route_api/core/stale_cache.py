@@ -0,0 +1,107 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from celery import current_app
+
+from fuel_route_api.core.env import SWR_MAX_STALE_SECONDS, SWR_REFRESH_LOCK_SECONDS
+from fuel_route_api.core.log import logger
+
+ENVELOPE = "__swr__"
+
+# Strong references to background refreshes so they are not collected
+# before they finish.
+_refreshing = set()
+
+
+def wrap(value: Any, soft_ttl: float) -> Dict:
+    return {ENVELOPE: 1, "value": value, "fresh_until": time.time() + soft_ttl}
+
+
+def unwrap(cached) -> Tuple[Any, bool]:
+    # (value, stale). Entries written before envelopes count as fresh and
+    # age out on their original hard expiry.
+    if isinstance(cached, dict) and ENVELOPE in cached:
+        return cached["value"], cached["fresh_until"] <= time.time()
+    return cached, False
+
+
+def hard_ttl(soft_ttl: float) -> float:
+    return soft_ttl + SWR_MAX_STALE_SECONDS
+
+
+class AsyncStaleCache:
+    # Stale-while-revalidate over AsyncCacheDependencies. Entries carry their
+    # soft expiry; past it the stale value is still returned and one refresh
+    # per key (guarded by a cache lock) runs in the background. Redis drops
+    # the entry at the hard TTL, which bounds how stale a value can get.
+
+    def __init__(self, cache_deps, lock_timeout: int = SWR_REFRESH_LOCK_SECONDS):
+        self.cache_deps = cache_deps
+        self.lock_timeout = lock_timeout
+
+    async def peek(self, key: str) -> Tuple[Any, bool]:
+        return unwrap(await self.cache_deps.get_from_cache(key))
+
+    async def get(self, key: str, refresh: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        value, stale = await self.peek(key)
+        if value and stale:
+            await self.revalidate(key, refresh)
+        return value
+
+    async def set(self, key: str, value: Any, soft_ttl: float):
+        await self.cache_deps.set_from_cache(
+            key, wrap(value, soft_ttl), timeout=hard_ttl(soft_ttl)
+        )
+
+    async def revalidate(self, key: str, refresh: Callable[[], Awaitable[Any]]):
+        lock_key = f"{key}:refresh"
+        if not await self.cache_deps.add_from_cache(lock_key, 1, timeout=self.lock_timeout):
+            return
+
+        async def run():
+            try:
+                await refresh()
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                await self.cache_deps.delete_from_cache(lock_key)
+
+        task = asyncio.ensure_future(run())
+        _refreshing.add(task)
+        task.add_done_callback(_refreshing.discard)
+
+
+class SyncStaleCache:
+    # Sync twin of AsyncStaleCache; the refresh is a Celery task, which must
+    # delete the lock key it is given once it has rewritten the entry.
+
+    def __init__(self, cache_deps, lock_timeout: int = SWR_REFRESH_LOCK_SECONDS):
+        self.cache_deps = cache_deps
+        self.lock_timeout = lock_timeout
+
+    def peek(self, key: str) -> Tuple[Any, bool]:
+        return unwrap(self.cache_deps.get_from_cache(key))
+
+    def get(self, key: str, task_name: str, kwargs: Dict) -> Optional[Any]:
+        value, stale = self.peek(key)
+        if value and stale:
+            self.revalidate(key, task_name, kwargs)
+        return value
+
+    def set(self, key: str, value: Any, soft_ttl: float):
+        self.cache_deps.set_from_cache(
+            key, wrap(value, soft_ttl), timeout=hard_ttl(soft_ttl)
+        )
+
+    def revalidate(self, key: str, task_name: str, kwargs: Dict):
+        lock_key = f"{key}:refresh"
+        if not self.cache_deps.add_to_cache(lock_key, 1, timeout=self.lock_timeout):
+            return
+        try:
+            current_app.send_task(
+                task_name, kwargs={**kwargs, "cache_key": key, "lock_key": lock_key}
+            )
+        except Exception as e:
+            logger.warning(f"Could not queue refresh of {key}: {e}")
+            self.cache_deps.delete_from_cache(lock_key)
@@ -0,0 +1,237 @@
+import math
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from fuel_route_api.core.haversine import haversine_distances
+from fuel_route_api.core.log import logger
+from fuel_route_api.core.price_version import get_price_version
+
+
+class _Columns:
+    def __init__(self, cells, pks, lats, lons, prices, station_ids, names, cities):
+        self.cells = cells
+        self.pks = pks
+        self.lats = lats
+        self.lons = lons
+        self.prices = prices
+        self.station_ids = station_ids
+        self.names = names
+        self.cities = cities
+
+
+EMPTY = _Columns(
+    {},
+    np.empty(0, dtype=np.int64),
+    np.empty(0, dtype=np.float64),
+    np.empty(0, dtype=np.float64),
+    np.empty(0, dtype=np.float64),
+    [],
+    [],
+    [],
+)
+
+
+class StationIndex:
+    # Packed uniform grid over station lat/lon: stations are sorted by cell so
+    # each cell is one contiguous slice of the column arrays. A rebuild swaps
+    # the whole column set at once so concurrent readers never see a mix.
+
+    def __init__(self, cell_degrees: float = 0.5, refresh_interval: float = 30.0):
+        self.cell_degrees = cell_degrees
+        self.refresh_interval = refresh_interval
+        self.version: Optional[int] = None
+        self.checked_at = 0.0
+        self.columns = EMPTY
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.columns.pks)
+
+    def is_fresh(self) -> bool:
+        return (
+            self.version is not None
+            and time.monotonic() - self.checked_at < self.refresh_interval
+        )
+
+    def invalidate(self):
+        self.checked_at = 0.0
+        self.version = None
+
+    def ensure_fresh(self):
+        if self.is_fresh():
+            return
+        with self._lock:
+            if self.is_fresh():
+                return
+            version = get_price_version()
+            if version != self.version:
+                self.build(self._load_rows())
+                self.version = version
+                logger.info(
+                    f"Station index rebuilt: {len(self)} stations (version {version})"
+                )
+            self.checked_at = time.monotonic()
+
+    def _load_rows(self):
+        from fuel_route_api.models.models import FuelStation
+
+        return [
+            (pk, station_id, name, city, float(price), loc.y, loc.x)
+            for pk, station_id, name, city, price, loc in FuelStation.objects.exclude(
+                location__isnull=True
+            ).values_list(
+                "id",
+                "opis_truckstop_id",
+                "truckstop_name",
+                "city",
+                "retail_price",
+                "location",
+            )
+        ]
+
+    def _cell(self, lat, lon):
+        return (
+            np.floor(np.asarray(lat) / self.cell_degrees).astype(np.int64),
+            np.floor(np.asarray(lon) / self.cell_degrees).astype(np.int64),
+        )
+
+    def build(self, rows):
+        if not rows:
+            self.columns = EMPTY
+            return
+
+        pks, station_ids, names, cities, prices, lats, lons = zip(*rows)
+        lats = np.ascontiguousarray(lats, dtype=np.float64)
+        lons = np.ascontiguousarray(lons, dtype=np.float64)
+        rows_idx, cols_idx = self._cell(lats, lons)
+        order = np.lexsort((cols_idx, rows_idx))
+
+        rows_idx = rows_idx[order]
+        cols_idx = cols_idx[order]
+        boundaries = np.flatnonzero(
+            (np.diff(rows_idx) != 0) | (np.diff(cols_idx) != 0)
+        ) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(order)]))
+
+        self.columns = _Columns(
+            cells={
+                (int(rows_idx[s]), int(cols_idx[s])): (int(s), int(e))
+                for s, e in zip(starts, ends)
+            },
+            pks=np.asarray(pks, dtype=np.int64)[order],
+            lats=lats[order],
+            lons=lons[order],
+            prices=np.asarray(prices, dtype=np.float64)[order],
+            station_ids=[str(station_ids[i]) for i in order],
+            names=[names[i] for i in order],
+            cities=[cities[i] for i in order],
+        )
+
+    def within(self, lat: float, lon: float, radius_miles: float, columns=None):
+        columns = columns or self.columns
+        if not columns.cells:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        dlat = radius_miles / 69.0
+        dlon = radius_miles / (69.0 * max(math.cos(math.radians(lat)), 0.01))
+        row_lo, col_lo = self._cell(lat - dlat, lon - dlon)
+        row_hi, col_hi = self._cell(lat + dlat, lon + dlon)
+
+        slices = [
+            columns.cells[(row, col)]
+            for row in range(int(row_lo), int(row_hi) + 1)
+            for col in range(int(col_lo), int(col_hi) + 1)
+            if (row, col) in columns.cells
+        ]
+        if not slices:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        candidates = np.concatenate([np.arange(s, e) for s, e in slices])
+        distances = haversine_distances(
+            lat, lon, columns.lats[candidates], columns.lons[candidates]
+        )
+        mask = distances <= radius_miles
+        return candidates[mask], distances[mask]
+
+    def corridor(self, lats, lons, mileposts, corridor_miles: float = 10) -> List[Dict]:
+        # Every station within corridor_miles of the route, projected onto its
+        # nearest route vertex. Route vertices are probed every corridor_miles,
+        # so a 2x search radius around each probe covers the gaps between them.
+        columns = self.columns
+        if not columns.cells or not len(lats):
+            return []
+
+        probes = np.unique(
+            np.searchsorted(
+                mileposts, np.arange(0, mileposts[-1] + corridor_miles, corridor_miles)
+            ).clip(0, len(lats) - 1)
+        )
+        best: Dict[int, tuple] = {}
+        for k in probes:
+            candidates, _ = self.within(
+                lats[k], lons[k], corridor_miles * 2, columns
+            )
+            if not len(candidates):
+                continue
+
+            lo = np.searchsorted(mileposts, mileposts[k] - corridor_miles * 2)
+            hi = np.searchsorted(mileposts, mileposts[k] + corridor_miles * 2, "right")
+            distances = haversine_distances(
+                columns.lats[candidates][:, None],
+                columns.lons[candidates][:, None],
+                lats[lo:hi][None, :],
+                lons[lo:hi][None, :],
+            )
+            nearest = distances.argmin(axis=1)
+            detours = distances[np.arange(len(candidates)), nearest]
+            for i, vertex, detour in zip(candidates, nearest, detours):
+                i = int(i)
+                if detour <= corridor_miles and (
+                    i not in best or detour < best[i][0]
+                ):
+                    best[i] = (float(detour), float(mileposts[lo + vertex]))
+
+        stations = [
+            {
+                "id": int(columns.pks[i]),
+                "station_id": columns.station_ids[i],
+                "name": columns.names[i],
+                "city": columns.cities[i],
+                "retail_price": float(columns.prices[i]),
+                "lat": float(columns.lats[i]),
+                "lon": float(columns.lons[i]),
+                "milepost": milepost,
+                "detour_miles": detour,
+            }
+            for i, (detour, milepost) in best.items()
+        ]
+        stations.sort(key=lambda s: s["milepost"])
+        return stations
+
+    def cheapest_near(
+        self, lat: float, lon: float, radius_miles: float = 50
+    ) -> Optional[Dict]:
+        columns = self.columns
+        candidates, distances = self.within(lat, lon, radius_miles, columns)
+        if not len(candidates):
+            return None
+
+        best = np.lexsort((distances, columns.prices[candidates]))[0]
+        i = int(candidates[best])
+        return {
+            "id": int(columns.pks[i]),
+            "station_id": columns.station_ids[i],
+            "name": columns.names[i],
+            "city": columns.cities[i],
+            "retail_price": float(columns.prices[i]),
+            "distance_miles": float(distances[best]),
+            "lat": float(columns.lats[i]),
+            "lon": float(columns.lons[i]),
+        }
+
+
+station_index = StationIndex()
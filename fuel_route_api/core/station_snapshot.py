@@ -0,0 +1,224 @@
+import threading
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from fuel_route_api.core.cache_dependencies import SyncCacheDependencies
+from fuel_route_api.core.env import (
+    STATION_SNAPSHOT_CHECK_SECONDS,
+    STATION_SNAPSHOT_TTL_SECONDS,
+)
+from fuel_route_api.core.log import logger
+from fuel_route_api.core.price_version import get_price_version
+
+SNAPSHOT_PREFIX = "station_snapshot"
+TEXT_COLUMNS = ("opis_ids", "names", "addresses", "cities", "states", "rack_ids")
+
+
+class StationSnapshot:
+    # Every station as parallel columns ordered by id. Numbers are numpy
+    # arrays (prices as integer thousandths, exact for decimal_places=3) and
+    # text columns plain lists, so the cached form is a few byte strings and
+    # lists rather than thousands of pickled model instances.
+
+    def __init__(
+        self, version, ids, opis_ids, names, addresses, cities, states, rack_ids,
+        prices, lats, lons,
+    ):
+        self.version = version
+        self.ids = ids
+        self.opis_ids = opis_ids
+        self.names = names
+        self.addresses = addresses
+        self.cities = cities
+        self.states = states
+        self.rack_ids = rack_ids
+        self.prices = prices
+        self.lats = lats
+        self.lons = lons
+        self._state_array = np.asarray(states, dtype="<U2")
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def from_rows(cls, version: int, rows) -> "StationSnapshot":
+        # rows: (id, opis id, name, address, city, state, rack id, price, lat, lon)
+        rows = sorted(rows, key=lambda r: r[0])
+        columns = list(zip(*rows)) or [()] * 10
+        ids, opis_ids, names, addresses, cities, states, rack_ids, prices, lats, lons = columns
+        return cls(
+            version,
+            np.asarray(ids, dtype=np.int64),
+            [str(v) for v in opis_ids],
+            list(names),
+            list(addresses),
+            list(cities),
+            list(states),
+            [str(v) for v in rack_ids],
+            np.asarray(
+                [int(round(Decimal(p) * 1000)) for p in prices], dtype=np.int32
+            ),
+            np.asarray([np.nan if v is None else v for v in lats], dtype=np.float64),
+            np.asarray([np.nan if v is None else v for v in lons], dtype=np.float64),
+        )
+
+    def to_payload(self) -> Dict:
+        payload = {
+            "version": self.version,
+            "ids": self.ids.astype("<i8").tobytes(),
+            "prices": self.prices.astype("<i4").tobytes(),
+            "lats": self.lats.astype("<f8").tobytes(),
+            "lons": self.lons.astype("<f8").tobytes(),
+        }
+        for name in TEXT_COLUMNS:
+            payload[name] = list(getattr(self, name))
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> "StationSnapshot":
+        return cls(
+            payload["version"],
+            np.frombuffer(payload["ids"], dtype="<i8"),
+            *(payload[name] for name in TEXT_COLUMNS),
+            np.frombuffer(payload["prices"], dtype="<i4"),
+            np.frombuffer(payload["lats"], dtype="<f8"),
+            np.frombuffer(payload["lons"], dtype="<f8"),
+        )
+
+    def select(
+        self,
+        state: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> "StationSelection":
+        mask = np.ones(len(self), dtype=bool)
+        if state:
+            mask &= self._state_array == state.upper()
+        if min_price is not None:
+            mask &= self.prices >= round(min_price * 1000)
+        if max_price is not None:
+            mask &= self.prices <= round(max_price * 1000)
+        return StationSelection(self, np.flatnonzero(mask))
+
+    def row(self, i: int) -> Dict:
+        lat, lon = float(self.lats[i]), float(self.lons[i])
+        return {
+            "id": int(self.ids[i]),
+            "opis_truckstop_id": self.opis_ids[i],
+            "truckstop_name": self.names[i],
+            "address": self.addresses[i],
+            "city": self.cities[i],
+            "state": self.states[i],
+            "rack_id": self.rack_ids[i],
+            "retail_price": Decimal(int(self.prices[i])).scaleb(-3),
+            "latitude": None if np.isnan(lat) else lat,
+            "longitude": None if np.isnan(lon) else lon,
+        }
+
+
+class StationSelection:
+    # Row positions into a snapshot. len() and slicing are all CustomPagination
+    # needs, and only the rows on the requested page are materialized.
+
+    def __init__(self, snapshot: StationSnapshot, indices: np.ndarray):
+        self.snapshot = snapshot
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def count(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self.snapshot.row(int(i)) for i in self.indices[item]]
+        return self.snapshot.row(int(self.indices[item]))
+
+    def __iter__(self):
+        return (self.snapshot.row(int(i)) for i in self.indices)
+
+
+class StationSnapshotStore:
+    # One snapshot per price version, built from the DB by the first process
+    # that needs it and shared through the cache. Each process keeps the
+    # decoded copy and only re-reads the price version every check interval,
+    # so a page request normally touches neither Redis nor the DB.
+
+    def __init__(
+        self,
+        cache_deps: Optional[SyncCacheDependencies] = None,
+        ttl: int = STATION_SNAPSHOT_TTL_SECONDS,
+        check_interval: float = STATION_SNAPSHOT_CHECK_SECONDS,
+    ):
+        self.cache_deps = cache_deps or SyncCacheDependencies()
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.snapshot: Optional[StationSnapshot] = None
+        self.checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(version: int) -> str:
+        return f"{SNAPSHOT_PREFIX}:p{version}"
+
+    def is_fresh(self) -> bool:
+        return (
+            self.snapshot is not None
+            and time.monotonic() - self.checked_at < self.check_interval
+        )
+
+    def invalidate(self):
+        self.checked_at = 0.0
+
+    def get(self) -> StationSnapshot:
+        if self.is_fresh():
+            return self.snapshot
+        with self._lock:
+            if self.is_fresh():
+                return self.snapshot
+            version = get_price_version()
+            if self.snapshot is None or self.snapshot.version != version:
+                self.snapshot = self._load(version)
+            self.checked_at = time.monotonic()
+            return self.snapshot
+
+    def _load(self, version: int) -> StationSnapshot:
+        key = self.key(version)
+        payload = self.cache_deps.get_from_cache(key)
+        if payload is not None:
+            return StationSnapshot.from_payload(payload)
+
+        snapshot = StationSnapshot.from_rows(version, self._load_rows())
+        self.cache_deps.set_from_cache(key, snapshot.to_payload(), timeout=self.ttl)
+        logger.info(f"Station snapshot built: {len(snapshot)} stations (version {version})")
+        return snapshot
+
+    def _load_rows(self) -> List[tuple]:
+        from fuel_route_api.models.models import FuelStation
+
+        return [
+            (
+                pk, opis_id, name, address, city, state, rack_id, price,
+                loc.y if loc else None,
+                loc.x if loc else None,
+            )
+            for pk, opis_id, name, address, city, state, rack_id, price, loc
+            in FuelStation.objects.values_list(
+                "id",
+                "opis_truckstop_id",
+                "truckstop_name",
+                "address",
+                "city",
+                "state",
+                "rack_id",
+                "retail_price",
+                "location",
+            )
+        ]
+
+
+station_snapshot = StationSnapshotStore()
@@ -1,32 +1,52 @@
+import asyncio
 import os
-import re
 
 import pandas as pd
 from asgiref.sync import sync_to_async
 from django.contrib.gis.geos import Point
 from django.core.cache import cache
+from fuel_route_api.core.address import clean_address
+from fuel_route_api.core.gazetteer import gazetteer
+from fuel_route_api.core.log import logger
+from fuel_route_api.core.price_version import bump_price_version
+from fuel_route_api.core.station_index import station_index
+from fuel_route_api.core.station_snapshot import station_snapshot
 from fuel_route_api.models.models import FuelStation
 from fuel_route_api.schema.schema import GeocodeInputSchema
 from fuel_route_api.services.tomtom_service import TomTomService
 from fuel_route_api.services.geoapify_service import GeoapifyServiceAsync
 
+UPSERT_FIELDS = [
+    "truckstop_name",
+    "address",
+    "city",
+    "state",
+    "rack_id",
+    "retail_price",
+    "location",
+]
+
 
 class FuelStationLoader:
     def __init__(
         self,
         csv_path="fuel_route_api/fuel_prices.csv",
         marker_path="fuel_station_loaded.marker",
+        nrows=None,
+        concurrency=16,
+        batch_size=250,
+        offline=False,
     ):
         self.csv_path = csv_path
         self.marker_path = marker_path
+        self.nrows = nrows
+        self.batch_size = batch_size
+        self.offline = offline
+        self.semaphore = asyncio.Semaphore(concurrency)
         self.route_service = TomTomService()
 
     def clean_address(self, address: str) -> str:
-        if not address:
-            return ""
-        address = re.sub(r"EXIT\s*\d+", "", address, flags=re.IGNORECASE)
-        address = address.replace("&", "and").replace(",", "")
-        return address.strip()
+        return clean_address(address)
 
     def is_already_loaded(self):
         return os.path.exists(self.marker_path)
@@ -35,31 +55,84 @@ class FuelStationLoader:
         with open(self.marker_path, "w") as f:
             f.write("loaded")
 
-    async def geocode_and_save(self, row):
+    async def resolve(self, row):
+        # Offline mode places every station at its city centroid without
+        # touching the provider; a later online load refines the locations.
+        centroid = gazetteer.lookup(row["City"], row["State"])
+        if self.offline:
+            if centroid is None:
+                raise ValueError(f"{row['City']}, {row['State']} not in gazetteer")
+            return centroid
+
         cleaned_address = self.clean_address(row["Address"])
         geocode_input = GeocodeInputSchema(
             address=cleaned_address, city=row["City"], state=row["State"]
         )
-        try:
-            result = await self.route_service.geocode_address(geocode_input)
-        except Exception:
-            geocode_input.address = ""
-            result = await self.route_service.geocode_address(geocode_input)
+        async with self.semaphore:
+            try:
+                result = await self.route_service.geocode_address(geocode_input)
+                return result.lat, result.lon
+            except Exception:
+                if centroid is not None:
+                    return centroid
+                geocode_input.address = ""
+                result = await self.route_service.geocode_address(geocode_input)
+                return result.lat, result.lon
 
-        location = Point(float(result.lon), float(result.lat))
-        await sync_to_async(FuelStation.objects.update_or_create)(
+    async def geocode(self, row):
+        lat, lon = await self.resolve(row)
+        return FuelStation(
             opis_truckstop_id=row["OPIS Truckstop ID"],
-            defaults={
-                "truckstop_name": row["Truckstop Name"],
-                "address": row["Address"],
-                "city": row["City"],
-                "state": row["State"],
-                "rack_id": row["Rack ID"],
-                "retail_price": row["Retail Price"],
-                "location": location,
-            },
+            truckstop_name=row["Truckstop Name"],
+            address=row["Address"],
+            city=row["City"],
+            state=row["State"],
+            rack_id=row["Rack ID"],
+            retail_price=row["Retail Price"],
+            location=Point(float(lon), float(lat)),
         )
 
+    async def save_batch(self, stations):
+        await sync_to_async(FuelStation.objects.bulk_create)(
+            stations,
+            update_conflicts=True,
+            unique_fields=["opis_truckstop_id"],
+            update_fields=UPSERT_FIELDS,
+        )
+
+    async def geocode_and_save(self, row):
+        await self.save_batch([await self.geocode(row)])
+
+    async def load_rows(self, rows):
+        saved = failed = 0
+        total = len(rows)
+        for start in range(0, total, self.batch_size):
+            batch = rows[start : start + self.batch_size]
+            results = await asyncio.gather(
+                *(self.geocode(row) for row in batch), return_exceptions=True
+            )
+
+            stations = []
+            for row, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    failed += 1
+                    logger.warning(
+                        f"Geocoding failed for station {row['OPIS Truckstop ID']}: {result}"
+                    )
+                else:
+                    stations.append(result)
+
+            if stations:
+                await self.save_batch(stations)
+                saved += len(stations)
+
+            cache.set("fuel_stations_loading", True, timeout=300)
+            logger.info(
+                f"Fuel station load: {min(start + len(batch), total)}/{total} rows, "
+                f"{saved} saved, {failed} failed"
+            )
+        return saved, failed
+
     async def async_load(self):
         if self.is_already_loaded():
             return "Fuel stations already loaded. Skipping..."
@@ -69,13 +142,19 @@ class FuelStationLoader:
 
         cache.set("fuel_stations_loading", True, timeout=300)
         try:
-            df = pd.read_csv(self.csv_path, nrows=320)
+            df = pd.read_csv(self.csv_path, nrows=self.nrows)
+            # Later rows win, as they did with per-row update_or_create.
+            df = df.drop_duplicates(subset="OPIS Truckstop ID", keep="last")
+
+            saved, failed = await self.load_rows(df.to_dict("records"))
 
-            for _, row in df.iterrows():
-                await self.geocode_and_save(row)
+            # bulk_create skips post_save, so publish the new prices here.
+            await sync_to_async(bump_price_version)()
+            station_index.invalidate()
+            station_snapshot.invalidate()
 
             self.mark_as_loaded()
-            return "Fuel stations loaded"
+            return f"Fuel stations loaded: {saved} saved, {failed} failed"
         except Exception as e:
             return f"Error: {str(e)}"
         finally:
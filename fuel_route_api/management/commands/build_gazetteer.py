@@ -0,0 +1,62 @@
+import re
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+
+from fuel_route_api.core.env import GAZETTEER_PATH
+from fuel_route_api.core.gazetteer import Gazetteer
+from fuel_route_api.models.models import FuelStation
+
+# Census place names carry their legal/statistical area type as a suffix,
+# e.g. "Big Cabin town" or "Tomah city".
+LSAD_SUFFIX = re.compile(
+    r"\s+(city and borough|consolidated government.*|unified government.*|"
+    r"metropolitan government.*|urban county|city|town|village|borough|CDP|"
+    r"municipality|comunidad|zona urbana)$",
+    flags=re.IGNORECASE,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the offline city/state gazetteer from a US Census Gazetteer "
+        "places file, or from already geocoded fuel stations."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "source",
+            nargs="?",
+            help="Census Gazetteer places file (e.g. 2024_Gaz_place_national.txt).",
+        )
+        parser.add_argument(
+            "--from-stations",
+            action="store_true",
+            help="Average geocoded FuelStation locations per city/state.",
+        )
+        parser.add_argument("--output", default=GAZETTEER_PATH)
+
+    def census_places(self, source):
+        df = pd.read_csv(source, sep="\t", dtype=str)
+        df.columns = [c.strip() for c in df.columns]
+        for state, name, lat, lon in df[
+            ["USPS", "NAME", "INTPTLAT", "INTPTLONG"]
+        ].itertuples(index=False):
+            yield LSAD_SUFFIX.sub("", name), state, float(lat), float(lon)
+
+    def station_places(self):
+        for city, state, location in FuelStation.objects.exclude(
+            location__isnull=True
+        ).values_list("city", "state", "location"):
+            yield city, state, location.y, location.x
+
+    def handle(self, *args, **options):
+        if options["from_stations"]:
+            places = self.station_places()
+        elif options["source"]:
+            places = self.census_places(options["source"])
+        else:
+            raise CommandError("Pass a Census places file or --from-stations.")
+
+        count = Gazetteer.write(options["output"], places)
+        self.stdout.write(f"Wrote {count} places to {options['output']}")
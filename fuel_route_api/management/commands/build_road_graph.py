@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from fuel_route_api.core.env import ROAD_GRAPH_PATH
+from fuel_route_api.core.road_graph import RoadGraph
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the local routing graph and its ALT landmark index from an "
+        "OSM-derived edge list CSV."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("edge_list")
+        parser.add_argument("--output", default=ROAD_GRAPH_PATH or "road_graph.npz")
+        parser.add_argument("--landmarks", type=int, default=8)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        graph = RoadGraph.from_edge_list(options["edge_list"])
+        self.stdout.write(
+            f"Loaded {len(graph)} nodes, {len(graph.edges[0])} directed edges"
+        )
+        graph.build_landmarks(options["landmarks"])
+        graph.save(options["output"])
+        self.stdout.write(
+            f"Wrote {options['output']} with {len(graph.landmarks)} landmarks "
+            f"in {time.perf_counter() - started:.1f}s"
+        )
@@ -0,0 +1,59 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from fuel_route_api.services.metrics_service import MetricsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Print cache hit rates, latency and payload sizes per key namespace, "
+        "merged across every process that reported recently."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--json", action="store_true", help="Print the raw report.")
+
+    def handle(self, *args, **options):
+        metrics = MetricsService().sync_cache_metrics()
+        if options["json"]:
+            self.stdout.write(json.dumps(metrics, indent=2))
+            return
+
+        self.stdout.write(f"{metrics['processes']} process(es) reporting")
+        self.stdout.write(
+            f"{'namespace':>16} {'lookups':>9} {'hit rate':>9} {'local':>8} "
+            f"{'writes':>8} {'get p95 ms':>11} {'set p95 ms':>11} {'p50 size':>10} {'p99 size':>10}"
+        )
+        for namespace, stats in metrics["namespaces"].items():
+            size = stats["payload_size"]
+            self.stdout.write(
+                f"{namespace:>16} {stats['lookups']:>9} {stats['hit_rate']:>9.2%} "
+                f"{stats['local_hits']:>8} {stats['writes']:>8} "
+                f"{_fmt(stats['latency']['get']['p95_ms']):>11} "
+                f"{_fmt(stats['latency']['write']['p95_ms']):>11} "
+                f"{_bytes(size['p50_bytes']):>10} {_bytes(size['p99_bytes']):>10}"
+            )
+
+        geocode = metrics["geocode"]
+        self.stdout.write(
+            f"geocode: {geocode['lookups']} lookups, {geocode['hit_rate']:.2%} hit rate"
+        )
+        for name, latency in metrics["providers"].items():
+            self.stdout.write(
+                f"provider {name}: {latency['count']} calls, p95 {latency['p95_ms']} ms"
+            )
+
+
+def _fmt(value):
+    return "-" if value is None else f"{value:.3f}"
+
+
+def _bytes(value):
+    if value is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}"
+        value /= 1024
+    return f"{value:.0f} GB"
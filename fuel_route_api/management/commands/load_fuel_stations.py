@@ -0,0 +1,40 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from fuel_route_api.loaders.fuel_station_loader import FuelStationLoader
+
+
+class Command(BaseCommand):
+    help = "Geocode and upsert fuel stations from the OPIS price CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "csv_path", nargs="?", default="fuel_route_api/fuel_prices.csv"
+        )
+        parser.add_argument("--nrows", type=int, default=None)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--batch-size", type=int, default=250)
+        parser.add_argument(
+            "--offline",
+            action="store_true",
+            help="Place stations at gazetteer city centroids without a provider.",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Reload even if the loaded marker file exists.",
+        )
+
+    def handle(self, *args, **options):
+        loader = FuelStationLoader(
+            csv_path=options["csv_path"],
+            nrows=options["nrows"],
+            concurrency=options["concurrency"],
+            batch_size=options["batch_size"],
+            offline=options["offline"],
+        )
+        if options["force"]:
+            loader.is_already_loaded = lambda: False
+
+        self.stdout.write(asyncio.run(loader.async_load()))
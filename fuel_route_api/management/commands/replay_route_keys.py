@@ -0,0 +1,51 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from fuel_route_api.core.quantize import EndpointSnapper, replay_hit_rate
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay a route request log (JSON lines of request bodies with "
+        "start_lat/start_lon/finish_lat/finish_lon) and compare route cache "
+        "hit rates across endpoint snapping precisions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("log_path")
+        parser.add_argument("--precisions", default="2,3,4,5")
+        parser.add_argument("--geohash-lengths", default="6,7,8")
+        parser.add_argument(
+            "--capacity",
+            type=int,
+            default=0,
+            help="Simulated cache size in keys; 0 means unbounded.",
+        )
+
+    def handle(self, *args, **options):
+        with open(options["log_path"]) as f:
+            requests = [json.loads(line) for line in f if line.strip()]
+
+        snappers = [("raw", EndpointSnapper(mode="off"))]
+        snappers += [
+            (f"grid {p}", EndpointSnapper(mode="grid", precision=int(p)))
+            for p in options["precisions"].split(",")
+            if p
+        ]
+        snappers += [
+            (f"geohash {n}", EndpointSnapper(mode="geohash", geohash_length=int(n)))
+            for n in options["geohash_lengths"].split(",")
+            if n
+        ]
+
+        self.stdout.write(
+            f"{'snapping':>12} {'hit rate':>9} {'keys':>8} "
+            f"{'p50 err m':>10} {'max err m':>10}"
+        )
+        for name, snapper in snappers:
+            stats = replay_hit_rate(requests, snapper, options["capacity"])
+            self.stdout.write(
+                f"{name:>12} {stats['hit_rate']:>9.2%} {stats['distinct_keys']:>8} "
+                f"{stats['p50_snap_error_m']:>10.1f} {stats['max_snap_error_m']:>10.1f}"
+            )
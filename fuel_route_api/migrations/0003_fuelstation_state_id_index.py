@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-17 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('fuel_route_api', '0002_geocodecache'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='fuelstation',
+            index=models.Index(fields=['state', 'id'], name='fuelstation_state_id'),
+        ),
+    ]
@@ -40,5 +40,19 @@ class FuelStation(models.Model):
                 fields=["location"],
                 name="fuelstation_location_gist",
                 opclasses=["gist"],
-            )
+            ),
+            # Keyset pages filtered by state walk this in id order.
+            models.Index(fields=["state", "id"], name="fuelstation_state_id"),
         ]
+
+
+class GeocodeCache(models.Model):
+    normalized_address = models.CharField(max_length=512, unique=True)
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    provider = models.CharField(max_length=32)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.normalized_address} ({self.latitude}, {self.longitude})"
@@ -1,8 +1,14 @@
+from typing import Optional
+
 from injector import inject
 from ninja_extra import api_controller, http_get, paginate, permissions, throttle
 
-from fuel_route_api.models.models import FuelStation
-from fuel_route_api.core.pagination import CustomPaginatedOutput, CustomPagination
+from fuel_route_api.core.pagination import (
+    CustomPaginatedOutput,
+    CustomPagination,
+    KeysetPaginatedOutput,
+    KeysetPagination,
+)
 from fuel_route_api.schema.schema import AvaliableRouteSchema
 from fuel_route_api.core.throttling import CustomAnonRateThrottle, CustomUserThrottle
 from fuel_route_api.services.fuel_routes_service import FuelRoutesService
@@ -21,5 +27,28 @@ class FuelRoutes:
         permissions=[permissions.IsAuthenticated],
     )
     @paginate(CustomPagination)
-    async def route_list(self):
-        return await self.fuel_lists_service.route_list()
+    async def route_list(
+        self,
+        state: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ):
+        return await self.fuel_lists_service.route_list(
+            state=state, min_price=min_price, max_price=max_price
+        )
+
+    @http_get(
+        "/v2/avaliable/routes/cursor",
+        response=KeysetPaginatedOutput[AvaliableRouteSchema],
+        permissions=[permissions.IsAuthenticated],
+    )
+    @paginate(KeysetPagination)
+    async def route_cursor_list(
+        self,
+        state: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ):
+        return self.fuel_lists_service.station_queryset(
+            state=state, min_price=min_price, max_price=max_price
+        )
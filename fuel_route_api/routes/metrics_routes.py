@@ -0,0 +1,16 @@
+from injector import inject
+from ninja_extra import api_controller, http_get
+from ninja_extra.permissions import IsAdminUser
+
+from fuel_route_api.services.metrics_service import MetricsService
+
+
+@api_controller("/metrics", tags=["Metrics"])
+class MetricsController:
+    @inject
+    def __init__(self):
+        self.metrics_service = MetricsService()
+
+    @http_get("/cache", permissions=[IsAdminUser])
+    async def cache_metrics(self):
+        return await self.metrics_service.cache_metrics()
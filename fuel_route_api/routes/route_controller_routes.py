@@ -1,3 +1,5 @@
+from typing import Literal
+
 from injector import inject
 from ninja_extra import api_controller, http_get, http_post, throttle
 from ninja_extra.permissions import IsAuthenticated
@@ -20,10 +22,22 @@ class RouteController:
     async def calculate(self, data: RouteRequest):
         return await self.route_controller_service.calculate(data=data)
 
+    @http_get("/route/result/{cache_key}", permissions=[IsAuthenticated])
+    async def get_route_result(
+        self, cache_key: str, format: Literal["points", "polyline"] = "points"
+    ):
+        return await self.route_controller_service.get_route_result(
+            cache_key=cache_key, format=format
+        )
+
     @http_get("/route/summary/result/{cache_key}", permissions=[IsAuthenticated])
     async def get_route_summary(self,  cache_key: str):
         return await self.route_controller_service.get_route_summary(cache_key=cache_key)
 
     @http_get("/route/geometry/result/{cache_key}", permissions=[IsAuthenticated])
-    async def get_route_geometry(self,  cache_key: str):
-        return await self.route_controller_service.get_route_geometry(cache_key=cache_key)
+    async def get_route_geometry(
+        self, cache_key: str, format: Literal["points", "polyline"] = "points"
+    ):
+        return await self.route_controller_service.get_route_geometry(
+            cache_key=cache_key, format=format
+        )
@@ -1,6 +1,6 @@
 import re
 from decimal import Decimal
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Literal, Optional
 
 from ninja import Schema
 from pydantic import (
@@ -262,6 +262,10 @@ class RouteRequest(Schema):
     start_lon: float
     finish_lat: float
     finish_lon: float
+    planner: Literal["sampled", "min_cost"] = "sampled"
+    mpg: float = Field(30.0, gt=0)
+    tank_capacity_gallons: Optional[float] = Field(None, gt=0)
+    start_fuel_gallons: Optional[float] = Field(None, ge=0)
 
 
 class CalculateRoutePoint(Schema):
@@ -280,6 +284,9 @@ class CalculateFuelStop(Schema):
     retail_price: float
     distance_from_route_miles: float
     location: CalculateFuelStopLocation
+    milepost: float | None = None
+    gallons: float | None = None
+    cost: float | None = None
 
 
 class RouteResponse(Schema):
@@ -290,6 +297,7 @@ class RouteResponse(Schema):
     number_of_stops: int
     average_price: float | None = None
     gallons_needed: float | None = None
+    gallons_purchased: float | None = None
     success: bool
 
 
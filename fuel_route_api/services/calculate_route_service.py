@@ -3,10 +3,12 @@ from fuel_route_api.core.cache_dependencies import (
     CacheKeyDependencies,
 )
 
+from fuel_route_api.core.quantize import snapper
 from fuel_route_api.core.repo_dependencies import CRUDDependencies
 
 from .fuel_stop_service import FuelStopService
 from .geoapify_service import GeoapifyServiceAsync
+from .routing_service import RoutingService
 
 
 class CalculateRouteService:
@@ -16,13 +18,12 @@ class CalculateRouteService:
         self.cache_key_deps = CacheKeyDependencies()
         self.crud_deps = CRUDDependencies()
         self.geoapify_service = GeoapifyServiceAsync()
+        self.routing_service = RoutingService()
         self.fuel_service = FuelStopService()
 
     async def fetch_route_data(self, coord):
         
-        route_data = await self.geoapify_service.get_geoapify_route(
-            coord, mapbox_format=False
-        )
+        route_data = await self.routing_service.get_route(coord)
 
         summary = route_data["routes"][0]["summary"]
         distance_m = summary.get("lengthInMeters", 0)
@@ -66,9 +67,7 @@ class CalculateRouteService:
                 raise ValueError(
                     "Invalid finish coordinates (not within USA bounds).")
 
-            route_data = await self.geoapify_service.get_geoapify_route(
-                data, mapbox_format=False
-            )
+            route_data = await self.routing_service.get_route(data)
 
             route_points = [
                 {"latitude": p["latitude"], "longitude": p["longitude"]}
@@ -78,14 +77,27 @@ class CalculateRouteService:
                 route_data["routes"][0]["summary"]["lengthInMeters"] / 1609.34
             )
 
-            fuel_stops = await self.fuel_service.find_optimal_fuel_stops(route_points)
-
-            total_fuel_cost = await self.fuel_service.calculate_fuel_cost(
-                total_distance_miles, fuel_stops
-            )
-            cost_summary = await self.fuel_service.calculate_fuel_costs(
-                total_distance_miles, fuel_stops
-            )
+            if data.planner == "min_cost":
+                cost_summary = await self.fuel_service.find_min_cost_fuel_stops(
+                    route_points,
+                    total_distance_miles,
+                    tank_capacity_gallons=data.tank_capacity_gallons,
+                    mpg=data.mpg,
+                    start_fuel_gallons=data.start_fuel_gallons,
+                )
+                fuel_stops = cost_summary["fuel_stops"]
+                total_fuel_cost = cost_summary["total_cost"]
+            else:
+                fuel_stops = await self.fuel_service.find_optimal_fuel_stops(
+                    route_points
+                )
+
+                total_fuel_cost = await self.fuel_service.calculate_fuel_cost(
+                    total_distance_miles, fuel_stops
+                )
+                cost_summary = await self.fuel_service.calculate_fuel_costs(
+                    total_distance_miles, fuel_stops
+                )
 
             result = {
                 "route": route_points,
@@ -95,6 +107,10 @@ class CalculateRouteService:
                 "number_of_stops": cost_summary["number_of_stops"],
                 "average_price": cost_summary["average_price"],
                 "gallons_needed": cost_summary["gallons_needed"],
+                "gallons_purchased": cost_summary.get("gallons_purchased"),
+                "planner": cost_summary.get("planner", data.planner),
+            "infeasible": cost_summary.get("infeasible"),
+                "snap_error_meters": snapper.snap_endpoints(data.dict())[1],
                 "success": True,
             }
 
@@ -1,25 +1,59 @@
-from fuel_route_api.core.cache_dependencies import (
-    AsyncCacheDependencies,
-    CacheKeyDependencies,
-)
-from fuel_route_api.core.repo_dependencies import CRUDDependencies
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
 from injector import inject
+
+from fuel_route_api.core.station_snapshot import StationSelection, station_snapshot
 from fuel_route_api.models.models import FuelStation
 
+PRICE_STEP = Decimal("0.001")
+
+
+def price_bound(price: float, rounding: str) -> Decimal:
+    # Prices are stored to 0.001, so a bound snapped onto that grid (up for
+    # a minimum, down for a maximum) selects the same rows, and the query,
+    # which keys the cached count, takes one form per grid value.
+    return Decimal(str(price)).quantize(PRICE_STEP, rounding=rounding)
+
 
 class FuelRoutesService:
     @inject
     def __init__(self):
-        self.cache_deps = AsyncCacheDependencies()
-        self.cache_key_deps = CacheKeyDependencies()
-        self.deps = CRUDDependencies()
-
-    async def route_list(self):
-        deps = self.deps
-        cache_deps = self.cache_deps
-        cache_key = "route_list"
-        stations = await cache_deps.get_from_cache(cache_key)
-        if not stations:
-            stations = await deps.get_lists(model=FuelStation)
-            await cache_deps.set_from_cache(cache_key, stations)
-        return stations
+        self.snapshot_store = station_snapshot
+
+    async def route_list(
+        self,
+        state: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> StationSelection:
+        store = self.snapshot_store
+        # The decoded snapshot is kept in process; the thread hop is only
+        # needed when the price version has to be re-checked.
+        if store.is_fresh():
+            snapshot = store.snapshot
+        else:
+            snapshot = await sync_to_async(store.get)()
+        return snapshot.select(state=state, min_price=min_price, max_price=max_price)
+
+    def station_queryset(
+        self,
+        state: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> QuerySet:
+        # Left lazy so KeysetPagination can add the cursor and LIMIT.
+        queryset = FuelStation.objects.all()
+        if state:
+            queryset = queryset.filter(state=state.upper())
+        if min_price is not None:
+            queryset = queryset.filter(
+                retail_price__gte=price_bound(min_price, ROUND_CEILING)
+            )
+        if max_price is not None:
+            queryset = queryset.filter(
+                retail_price__lte=price_bound(max_price, ROUND_FLOOR)
+            )
+        return queryset
@@ -1,18 +1,91 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from asgiref.sync import sync_to_async
-from django.contrib.gis.db.models.functions import Distance
-from django.contrib.gis.geos import LineString, Point
-from django.contrib.gis.measure import D
-from django.db import DatabaseError
+from django.contrib.gis.geos import LineString
+from django.db import DatabaseError, connection
 from injector import inject
 
 from fuel_route_api.core.cache_dependencies import (AsyncCacheDependencies,
                                                     CacheKeyDependencies,
                                                     SyncCacheDependencies)
 from fuel_route_api.core.log import logger
+from fuel_route_api.core.refuel_solver import RefuelInfeasible, plan_refuel
+from fuel_route_api.core.route_geometry import (cumulative_miles, resample,
+                                                 route_arrays)
+from fuel_route_api.core.single_flight import fuel_stop_flight
+from fuel_route_api.core.stale_cache import AsyncStaleCache, SyncStaleCache
+from fuel_route_api.core.station_index import station_index
 from fuel_route_api.models.models import FuelStation
 
+FUEL_EFFICIENCY_MPG = 30.0
+VEHICLE_RANGE_MILES = 500
+METERS_PER_MILE = 1609.344
+CURRENT_STOPS_SOFT_TTL = 1800
+FUEL_PLAN_SOFT_TTL = 3600
+
+CORRIDOR_SQL = """
+    WITH route AS (
+        SELECT geom, geom::geography AS geog, ST_Length(geom::geography) AS length
+        FROM (SELECT ST_GeomFromEWKB(%(line)s) AS geom) AS line
+    )
+    SELECT
+        s.id,
+        s.opis_truckstop_id,
+        s.truckstop_name,
+        s.city,
+        s.retail_price,
+        ST_Y(s.location::geometry),
+        ST_X(s.location::geometry),
+        ST_LineLocatePoint(route.geom, s.location::geometry) * route.length
+            / %(meters_per_mile)s AS milepost,
+        ST_Distance(s.location, route.geog) / %(meters_per_mile)s AS detour_miles
+    FROM {table} AS s, route
+    WHERE ST_DWithin(s.location, route.geog, %(radius)s)
+    ORDER BY {order_by}
+"""
+
+
+def fetch_corridor_stations(
+    coords, corridor_miles: float, order_by: str = "milepost", limit=None
+) -> List[Dict]:
+    # One round trip for every station within corridor_miles of the route,
+    # linear-referenced onto it. coords are (lon, lat) pairs.
+    route_line = LineString(coords, srid=4326)
+    sql = CORRIDOR_SQL.format(
+        table=connection.ops.quote_name(FuelStation._meta.db_table),
+        order_by={
+            "milepost": "milepost",
+            "price": "s.retail_price, detour_miles",
+        }[order_by],
+    )
+    params = {
+        "line": bytes(route_line.ewkb),
+        "meters_per_mile": METERS_PER_MILE,
+        "radius": corridor_miles * METERS_PER_MILE,
+    }
+    if limit:
+        sql += " LIMIT %(limit)s"
+        params["limit"] = limit
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    return [
+        {
+            "id": pk,
+            "station_id": station_id,
+            "name": name,
+            "city": city,
+            "retail_price": float(price),
+            "lat": lat,
+            "lon": lon,
+            "milepost": milepost,
+            "detour_miles": detour,
+        }
+        for pk, station_id, name, city, price, lat, lon, milepost, detour in rows
+    ]
+
 
 class FuelStopService:
     @inject
@@ -22,6 +95,8 @@ class FuelStopService:
         self.cache_deps = AsyncCacheDependencies()
         self.cache_key_deps = CacheKeyDependencies()
         self.sync_cache_deps = SyncCacheDependencies()
+        self.stale_cache = AsyncStaleCache(self.cache_deps)
+        self.sync_stale_cache = SyncStaleCache(self.sync_cache_deps)
 
     async def find_current_optimal_fuel_stops(
         self, route_coords, vehicle_range_miles=500
@@ -31,135 +106,248 @@ class FuelStopService:
                 "type": "current",
                 "route_coords": route_coords,
                 "range": vehicle_range_miles,
-            }
+            },
+            namespace="fuel_stops",
+            price_versioned=True,
         )
 
-        cached = await self.cache_deps.get_from_cache(cache_key)
+        cached = await self.stale_cache.get(
+            cache_key,
+            lambda: self._refresh_current(cache_key, route_coords, vehicle_range_miles),
+        )
         if cached:
             logger.info(" Cache hit for current optimal stops")
             return cached
-        normalized_coords = [
-            (c["lon"], c["lat"]) if isinstance(c, dict) else tuple(c)
-            for c in route_coords
-        ]
-
-        route_line = LineString(normalized_coords, srid=4326)
+        return await self._refresh_current(cache_key, route_coords, vehicle_range_miles)
 
-        miles_to_degrees = vehicle_range_miles / 69.0
+    async def _refresh_current(self, cache_key, route_coords, vehicle_range_miles):
         try:
-            stations = await sync_to_async(list)(
-                FuelStation.objects.filter(
-                    location__distance_lte=(route_line, miles_to_degrees)
-                )
-                .only("truckstop_name", "city", "retail_price", "location")
-                .order_by("retail_price")[:10]
+            results = await sync_to_async(self._current_stops)(
+                route_coords, vehicle_range_miles
             )
         except DatabaseError as e:
             logger.error(f" DB Error while fetching optimal stops: {e}")
             return []
+        await self.stale_cache.set(cache_key, results, CURRENT_STOPS_SOFT_TTL)
+        return results
 
-        results = [
+    def _current_stops(self, route_coords, vehicle_range_miles) -> List[Dict]:
+        normalized_coords = [
+            (c["lon"], c["lat"]) if isinstance(c, dict) else tuple(c)
+            for c in route_coords
+        ]
+        stations = fetch_corridor_stations(
+            normalized_coords, vehicle_range_miles, order_by="price", limit=10
+        )
+        return [
             {
-                "name": s.truckstop_name,
-                "city": s.city,
-                "retail_price": float(s.retail_price),
-                "lat": s.latitude,
-                "lon": s.longitude,
+                "name": s["name"],
+                "city": s["city"],
+                "retail_price": s["retail_price"],
+                "lat": s["lat"],
+                "lon": s["lon"],
+                "milepost": round(s["milepost"], 2),
+                "detour_miles": round(s["detour_miles"], 2),
             }
-            for s in stations[:10]
+            for s in stations
         ]
-        await self.cache_deps.set_from_cache(cache_key, results, timeout=1800)
-        return results
+
+    def _sampled_fuel_stops(self, route_points: List[Dict]) -> List[Dict]:
+        fuel_stops: List[Dict] = []
+        if len(route_points) < 2:
+            return fuel_stops
+
+        seen_station_ids = set()
+        last_stop_mile = 0.0
+
+        lats, lons = route_arrays(route_points)
+        mileposts = cumulative_miles(lats, lons)
+        sample_lats, sample_lons, sample_miles = resample(
+            lats, lons, mileposts, mileposts[-1] / 10
+        )
+
+        for i in range(1, len(sample_miles)):
+            lat, lon = float(sample_lats[i]), float(sample_lons[i])
+
+            if (
+                sample_miles[i] - last_stop_mile >= VEHICLE_RANGE_MILES
+                or i == len(sample_miles) - 1
+            ):
+                cheapest = station_index.cheapest_near(lat, lon, radius_miles=50)
+
+                if cheapest:
+                    if cheapest["id"] not in seen_station_ids:
+                        fuel_stops.append(
+                            {
+                                "station_id": cheapest["station_id"],
+                                "name": cheapest["name"],
+                                "retail_price": cheapest["retail_price"],
+                                "distance_from_route_miles": round(
+                                    cheapest["distance_miles"], 2
+                                ),
+                                "location": {
+                                    "lat": cheapest["lat"],
+                                    "lon": cheapest["lon"],
+                                },
+                            }
+                        )
+                        seen_station_ids.add(cheapest["id"])
+                        last_stop_mile = float(sample_miles[i])
+
+                        if len(fuel_stops) >= 3:
+                            break
+                else:
+                    logger.warning(f"No fuel stations found near ({lat}, {lon})")
+
+        return fuel_stops
 
     async def find_optimal_fuel_stops(self, route_points: List[Dict]) -> List[Dict]:
 
-        cache_key = await self.cache_key_deps.generate_cache_key(route_points)
-        cached = await self.cache_deps.get_from_cache(cache_key)
+        cache_key = await self.cache_key_deps.generate_cache_key(
+            route_points, namespace="fuel_stops", price_versioned=True
+        )
+        cached = await self.stale_cache.get(
+            cache_key, lambda: self._plan_sampled(route_points, cache_key)
+        )
         if cached:
             logger.info(f" Cache hit for fuel stops: {cached} ")
             return cached
 
-        fuel_stops: List[Dict] = []
-        seen_station_ids = set()
-        total_distance = 0
-        last_stop_index = 0
+        return await fuel_stop_flight.do(
+            cache_key, lambda: self._plan_sampled(route_points, cache_key)
+        )
 
-        step = max(1, len(route_points) // 10)
-        sampled_points = route_points[::step] + [route_points[-1]]
+    async def _plan_sampled(self, route_points: List[Dict], cache_key: str) -> List[Dict]:
+        if not station_index.is_fresh():
+            try:
+                await sync_to_async(station_index.ensure_fresh)()
+            except DatabaseError as e:
+                logger.error(
+                    f" Station index refresh failed: {str(e)}", exc_info=True)
 
-        for i, point in enumerate(sampled_points):
-            if i == 0:
-                continue
+        fuel_stops = self._sampled_fuel_stops(route_points)
 
-            p1 = Point(
-                route_points[last_stop_index]["longitude"],
-                route_points[last_stop_index]["latitude"],
-                srid=4326,
+        await self.stale_cache.set(cache_key, fuel_stops, FUEL_PLAN_SOFT_TTL)
+        return fuel_stops
+
+    def _plan_min_cost(
+        self,
+        route_points: List[Dict],
+        total_distance_miles: float,
+        tank_capacity_gallons: Optional[float],
+        mpg: float,
+        start_fuel_gallons: Optional[float],
+        corridor_miles: float,
+    ) -> Dict:
+        tank_capacity_gallons = tank_capacity_gallons or VEHICLE_RANGE_MILES / mpg
+        lats, lons = route_arrays(route_points)
+        mileposts = cumulative_miles(lats, lons)
+        try:
+            candidates = fetch_corridor_stations(
+                list(zip(lons.tolist(), lats.tolist())), corridor_miles
             )
-            p2 = Point(point["longitude"], point["latitude"], srid=4326)
-            distance = p1.distance(p2) * 69
-            total_distance += distance
-
-            if total_distance >= 500 or i == len(sampled_points) - 1:
-                location = p2
-
-                try:
-                    def get_stations():
-                        return list(
-                            FuelStation.objects.filter(
-                                location__distance_lte=(location, D(mi=50))
-                            )
-                            .only(
-                                "opis_truckstop_id",
-                                "truckstop_name",
-                                "retail_price",
-                                "location",
-                            )
-                            .annotate(dist=Distance("location", location))
-                            .order_by("retail_price", "dist")[:1]
-                        )
-                    stations = await sync_to_async(get_stations)()
-                except DatabaseError as e:
-                    logger.error(
-                        f" Database query failed: {str(e)}", exc_info=True)
-                    continue
-
-                if stations:
-                    cheapest = stations[0]
-                    if cheapest.id not in seen_station_ids:
-                        stop_info = {
-                            "station_id": cheapest.opis_truckstop_id,
-                            "name": cheapest.truckstop_name,
-                            "retail_price": float(cheapest.retail_price),
-                            "distance_from_route_miles": round(cheapest.dist.mi, 2),
-                            "location": {
-                                "lat": cheapest.location.y,
-                                "lon": cheapest.location.x,
-                            },
-                        }
-                        fuel_stops.append(stop_info)
-
-                        seen_station_ids.add(cheapest.id)
-                        last_stop_index = (
-                            route_points.index(point)
-                            if point in route_points
-                            else last_stop_index
-                        )
-                        total_distance = 0
-                        if len(fuel_stops) >= 3:
-                            break
-                else:
-                    logger.warning(
-                        f"No fuel stations found near ({location.y}, {location.x})"
-                    )
+        except DatabaseError as e:
+            logger.error(
+                f"Corridor query failed, using station index: {str(e)}",
+                exc_info=True,
+            )
+            station_index.ensure_fresh()
+            candidates = station_index.corridor(lats, lons, mileposts, corridor_miles)
 
+        # Stretch geometric mileposts onto the provider's driving distance.
+        scale = total_distance_miles / mileposts[-1] if mileposts[-1] else 1.0
         try:
-            await self.cache_deps.set_from_cache(cache_key, fuel_stops, timeout=3600)
+            plan = plan_refuel(
+                [min(c["milepost"] * scale, total_distance_miles) for c in candidates],
+                [c["retail_price"] for c in candidates],
+                total_distance_miles,
+                tank_capacity_gallons,
+                mpg,
+                start_fuel_gallons,
+            )
+        except RefuelInfeasible as e:
+            # A gap between stations longer than the tank is a property of the
+            # route, not a failure: answer with the sampled plan and say so,
+            # so the result is cached and the caller stops polling.
+            logger.warning(f"Min-cost plan infeasible, using sampled stops: {str(e)}")
+            fuel_stops = self._sampled_fuel_stops(route_points)
+            return {
+                "fuel_stops": fuel_stops,
+                **self.sync_calculate_fuel_costs(total_distance_miles, fuel_stops),
+                "gallons_purchased": None,
+                "planner": "sampled",
+                "infeasible": str(e),
+            }
 
-        except Exception:
-            raise
+        fuel_stops = []
+        for stop in plan["stops"]:
+            station = candidates[stop["index"]]
+            fuel_stops.append(
+                {
+                    "station_id": station["station_id"],
+                    "name": station["name"],
+                    "retail_price": station["retail_price"],
+                    "distance_from_route_miles": round(station["detour_miles"], 2),
+                    "location": {"lat": station["lat"], "lon": station["lon"]},
+                    "milepost": round(stop["milepost"], 2),
+                    "gallons": round(stop["gallons"], 2),
+                    "cost": round(stop["cost"], 2),
+                }
+            )
 
-        return fuel_stops
+        gallons = plan["gallons_purchased"]
+        return {
+            "fuel_stops": fuel_stops,
+            "number_of_stops": len(fuel_stops),
+            "average_price": round(plan["total_cost"] / gallons, 2) if gallons else 0.0,
+            "gallons_needed": round(total_distance_miles / mpg, 2),
+            "gallons_purchased": round(gallons, 2),
+            "total_cost": round(plan["total_cost"], 2),
+            "planner": "min_cost",
+        }
+
+    async def find_min_cost_fuel_stops(
+        self,
+        route_points: List[Dict],
+        total_distance_miles: float,
+        tank_capacity_gallons: Optional[float] = None,
+        mpg: float = FUEL_EFFICIENCY_MPG,
+        start_fuel_gallons: Optional[float] = None,
+        corridor_miles: float = 10,
+    ) -> Dict:
+        cache_key = await self.cache_key_deps.generate_cache_key(
+            {
+                "type": "min_cost",
+                "route_points": route_points,
+                "distance": total_distance_miles,
+                "tank": tank_capacity_gallons,
+                "mpg": mpg,
+                "start_fuel": start_fuel_gallons,
+                "corridor": corridor_miles,
+            },
+            namespace="fuel_stops",
+            price_versioned=True,
+        )
+        params = (
+            route_points,
+            total_distance_miles,
+            tank_capacity_gallons,
+            mpg,
+            start_fuel_gallons,
+            corridor_miles,
+        )
+        cached = await self.stale_cache.get(
+            cache_key, lambda: self._refresh_min_cost(cache_key, *params)
+        )
+        if cached:
+            logger.info(" Cache hit for min-cost fuel plan")
+            return cached
+        return await self._refresh_min_cost(cache_key, *params)
+
+    async def _refresh_min_cost(self, cache_key: str, *params) -> Dict:
+        result = await sync_to_async(self._plan_min_cost)(*params)
+        await self.stale_cache.set(cache_key, result, FUEL_PLAN_SOFT_TTL)
+        return result
 
     async def calculate_fuel_cost(
         self, total_distance_miles: float, fuel_stops: List[Dict]
@@ -205,144 +393,113 @@ class FuelStopService:
                 "type": "current",
                 "route_coords": route_coords,
                 "range": vehicle_range_miles,
-            }
+            },
+            namespace="fuel_stops",
+            price_versioned=True,
         )
 
-        cached = self.sync_cache_deps.get_from_cache(cache_key)
+        cached = self.sync_stale_cache.get(
+            cache_key,
+            "refresh_stale_fuel_stops",
+            {
+                "planner": "current",
+                "params": {
+                    "route_coords": route_coords,
+                    "vehicle_range_miles": vehicle_range_miles,
+                },
+            },
+        )
         if cached:
             logger.info("Cache hit for current optimal stops")
             return cached
 
-        normalized_coords = [
-            (c["lon"], c["lat"]) if isinstance(c, dict) else tuple(c)
-            for c in route_coords
-        ]
-
-        route_line = LineString(normalized_coords, srid=4326)
-        miles_to_degrees = vehicle_range_miles / 69.0
+        return self.sync_refresh_current(cache_key, route_coords, vehicle_range_miles)
 
+    def sync_refresh_current(self, cache_key, route_coords, vehicle_range_miles):
         try:
-            stations = list(
-                FuelStation.objects.filter(
-                    location__distance_lte=(route_line, miles_to_degrees)
-                )
-                .only("truckstop_name", "city", "retail_price", "location")
-                .order_by("retail_price")[:10]
-            )
+            results = self._current_stops(route_coords, vehicle_range_miles)
         except DatabaseError as e:
             logger.error(f"DB Error while fetching optimal stops: {e}")
             return []
 
-        results = [
-            {
-                "name": s.truckstop_name,
-                "city": s.city,
-                "retail_price": float(s.retail_price),
-                "lat": s.latitude,
-                "lon": s.longitude,
-            }
-            for s in stations
-        ]
-
-        self.sync_cache_deps.set_from_cache(cache_key, results, timeout=1800)
+        self.sync_stale_cache.set(cache_key, results, CURRENT_STOPS_SOFT_TTL)
         return results
 
     def sync_find_optimal_fuel_stops(self, route_points: List[Dict]) -> List[Dict]:
 
-        cache_key = self.cache_key_deps.sync_generate_cache_key(route_points)
-        cached = self.sync_cache_deps.get_from_cache(cache_key)
+        cache_key = self.cache_key_deps.sync_generate_cache_key(
+            route_points, namespace="fuel_stops", price_versioned=True
+        )
+        cached = self.sync_stale_cache.get(
+            cache_key,
+            "refresh_stale_fuel_stops",
+            {"planner": "sampled", "params": {"route_points": route_points}},
+        )
 
         if cached:
             logger.info(f"Cache hit for fuel stops: {cached}")
             return cached
 
-        fuel_stops: List[Dict] = []
-        seen_station_ids = set()
-        total_distance = 0
-        last_stop_index = 0
+        return self.sync_refresh_sampled(cache_key, route_points)
 
-        step = max(1, len(route_points) // 10)
-        sampled_points = route_points[::step] + [route_points[-1]]
-
-        for i, point in enumerate(sampled_points):
-            if i == 0:
-                continue
-
-            p1 = Point(
-                route_points[last_stop_index]["longitude"],
-                route_points[last_stop_index]["latitude"],
-                srid=4326,
-            )
-            p2 = Point(
-                point["longitude"],
-                point["latitude"],
-                srid=4326,
+    def sync_refresh_sampled(self, cache_key: str, route_points: List[Dict]) -> List[Dict]:
+        try:
+            station_index.ensure_fresh()
+        except DatabaseError as e:
+            logger.error(
+                f"Station index refresh failed: {str(e)}", exc_info=True
             )
 
-            distance = p1.distance(p2) * 69
-            total_distance += distance
-
-            if total_distance >= 500 or i == len(sampled_points) - 1:
-                location = p2
+        fuel_stops = self._sampled_fuel_stops(route_points)
 
-                try:
-                    stations = list(
-                        FuelStation.objects.filter(
-                            location__distance_lte=(location, D(mi=50))
-                        )
-                        .only(
-                            "opis_truckstop_id",
-                            "truckstop_name",
-                            "retail_price",
-                            "location",
-                        )
-                        .annotate(dist=Distance("location", location))
-                        .order_by("retail_price", "dist")[:1]
-                    )
-                except DatabaseError as e:
-                    logger.error(
-                        f"Database query failed: {str(e)}", exc_info=True
-                    )
-                    continue
-
-                if stations:
-                    cheapest = stations[0]
-
-                    if cheapest.id not in seen_station_ids:
-                        stop_info = {
-                            "station_id": cheapest.opis_truckstop_id,
-                            "name": cheapest.truckstop_name,
-                            "retail_price": float(cheapest.retail_price),
-                            "distance_from_route_miles": round(
-                                cheapest.dist.mi, 2
-                            ),
-                            "location": {
-                                "lat": cheapest.location.y,
-                                "lon": cheapest.location.x,
-                            },
-                        }
-
-                        fuel_stops.append(stop_info)
-                        seen_station_ids.add(cheapest.id)
-
-                        last_stop_index = (
-                            route_points.index(point)
-                            if point in route_points
-                            else last_stop_index
-                        )
+        self.sync_stale_cache.set(cache_key, fuel_stops, FUEL_PLAN_SOFT_TTL)
+        return fuel_stops
 
-                        total_distance = 0
+    def sync_find_min_cost_fuel_stops(
+        self,
+        route_points: List[Dict],
+        total_distance_miles: float,
+        tank_capacity_gallons: Optional[float] = None,
+        mpg: float = FUEL_EFFICIENCY_MPG,
+        start_fuel_gallons: Optional[float] = None,
+        corridor_miles: float = 10,
+    ) -> Dict:
+        cache_key = self.cache_key_deps.sync_generate_cache_key(
+            {
+                "type": "min_cost",
+                "route_points": route_points,
+                "distance": total_distance_miles,
+                "tank": tank_capacity_gallons,
+                "mpg": mpg,
+                "start_fuel": start_fuel_gallons,
+                "corridor": corridor_miles,
+            },
+            namespace="fuel_stops",
+            price_versioned=True,
+        )
+        params = {
+            "route_points": route_points,
+            "total_distance_miles": total_distance_miles,
+            "tank_capacity_gallons": tank_capacity_gallons,
+            "mpg": mpg,
+            "start_fuel_gallons": start_fuel_gallons,
+            "corridor_miles": corridor_miles,
+        }
+        cached = self.sync_stale_cache.get(
+            cache_key,
+            "refresh_stale_fuel_stops",
+            {"planner": "min_cost", "params": params},
+        )
+        if cached:
+            logger.info("Cache hit for min-cost fuel plan")
+            return cached
 
-                        if len(fuel_stops) >= 3:
-                            break
-                else:
-                    logger.warning(
-                        f"No fuel stations found near ({location.y}, {location.x})"
-                    )
+        return self.sync_refresh_min_cost(cache_key, **params)
 
-        self.sync_cache_deps.set_from_cache(
-            cache_key, fuel_stops, timeout=3600)
-        return fuel_stops
+    def sync_refresh_min_cost(self, cache_key: str, **params) -> Dict:
+        result = self._plan_min_cost(**params)
+        self.sync_stale_cache.set(cache_key, result, FUEL_PLAN_SOFT_TTL)
+        return result
 
     def sync_calculate_fuel_cost(
         self, total_distance_miles: float, fuel_stops: List[Dict]
@@ -1,5 +1,7 @@
 from fuel_route_api.core.cache_dependencies import (AsyncCacheDependencies,
                                      CacheKeyDependencies)
+from fuel_route_api.core.gazetteer import gazetteer
+from fuel_route_api.core.log import logger
 from fuel_route_api.core.repo_dependencies import CRUDDependencies
 from ninja.errors import HttpError
 from fuel_route_api.schema.schema import GeocodeInputSchema, MapboxRouteResponseSchema
@@ -31,4 +33,8 @@ class GetAndGeocodeService:
             result = await self.service_routes.geocode_address(data)
             return {"lat": result.lat, "lon": result.lon}
         except Exception as e:
-            raise HttpError(500, f"Geocoding failed: {str(e)}")
+            centroid = gazetteer.lookup(city, state)
+            if centroid is None:
+                raise HttpError(500, f"Geocoding failed: {str(e)}")
+            logger.warning(f"Geocoding failed, using {city}, {state} centroid: {e}")
+            return {"lat": centroid[0], "lon": centroid[1]}
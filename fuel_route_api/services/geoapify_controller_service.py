@@ -1,10 +1,15 @@
-from django.http.request import HttpRequest as Request
+import uuid
+
 from injector import inject
 from ninja.errors import HttpError
 from fuel_route_api.core.compression import decompress_data
 from fuel_route_api.core.cache_dependencies import (AsyncCacheDependencies,
                                                     CacheKeyDependencies)
+from fuel_route_api.core.env import ROUTE_POLYLINE_PRECISION
+from fuel_route_api.core.lanes import lane_tracker
 from fuel_route_api.core.log import logger
+from fuel_route_api.core.polyline import decode_points, encode_points
+from fuel_route_api.core.quantize import snapper
 from fuel_route_api.core.repo_dependencies import CRUDDependencies
 from fuel_route_api.tasks.calculate_route_tasks import calculate_route_task
 from fuel_project.celery import app as task_app
@@ -20,47 +25,82 @@ class GeoapifyControllerService:
 
     async def calculate(self,  data):
         try:
-            cache_key = await self.cache_key_deps.generate_cache_key(data.dict())
+            # The task routes between the snapped endpoints, so every request
+            # in the same cell shares one result.
+            payload, snap_error = snapper.snap_endpoints(data.dict())
+            cache_key = await self.cache_key_deps.generate_cache_key(
+                payload, namespace="trip", price_versioned=True
+            )
+
+            lane_tracker.record_later(payload)
+
+            summary_key = f"route:{cache_key}:summary"
+            task_id_key = f"{cache_key}:task"
+            cached = await self.cache_deps.get_many([summary_key, task_id_key])
 
-            cached_result = await self.cache_deps.get_from_cache(cache_key)
-            if cached_result:
+            if cached.get(summary_key):
                 logger.info(f"Cache hit for route {cache_key}")
                 return {
                     "cache_key": cache_key,
                     "status": "done",
-                    "result": cached_result,
+                    "result": decompress_data(cached[summary_key]),
+                    "snap_error_meters": snap_error,
                 }
 
-            task_id_key = f"{cache_key}:task"
-            was_added = await self.cache_deps.add_from_cache(task_id_key, "LOCK",  timeout=600)
-            if not was_added:
+            if cached.get(task_id_key):
+                return {
+                    "status": "processing",
+                    "task_id": cached[task_id_key],
+                    "snap_error_meters": snap_error,
+                }
 
+            # The task id is chosen up front and is itself the lock value, so
+            # claiming the lane and publishing the id is a single write.
+            task_id = str(uuid.uuid4())
+            was_added = await self.cache_deps.add_from_cache(task_id_key, task_id, timeout=600)
+            if not was_added:
                 existing_task_id = await self.cache_deps.get_from_cache(task_id_key)
                 return {
                     "status": "processing",
                     "task_id": existing_task_id,
+                    "snap_error_meters": snap_error,
                 }
-            task = task_app.send_task("calculate_geo_routes", args=[data.dict()])
-            await self.cache_deps.set_from_cache(task_id_key, task.id, timeout=600)
+            task_app.send_task(
+                "calculate_geo_routes", args=[payload, cache_key], task_id=task_id
+            )
 
-            return {"cache_key": cache_key, "status": "processing", "task_id": task.id}
+            return {
+                "cache_key": cache_key,
+                "status": "processing",
+                "task_id": task_id,
+                "snap_error_meters": snap_error,
+            }
 
         except Exception as e:
 
             raise HttpError(500, f"Failed to calculate task result: {str(e)}")
 
-    async def get_route_result(self, request: Request, cache_key: str):
+    async def get_route_result(self, cache_key: str, format: str = "points"):
+        # Summary and geometry in one round trip.
+        summary_key = f"route:{cache_key}:summary"
+        geometry_key = f"route:{cache_key}:geometry"
         try:
-            result = await self.cache_deps.get_from_cache(cache_key)
-            if result:
-                return {"cache_key": cache_key, "status": "done", "result": result}
-
-            return {"cache_key": cache_key, "status": "processing"}
-
+            cached = await self.cache_deps.get_many([summary_key, geometry_key])
         except Exception as e:
             logger.error(
                 f" Error retrieving task {cache_key}: {str(e)}", exc_info=True)
             raise HttpError(500, f"Failed to retrieve task result: {str(e)}")
+
+        if not cached.get(summary_key) or not cached.get(geometry_key):
+            return {"cache_key": cache_key, "status": "processing"}
+
+        return {
+            "cache_key": cache_key,
+            "status": "done",
+            "summary": decompress_data(cached[summary_key]),
+            **self._geometry_response(cached[geometry_key], format),
+        }
+
     async def get_route_summary(self, cache_key: str):
 
         summary_key = f"route:{cache_key}:summary"
@@ -74,14 +114,32 @@ class GeoapifyControllerService:
             "summary": decompress_data(compressed),
         }
 
-    async def get_route_geometry(self, cache_key: str):
+    async def get_route_geometry(self, cache_key: str, format: str = "points"):
 
         geometry_key = f"route:{cache_key}:geometry"
-        compressed = await self.cache_deps.get_from_cache(geometry_key)
+        cached = await self.cache_deps.get_from_cache(geometry_key)
 
-        if not compressed:
+        if not cached:
             raise HttpError(404, "Geometry not found")
 
+        return self._geometry_response(cached, format)
+
+    def _geometry_response(self, cached, format: str):
+        if isinstance(cached, bytes):
+            # Written as gzip JSON before geometry was polyline encoded.
+            geometry = decompress_data(cached)
+            if format != "polyline":
+                return {"geometry": geometry}
+            cached = {
+                "polyline": encode_points(geometry["route"]),
+                "precision": ROUTE_POLYLINE_PRECISION,
+            }
+
+        if format == "polyline":
+            return {"geometry": cached}
+
         return {
-            "geometry": decompress_data(compressed)
+            "geometry": {
+                "route": decode_points(cached["polyline"], cached["precision"])
+            }
         }
@@ -1,16 +1,25 @@
 import logging
-import ssl
+import time
 from typing import Dict
 
-import aiohttp
-import certifi
-import requests
 from fuel_route_api.core.cache_dependencies import (
     AsyncCacheDependencies,
     CacheKeyDependencies,
     SyncCacheDependencies,
 )
-from fuel_route_api.core.env import GEOAPIFY_API_KEY, GEOAPIFY_BASE_URL
+from fuel_route_api.core.env import (
+    GEOAPIFY_API_KEY,
+    GEOAPIFY_BASE_URL,
+    ROUTE_SIMPLIFY_TOLERANCE_MILES,
+)
+from fuel_route_api.core.geocode_cache import GeocodeCacheDependencies
+from fuel_route_api.core.http_pool import http_pool
+from fuel_route_api.core.http_session import get_session
+from fuel_route_api.core.latency import provider_latency
+from fuel_route_api.core.polyline import pack_route, unpack_route
+from fuel_route_api.core.route_geometry import simplify_coordinates
+from fuel_route_api.core.single_flight import route_flight
+from fuel_route_api.core.stale_cache import AsyncStaleCache, SyncStaleCache
 from ninja.errors import HttpError
 from fuel_route_api.schema.schema import (
     CoordinateSchema,
@@ -24,14 +33,18 @@ logging.basicConfig(
 )
 
 
-ssl_context = ssl.create_default_context(cafile=certifi.where())
-
 logger = logging.getLogger(__name__)
 
+ROUTE_SOFT_TTL = 600
+SYNC_ROUTE_SOFT_TTL = 3600
+
+
 class GeoapifyServiceAsync:
     def __init__(self):
         self.cache_deps = AsyncCacheDependencies()
+        self.stale_cache = AsyncStaleCache(self.cache_deps)
         self.cache_key_deps = CacheKeyDependencies()
+        self.geocode_cache = GeocodeCacheDependencies()
 
     async def get_geoapify_route(
         self, data: CoordinateSchema, mapbox_format: bool = False
@@ -55,14 +68,28 @@ class GeoapifyServiceAsync:
             {
                 "start": [data.start_lat, data.start_lon],
                 "finish": [data.finish_lat, data.finish_lon],
-            }
+                "provider": "geoapify",
+                "format": "mapbox" if mapbox_format else "tomtom",
+            },
+            namespace="route",
+        )
+
+        cached = await self.stale_cache.get(
+            cache_key, lambda: self._fetch_route(data, mapbox_format, cache_key)
         )
-        
-        cached = await self.cache_deps.get_from_cache(cache_key)
         if cached:
-           
-            return cached
+            return unpack_route(cached)
+
+        async def read():
+            return unpack_route((await self.stale_cache.peek(cache_key))[0])
+
+        return await route_flight.do(
+            cache_key, lambda: self._fetch_route(data, mapbox_format, cache_key), read
+        )
 
+    async def _fetch_route(
+        self, data: CoordinateSchema, mapbox_format: bool, cache_key: str
+    ) -> Dict:
         url = f"{GEOAPIFY_BASE_URL}/routing"
         params = {
             "apiKey": GEOAPIFY_API_KEY,
@@ -72,7 +99,8 @@ class GeoapifyServiceAsync:
         }
         
 
-        async with aiohttp.ClientSession() as session:
+        async with http_pool.client("geoapify") as session:
+            started = time.perf_counter()
             async with session.get(url, params=params) as response:
                 route_data = await response.json()
                
@@ -108,6 +136,7 @@ class GeoapifyServiceAsync:
                     raise ValueError(
                         "Geoapify route missing 'geometry' or 'properties' data"
                     )
+                provider_latency["geoapify"].record(time.perf_counter() - started)
 
                 distance_meters = first_feature["properties"].get(
                     "distance", 0)
@@ -117,6 +146,9 @@ class GeoapifyServiceAsync:
                     if first_feature["geometry"]["coordinates"]
                     else []
                 )
+                coordinates = simplify_coordinates(
+                    coordinates, ROUTE_SIMPLIFY_TOLERANCE_MILES
+                )
                 segments = (
                     first_feature["properties"].get(
                         "legs", [{}])[0].get("steps", [])
@@ -172,12 +204,22 @@ class GeoapifyServiceAsync:
 
                 result = mapbox_structure if mapbox_format else tomtom_structure
                 logger.info("🗄 Caching route result...")
-                await self.cache_deps.set_from_cache(cache_key, result)
+                await self.stale_cache.set(cache_key, pack_route(result), ROUTE_SOFT_TTL)
                 logger.info("✅ Route calculation completed successfully.")
                 return result
 
     async def geocode_address(self, data: GeocodeInputSchema) -> GeocodeOutputSchema:
-        async with aiohttp.ClientSession() as session:
+        lat, lon = await self.geocode_cache.get_or_geocode(
+            data.address,
+            data.city,
+            data.state,
+            "geoapify",
+            lambda: self._fetch_geocode(data),
+        )
+        return GeocodeOutputSchema(lat=lat, lon=lon)
+
+    async def _fetch_geocode(self, data: GeocodeInputSchema):
+        async with http_pool.client("geoapify") as session:
 
             address = data.address.strip('" ').strip()
             city = data.city.strip('" ').strip()
@@ -205,15 +247,13 @@ class GeoapifyServiceAsync:
                     raise HttpError(404, "No results found for this address")
 
                 position = geocode_data["results"][0]
-                return GeocodeOutputSchema(
-                    lat=position["lat"],
-                    lon=position["lon"]
-                )
+                return position["lat"], position["lon"]
 
 class GeoapifyServiceSync:
     def __init__(self):
         self.cache_deps = SyncCacheDependencies()
         self.cache_key_deps = CacheKeyDependencies()
+        self.stale_cache = SyncStaleCache(self.cache_deps)
 
     
     def get_geoapify_route(
@@ -236,16 +276,27 @@ class GeoapifyServiceSync:
             {
                 "start": [data.start_lat, data.start_lon],
                 "finish": [data.finish_lat, data.finish_lon],
-            }
+                "provider": "geoapify",
+                "format": "mapbox" if mapbox_format else "tomtom",
+            },
+            namespace="route",
         )
 
        
-        cached = self.cache_deps.get_from_cache(cache_key)
+        cached = self.stale_cache.get(
+            cache_key,
+            "refresh_stale_route",
+            {"data": data.dict(), "mapbox_format": mapbox_format},
+        )
         if cached:
             logger.info("Cache hit for route. Returning cached result.")
-            return cached
+            return unpack_route(cached)
 
-       
+        return self._fetch_route(data, mapbox_format, cache_key)
+
+    def _fetch_route(
+        self, data: CoordinateSchema, mapbox_format: bool, cache_key: str
+    ) -> Dict:
         url = f"{GEOAPIFY_BASE_URL}/routing"
         params = {
             "apiKey": GEOAPIFY_API_KEY,
@@ -256,7 +307,7 @@ class GeoapifyServiceSync:
 
         logger.info(f"Requesting route from Geoapify API...")
 
-        response = requests.get(url, params=params, timeout=15)
+        response = get_session().get(url, params=params, timeout=15)
         route_data = response.json()
 
         if response.status_code != 200:
@@ -296,6 +347,9 @@ class GeoapifyServiceSync:
             if first_feature["geometry"]["coordinates"]
             else []
         )
+        coordinates = simplify_coordinates(
+            coordinates, ROUTE_SIMPLIFY_TOLERANCE_MILES
+        )
 
         segments = (
             first_feature["properties"].get("legs", [{}])[0].get("steps", [])
@@ -357,7 +411,7 @@ class GeoapifyServiceSync:
 
        
         logger.info("Caching route result...")
-        self.cache_deps.set_from_cache(cache_key, result, timeout=3600)
+        self.stale_cache.set(cache_key, pack_route(result), SYNC_ROUTE_SOFT_TTL)
 
         logger.info("Route calculation completed successfully.")
         return result
@@ -379,7 +433,7 @@ class GeoapifyServiceSync:
 
         url = f"{GEOAPIFY_BASE_URL}/geocode/search"
 
-        response = requests.get(url, params=params, timeout=10)
+        response = get_session().get(url, params=params, timeout=10)
         geocode_data = response.json()
 
         if response.status_code != 200:
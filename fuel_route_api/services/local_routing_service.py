@@ -0,0 +1,47 @@
+import threading
+import time
+from typing import Dict, Optional
+
+from asgiref.sync import sync_to_async
+from ninja.errors import HttpError
+
+from fuel_route_api.core.env import ROAD_GRAPH_PATH
+from fuel_route_api.core.latency import provider_latency
+from fuel_route_api.core.log import logger
+from fuel_route_api.core.road_graph import RoadGraph
+from fuel_route_api.schema.schema import CoordinateSchema
+
+_graph: Optional[RoadGraph] = None
+_lock = threading.Lock()
+
+
+def get_road_graph() -> RoadGraph:
+    global _graph
+    if _graph is None:
+        with _lock:
+            if _graph is None:
+                if not ROAD_GRAPH_PATH:
+                    raise HttpError(503, "Local routing is not configured.")
+                _graph = RoadGraph.load(ROAD_GRAPH_PATH)
+                logger.info(
+                    f"Road graph loaded: {len(_graph)} nodes, "
+                    f"{len(_graph.landmarks)} landmarks"
+                )
+    return _graph
+
+
+class LocalRoutingService:
+    def _route(self, data: CoordinateSchema) -> Dict:
+        try:
+            return get_road_graph().route(
+                data.start_lat, data.start_lon, data.finish_lat, data.finish_lon
+            )
+        except ValueError as e:
+            raise HttpError(400, str(e))
+
+    async def get_local_route(self, data: CoordinateSchema) -> Dict:
+        # Nothing is cached in front of the graph, so the whole call counts.
+        started = time.perf_counter()
+        route = await sync_to_async(self._route, thread_sensitive=False)(data)
+        provider_latency["local"].record(time.perf_counter() - started)
+        return route
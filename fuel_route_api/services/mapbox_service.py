@@ -1,10 +1,12 @@
 import logging
-import ssl
+import time
 from typing import Dict
 
-import aiohttp
-import certifi
 from fuel_route_api.core.cache_dependencies import AsyncCacheDependencies, CacheKeyDependencies
+from fuel_route_api.core.geocode_cache import GeocodeCacheDependencies
+from fuel_route_api.core.http_pool import http_pool
+from fuel_route_api.core.latency import provider_latency
+from fuel_route_api.core.polyline import pack_route, unpack_route
 from fuel_route_api.core.env import (
     MAPBOX_API_KEY,
     MAPBOX_BASE_URL,
@@ -17,25 +19,26 @@ logging.basicConfig(
 )
 
 
-ssl_context = ssl.create_default_context(cafile=certifi.where())
-
 
 class MapboxService:
     def __init__(self):
         self.cache_deps = AsyncCacheDependencies()
         self.cache_key_deps = CacheKeyDependencies()
+        self.geocode_cache = GeocodeCacheDependencies()
 
     async def get_mapbox_route(self, data: RouteRequestSchema) -> Dict:
         cache_key = await self.cache_key_deps.generate_cache_key(
             {
                 "start": [data.start_lat, data.start_lon],
                 "finish": [data.finish_lat, data.finish_lon],
-            }
+                "provider": "mapbox",
+            },
+            namespace="route",
         )
 
         cached_route = await self.cache_deps.get_from_cache(cache_key)
         if cached_route:
-            return cached_route
+            return unpack_route(cached_route)
 
         url = f"{MAPBOX_BASE_URL}/directions/v5/mapbox/driving/{data.start_lon},{data.start_lat};{data.finish_lon},{data.finish_lat}"
         params = {
@@ -44,12 +47,14 @@ class MapboxService:
             "overview": "full",
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with http_pool.client("mapbox") as session:
+            started = time.perf_counter()
             async with session.get(url, params=params) as response:
                 if response.status != 200:
                     raise Exception("Failed to fetch route from Mapbox API")
 
                 route_data = await response.json()
+                provider_latency["mapbox"].record(time.perf_counter() - started)
                 coordinates = route_data["routes"][0]["geometry"]["coordinates"]
                 route_points = [
                     {"latitude": lat, "longitude": lon} for lon, lat in coordinates
@@ -59,7 +64,8 @@ class MapboxService:
                     "routes": [
                         {
                             "summary": {
-                                "lengthInMeters": route_data["routes"][0]["distance"]
+                                "lengthInMeters": route_data["routes"][0]["distance"],
+                                "travelTimeInSeconds": route_data["routes"][0]["duration"],
                             },
                             "points": route_points,
                         }
@@ -67,12 +73,23 @@ class MapboxService:
                 }
 
                 await self.cache_deps.set_from_cache(
-                    cache_key, normalized_data, timeout=3600
+                    cache_key, pack_route(normalized_data), timeout=3600
                 )
                 return normalized_data
 
     async def geocode_address(
         self, address: str, city: str, state: str
+    ) -> tuple[float, float]:
+        return await self.geocode_cache.get_or_geocode(
+            address,
+            city,
+            state,
+            "mapbox",
+            lambda: self._fetch_geocode(address, city, state),
+        )
+
+    async def _fetch_geocode(
+        self, address: str, city: str, state: str
     ) -> tuple[float, float]:
         query_parts = [part for part in [address, city, state, "USA"] if part]
         query = ", ".join(query_parts)
@@ -84,7 +101,7 @@ class MapboxService:
             "types": "address,place,poi",
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with http_pool.client("mapbox") as session:
             async with session.get(url, params=params) as response:
                 if response.status != 200:
                     raise Exception(
@@ -0,0 +1,27 @@
+from asgiref.sync import sync_to_async
+from injector import inject
+
+from fuel_route_api.core.cache_metrics import collect
+from fuel_route_api.core.geocode_cache import GeocodeCacheDependencies
+from fuel_route_api.core.latency import provider_latency
+from fuel_route_api.core.local_cache import two_tier_cache
+
+
+class MetricsService:
+    @inject
+    def __init__(self):
+        self.geocode_cache = GeocodeCacheDependencies()
+
+    def sync_cache_metrics(self) -> dict:
+        metrics = collect()
+        # Local tier and provider latency are this process only; geocode
+        # counters already live in Redis.
+        metrics["local_tier"] = two_tier_cache.stats()
+        metrics["geocode"] = self.geocode_cache.stats()
+        metrics["providers"] = {
+            name: histogram.snapshot() for name, histogram in provider_latency.items()
+        }
+        return metrics
+
+    async def cache_metrics(self) -> dict:
+        return await sync_to_async(self.sync_cache_metrics, thread_sensitive=False)()
@@ -0,0 +1,74 @@
+from typing import Dict, List, Optional
+
+from asgiref.sync import async_to_sync
+
+from fuel_route_api.core.async_redis_cache import async_cache
+from fuel_route_api.core.env import (
+    HEDGE_DEFAULT_DELAY_SECONDS,
+    ROUTE_SIMPLIFY_TOLERANCE_MILES,
+    ROUTING_PROVIDERS,
+)
+from fuel_route_api.core.hedging import HedgePolicy, hedged
+from fuel_route_api.core.latency import provider_latency
+from fuel_route_api.core.route_geometry import normalize_route, simplify_route
+from fuel_route_api.schema.schema import CoordinateSchema
+
+from .geoapify_service import GeoapifyServiceAsync
+from .local_routing_service import LocalRoutingService
+from .mapbox_service import MapboxService
+from .tomtom_service import TomTomService
+
+hedge_policy = HedgePolicy(default_delay=HEDGE_DEFAULT_DELAY_SECONDS)
+
+
+class RoutingService:
+    def __init__(self, providers: Optional[List[str]] = None):
+        self.providers = providers or ROUTING_PROVIDERS
+        self.geoapify_service = GeoapifyServiceAsync()
+        self.tomtom_service = TomTomService()
+        self.mapbox_service = MapboxService()
+        self.local_service = LocalRoutingService()
+
+    def provider_call(self, provider: str, data: CoordinateSchema):
+        if provider == "geoapify":
+            return lambda: self.geoapify_service.get_geoapify_route(
+                data, mapbox_format=False
+            )
+        if provider == "tomtom":
+            return lambda: self.tomtom_service.get_tomtom_route(data)
+        if provider == "mapbox":
+            return lambda: self.mapbox_service.get_mapbox_route(data)
+        if provider == "local":
+            return lambda: self.local_service.get_local_route(data)
+        raise ValueError(f"Unknown routing provider: {provider}")
+
+    @staticmethod
+    def accept(route_data: Dict) -> Dict:
+        # Every provider's answer gets the same shape and the same vertex
+        # budget, whichever one wins the race.
+        return simplify_route(
+            normalize_route(route_data), ROUTE_SIMPLIFY_TOLERANCE_MILES
+        )
+
+    async def get_route(self, data: CoordinateSchema) -> Dict:
+        _, route_data = await hedged(
+            [(p, self.provider_call(p, data)) for p in self.providers],
+            hedge_policy,
+            accept=self.accept,
+        )
+        return route_data
+
+    def sync_get_route(self, data: CoordinateSchema) -> Dict:
+        # For Celery: async_to_sync runs the hedged race on a fresh loop.
+        # http_pool closes that loop's sessions itself; the Redis pool bound
+        # to it is closed here before the loop goes away.
+        async def run():
+            try:
+                return await self.get_route(data)
+            finally:
+                await async_cache.close()
+
+        return async_to_sync(run)()
+
+    def latency_stats(self) -> Dict:
+        return {p: provider_latency[p].snapshot() for p in self.providers}
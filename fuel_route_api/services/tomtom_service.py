@@ -1,8 +1,6 @@
-import ssl
+import time
 from typing import Dict
 import urllib
-import aiohttp
-import certifi
 from fuel_route_api.core.env import (
     TOMTOM_API_KEY,
     TOMTOM_BASE_URL,
@@ -20,8 +18,12 @@ from fuel_route_api.core.cache_dependencies import (
     AsyncCacheDependencies,
     CacheKeyDependencies,
 )
+from fuel_route_api.core.geocode_cache import GeocodeCacheDependencies
+from fuel_route_api.core.http_pool import http_pool
+from fuel_route_api.core.latency import provider_latency
+from fuel_route_api.core.polyline import pack_route, unpack_route
+from fuel_route_api.core.route_geometry import normalize_route
 
-ssl_context = ssl.create_default_context(cafile=certifi.where())
 
 
 class TomTomService:
@@ -30,6 +32,7 @@ class TomTomService:
         self.cache_deps = AsyncCacheDependencies()
         self.cache_key_deps = CacheKeyDependencies()
         self.deps = CRUDDependencies()
+        self.geocode_cache = GeocodeCacheDependencies()
 
     async def get_tomtom_route(self, data: CoordinateSchema) -> Dict:
         if not await self.cache_key_deps.validate_usa_coordinates(
@@ -47,16 +50,19 @@ class TomTomService:
             {
                 "start": [data.start_lat, data.start_lon],
                 "finish": [data.finish_lat, data.finish_lon],
-            }
+                "provider": "tomtom",
+            },
+            namespace="route",
         )
 
         cached = await self.cache_deps.get_from_cache(cache_key)
         if cached:
-            return cached
+            return unpack_route(cached)
 
         url = f"{TOMTOM_BASE_URL}/routing/1/calculateRoute/{data.start_lat},{data.start_lon}:{data.finish_lat},{data.finish_lon}/json"
 
         params = {
+            "key": TOMTOM_API_KEY,
             "travelMode": "car",
             "routeType": "eco",
             "routeRepresentation": "polyline",
@@ -68,7 +74,8 @@ class TomTomService:
             "vehicleWeight": "1600",  # A
         }
 
-        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
+        async with http_pool.client("tomtom") as session:
+            started = time.perf_counter()
             async with session.get(url, params=params) as response:
                 route_data = await response.json()
 
@@ -91,17 +98,32 @@ class TomTomService:
                         502, "No route found for the specified coordinates."
                     )
 
+                # TomTom puts the geometry under legs[*].points.
                 first_route = route_data["routes"][0]
-                if "summary" not in first_route or "points" not in first_route:
+                if "summary" not in first_route or "legs" not in first_route:
 
                     raise ValueError(
-                        "TomTom route missing 'summary' or 'points' data")
+                        "TomTom route missing 'summary' or 'legs' data")
 
-                await self.cache_deps.set_from_cache(cache_key, route_data)
-                return route_data
+                provider_latency["tomtom"].record(time.perf_counter() - started)
+                normalized_data = normalize_route(route_data)
+                await self.cache_deps.set_from_cache(
+                    cache_key, pack_route(normalized_data)
+                )
+                return normalized_data
 
     async def geocode_address(self, data: GeocodeInputSchema) -> GeocodeOutputSchema:
-        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context)) as session:
+        lat, lon = await self.geocode_cache.get_or_geocode(
+            data.address,
+            data.city,
+            data.state,
+            "tomtom",
+            lambda: self._fetch_geocode(data),
+        )
+        return GeocodeOutputSchema(lat=lat, lon=lon)
+
+    async def _fetch_geocode(self, data: GeocodeInputSchema):
+        async with http_pool.client("tomtom") as session:
             address = data.address.strip('" ').strip()
             city = data.city.strip('" ').strip()
             state = data.state.strip('" ').strip()
@@ -121,4 +143,4 @@ class TomTomService:
                     raise HttpError(404, "No results found for this address")
 
                 position = geocode_data["results"][0]["position"]
-                return GeocodeOutputSchema(lat=position["lat"], lon=position["lon"])
+                return position["lat"], position["lon"]
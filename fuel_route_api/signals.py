@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from fuel_route_api.core.price_version import bump_price_version
+from fuel_route_api.core.station_index import station_index
+from fuel_route_api.core.station_snapshot import station_snapshot
+from fuel_route_api.models.models import FuelStation
+
+
+@receiver(post_save, sender=FuelStation)
+@receiver(post_delete, sender=FuelStation)
+def fuel_station_changed(sender, **kwargs):
+    bump_price_version()
+    station_index.invalidate()
+    station_snapshot.invalidate()
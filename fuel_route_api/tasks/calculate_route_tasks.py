@@ -6,9 +6,11 @@ from celery import shared_task
 from fuel_route_api.core.cache_dependencies import (CacheKeyDependencies,
                                                     SyncCacheDependencies)
 from fuel_route_api.core.compression import compress_data
+from fuel_route_api.core.env import ROUTE_POLYLINE_PRECISION
+from fuel_route_api.core.polyline import encode_points
 from fuel_route_api.schema.schema import CoordinateSchema, RouteRequest
 from fuel_route_api.services.fuel_stop_service import FuelStopService
-from fuel_route_api.services.geoapify_service import GeoapifyServiceSync
+from fuel_route_api.services.routing_service import RoutingService
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +21,14 @@ logger = logging.getLogger(__name__)
     retry_backoff=True,
     retry_kwargs={"max_retries": 3},
 )
-def calculate_route_task(data: dict):
+def calculate_route_task(data: dict, cache_key: str = None):
 
     try:
         data_model = RouteRequest(**data)
 
         cache_deps = SyncCacheDependencies()
         cache_key_deps = CacheKeyDependencies()
-        geoapify_service = GeoapifyServiceSync()
+        routing_service = RoutingService()
         fuel_service = FuelStopService()
 
         validate_coords = cache_key_deps.sync_validate_usa_coordinates
@@ -46,10 +48,8 @@ def calculate_route_task(data: dict):
             finish_lon=data_model.finish_lon,
         )
 
-        route_data = geoapify_service.get_geoapify_route(
-            coordinate_schema,
-            mapbox_format=False,
-        )
+        # Same hedged, normalized and simplified route as the async API.
+        route_data = routing_service.sync_get_route(coordinate_schema)
 
         route_points = [
             {"latitude": p["latitude"], "longitude": p["longitude"]}
@@ -60,16 +60,28 @@ def calculate_route_task(data: dict):
             route_data["routes"][0]["summary"]["lengthInMeters"] / 1609.34
         )
 
-        fuel_stops = fuel_service.sync_find_optimal_fuel_stops(route_points)
-        total_fuel_cost = fuel_service.sync_calculate_fuel_cost(
-            total_distance_miles, fuel_stops
-        )
-        cost_summary = fuel_service.sync_calculate_fuel_costs(
-            total_distance_miles, fuel_stops
-        )
+        if data_model.planner == "min_cost":
+            cost_summary = fuel_service.sync_find_min_cost_fuel_stops(
+                route_points,
+                total_distance_miles,
+                tank_capacity_gallons=data_model.tank_capacity_gallons,
+                mpg=data_model.mpg,
+                start_fuel_gallons=data_model.start_fuel_gallons,
+            )
+            fuel_stops = cost_summary["fuel_stops"]
+            total_fuel_cost = cost_summary["total_cost"]
+        else:
+            fuel_stops = fuel_service.sync_find_optimal_fuel_stops(route_points)
+            total_fuel_cost = fuel_service.sync_calculate_fuel_cost(
+                total_distance_miles, fuel_stops
+            )
+            cost_summary = fuel_service.sync_calculate_fuel_costs(
+                total_distance_miles, fuel_stops
+            )
 
         geometry_data = {
-            "route": route_points
+            "polyline": encode_points(route_points),
+            "precision": ROUTE_POLYLINE_PRECISION,
         }
 
         summary_data = {
@@ -79,23 +91,26 @@ def calculate_route_task(data: dict):
             "number_of_stops": cost_summary["number_of_stops"],
             "average_price": cost_summary["average_price"],
             "gallons_needed": cost_summary["gallons_needed"],
+            "gallons_purchased": cost_summary.get("gallons_purchased"),
+            "planner": cost_summary.get("planner", data_model.planner),
+            "infeasible": cost_summary.get("infeasible"),
             "success": True,
         }
 
-        cache_key = cache_key_deps.sync_generate_cache_key(data_model.dict())
+        # The caller's key is used as given: the price version may have
+        # moved since it was built, and the caller polls that key.
+        cache_key = cache_key or cache_key_deps.sync_generate_cache_key(
+            data_model.dict(), namespace="trip", price_versioned=True
+        )
 
         summary_key = f"route:{cache_key}:summary"
         geometry_key = f"route:{cache_key}:geometry"
 
-        cache_deps.set_from_cache(
-            summary_key,
-            compress_data(summary_data),
-            timeout=3600,
-        )
-
-        cache_deps.set_from_cache(
-            geometry_key,
-            compress_data(geometry_data),
+        cache_deps.set_many(
+            {
+                summary_key: compress_data(summary_data),
+                geometry_key: geometry_data,
+            },
             timeout=3600,
         )
 
@@ -0,0 +1,34 @@
+from celery import shared_task
+
+from fuel_route_api.core.cache_dependencies import SyncCacheDependencies
+from fuel_route_api.schema.schema import CoordinateSchema
+from fuel_route_api.services.fuel_stop_service import FuelStopService
+from fuel_route_api.services.geoapify_service import GeoapifyServiceSync
+
+# Background refreshes queued by SyncStaleCache once an entry passes its soft
+# TTL. Each rewrites the entry under the same key and releases the refresh
+# lock, even on failure, so the next stale read can try again.
+
+
+@shared_task(name="refresh_stale_route")
+def refresh_stale_route(data: dict, mapbox_format: bool, cache_key: str, lock_key: str):
+    try:
+        GeoapifyServiceSync()._fetch_route(
+            CoordinateSchema(**data), mapbox_format, cache_key
+        )
+    finally:
+        SyncCacheDependencies().delete_from_cache(lock_key)
+
+
+@shared_task(name="refresh_stale_fuel_stops")
+def refresh_stale_fuel_stops(planner: str, params: dict, cache_key: str, lock_key: str):
+    service = FuelStopService()
+    refresh = {
+        "current": service.sync_refresh_current,
+        "sampled": service.sync_refresh_sampled,
+        "min_cost": service.sync_refresh_min_cost,
+    }[planner]
+    try:
+        refresh(cache_key, **params)
+    finally:
+        SyncCacheDependencies().delete_from_cache(lock_key)
@@ -0,0 +1,68 @@
+import logging
+
+from celery import shared_task
+from django.core.cache import cache
+
+from fuel_route_api.core.cache_dependencies import (
+    CacheKeyDependencies,
+    SyncCacheDependencies,
+)
+from fuel_route_api.core.env import (
+    WARM_BEFORE_EXPIRY_SECONDS,
+    WARM_RATE_LIMIT,
+    WARM_TOP_K,
+)
+from fuel_route_api.core.lanes import lane_tracker, warm_quota
+from fuel_route_api.tasks.calculate_route_tasks import calculate_route_task
+
+logger = logging.getLogger(__name__)
+
+
+def _expires_soon(key: str) -> bool:
+    if hasattr(cache, "ttl"):
+        # django-redis: 0 when the key is missing, None when it never expires.
+        ttl = cache.ttl(key)
+        return ttl is not None and ttl < WARM_BEFORE_EXPIRY_SECONDS
+    return cache.get(key) is None
+
+
+@shared_task(name="warm_popular_lanes")
+def warm_popular_lanes():
+    # Beat entry point: queue a warm for each top lane whose summary is
+    # missing or about to expire. warm_lane's rate limit paces the calls;
+    # no more are queued than the day's quota has left.
+    key_deps = CacheKeyDependencies()
+    lanes = lane_tracker.top(WARM_TOP_K)
+    budget = warm_quota.remaining()
+    queued = 0
+    for payload, _ in lanes:
+        if queued >= budget:
+            logger.warning("Daily warming quota exhausted")
+            break
+        cache_key = key_deps.sync_generate_cache_key(
+            payload, namespace="trip", price_versioned=True
+        )
+        if _expires_soon(f"route:{cache_key}:summary"):
+            warm_lane.delay(payload, cache_key)
+            queued += 1
+    logger.info(f"Queued {queued} of {len(lanes)} popular lanes for warming")
+    return {"lanes": len(lanes), "queued": queued}
+
+
+@shared_task(name="warm_lane", rate_limit=WARM_RATE_LIMIT)
+def warm_lane(payload: dict, cache_key: str):
+    if not _expires_soon(f"route:{cache_key}:summary"):
+        return {"cache_key": cache_key, "status": "fresh"}
+    # Same lock the calculate endpoint takes, so a warm never races a
+    # user-triggered calculation of the same lane. It is taken before the
+    # quota so a warm that loses the race costs nothing.
+    cache_deps = SyncCacheDependencies()
+    lock_key = f"{cache_key}:task"
+    task_id = warm_lane.request.id or f"warm:{cache_key}"
+    if not cache_deps.add_to_cache(lock_key, task_id, timeout=600):
+        return {"cache_key": cache_key, "status": "in_progress"}
+    if not warm_quota.take():
+        cache_deps.delete_from_cache(lock_key)
+        logger.warning("Daily warming quota exhausted")
+        return {"cache_key": cache_key, "status": "quota_exhausted"}
+    return calculate_route_task(payload, cache_key)
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from fuel_route_api.core.cache_keys import CacheKeyBuilder
+
+
+def test_key_layout_and_versioning():
+    keys = CacheKeyBuilder(schema_version=1)
+    key = keys.build("fuel_stops", {"a": 1}, price_version=7)
+    namespace, schema, price, digest = key.split(":")
+    assert (namespace, schema, price, len(digest)) == ("fuel_stops", "v1", "p7", 32)
+
+    assert key != keys.build("fuel_stops", {"a": 1}, price_version=8)
+    assert key != CacheKeyBuilder(schema_version=2).build("fuel_stops", {"a": 1}, 7)
+    assert keys.build("route", {"a": 1}).startswith("route:v1:")
+
+
+def test_canonical_encoding():
+    keys = CacheKeyBuilder()
+    assert keys.build("n", {"a": 1, "b": [2.5]}) == keys.build("n", {"b": [2.5], "a": 1})
+    assert keys.build("n", -0.0) == keys.build("n", 0.0)
+    # Type tags keep look-alike payloads apart.
+    distinct = [1, 1.0, "1", True, None, [1], (1, 2), {"1": 1}, b"1"]
+    assert len({keys.build("n", v) for v in distinct}) == len(distinct)
+    assert keys.build("n", [1]) == keys.build("n", (1,))
+    with pytest.raises(TypeError):
+        keys.build("n", object())
+
+
+def test_point_lists_hash_by_coordinates():
+    keys = CacheKeyBuilder()
+    lats, lons = np.linspace(30, 40, 500), np.linspace(-100, -90, 500)
+    dicts = [{"latitude": a, "longitude": o} for a, o in zip(lats, lons)]
+    short = [{"lat": a, "lon": o} for a, o in zip(lats, lons)]
+    pairs = [[a, o] for a, o in zip(lats, lons)]
+
+    key = keys.build("n", dicts)
+    assert key == keys.build("n", short) == keys.build("n", pairs)
+    assert key != keys.build("n", dicts[:-1])
+
+    moved = [dict(p) for p in dicts]
+    moved[250]["latitude"] += 1e-9
+    assert key != keys.build("n", moved)
+
+    # Extra fields fall back to the generic encoding rather than being dropped.
+    tagged = [dict(p, name="x") for p in dicts]
+    assert key != keys.build("n", tagged)
@@ -0,0 +1,68 @@
+from fuel_route_api.core.cache_metrics import (
+    CacheMetrics,
+    key_namespace,
+    merge,
+    summarize,
+)
+from fuel_route_api.core.codecs import CacheSerializer, encoded_sizes
+
+
+def test_key_namespaces():
+    assert key_namespace("route:v1:ab12") == "route"
+    assert key_namespace("route:trip:v1:ab12:summary") == "route_summary"
+    assert key_namespace("route:trip:v1:ab12:geometry") == "route_geometry"
+    assert key_namespace("fuel_stops:v1:p4:ab12") == "fuel_stops"
+    assert key_namespace("trip:v1:p4:ab12:task") == "task_lock"
+    assert key_namespace("fuel_stops:v1:p4:ab12:refresh") == "refresh_lock"
+    assert key_namespace("route:flight:route:v1:ab12") == "flight_lock"
+    assert key_namespace("geocode:ab12") == "geocode"
+    assert key_namespace("route_list") == "route_list"
+
+
+def test_counts_latency_and_sizes_per_namespace():
+    metrics = CacheMetrics(flush_interval=0)
+    metrics.record_get("route:v1:a", None, 0.002)
+    metrics.record_write("route:v1:a", 0.001, size=900)
+    metrics.record_get("route:v1:a", {"points": []}, 0.0001, local=True)
+    metrics.record_get_many(
+        ["route:v1:a", "route:v1:b", "route:v1:c"],
+        {"route:v1:a": 1, "route:v1:c": 2},
+        0.001,
+        local=["route:v1:c"],
+    )
+    metrics.record_write("trip:v1:a:task", 0.001, added=False, size=40)
+    metrics.record_write("route:v1:b", 0.001)
+    metrics.record_write("route:v1:c", 0.001, size=5000)
+
+    stats = metrics.snapshot()
+    route = stats["route"]
+    assert (route["hits"], route["local_hits"], route["misses"]) == (3, 2, 2)
+    assert route["hit_rate"] == 0.6
+    assert route["writes"] == 3
+    # Only writes whose encoded size was reported are sized.
+    assert route["payload_size"]["count"] == 2
+    assert route["latency"]["get"]["count"] == 5
+    assert stats["task_lock"]["add_conflicts"] == 1
+    assert stats["task_lock"]["payload_size"]["count"] == 0
+
+
+def test_serializer_reports_encoded_sizes_in_scope():
+    serializer = CacheSerializer({})
+    assert serializer.dumps({"a": 1})
+    with encoded_sizes() as sizes:
+        first = serializer.dumps({"points": list(range(1000))})
+        second = serializer.dumps("x")
+    assert sizes == [len(first), len(second)]
+
+
+def test_reports_merge_across_processes():
+    first, second = CacheMetrics(flush_interval=0), CacheMetrics(flush_interval=0)
+    first.record_get("geocode:a", (1.0, 2.0), 0.001)
+    second.record_get("geocode:b", None, 0.001)
+    second.record_get("route_list", [], 0.001)
+
+    merged = summarize(merge([first.export(), second.export()]))
+    assert merged["geocode"]["lookups"] == 2
+    assert merged["geocode"]["hit_rate"] == 0.5
+    assert merged["geocode"]["latency"]["get"]["count"] == 2
+    assert merged["route_list"]["hits"] == 1
@@ -0,0 +1,70 @@
+import gzip
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from fuel_route_api.core import codecs
+from fuel_route_api.core.codecs import CacheSerializer, decode, encode
+from fuel_route_api.core.compression import compress_data, decompress_data
+
+
+def tags(blob):
+    return blob[1] >> 4, blob[1] & 0x0F
+
+
+def test_small_values_skip_compression_and_large_ones_compress():
+    small = {"total_fuel_cost": 412.5, "number_of_stops": 2}
+    blob = encode(small)
+    assert tags(blob) == (1, 0)
+    assert decode(blob) == small
+
+    route = {"points": [{"latitude": 35.0 + i * 1e-4, "longitude": -100.0} for i in range(2000)]}
+    blob = encode(route, compressor="zlib")
+    assert tags(blob) == (1, 1)
+    assert len(blob) < len(pickle.dumps(route)) / 4
+    assert decode(blob) == route
+
+
+def test_types_msgpack_cannot_keep_fall_back_to_pickle():
+    for value in [(35.1, -97.2), {"v": np.float64(1.5)}, 2**70, {1, 2}]:
+        blob = encode(value)
+        assert tags(blob)[0] == 0
+        assert decode(blob) == value
+        assert type(decode(blob)) is type(value)
+
+
+def test_bytes_are_stored_raw_without_recompression():
+    inner = compress_data({"route": list(range(5000))})
+    blob = encode(inner, compressor="zlib", threshold=0)
+    assert tags(blob) == (3, 0)
+    assert decode(blob) == inner
+
+
+def test_legacy_entries_still_decode():
+    summary = {"fuel_stops": [], "success": True}
+    assert decompress_data(gzip.compress(json.dumps(summary).encode())) == summary
+    assert decompress_data(compress_data(summary)) == summary
+
+    serializer = CacheSerializer({})
+    assert serializer.loads(pickle.dumps(summary)) == summary
+    assert serializer.loads(serializer.dumps(summary)) == summary
+
+
+def test_unavailable_codec_is_reported():
+    blob = codecs.MAGIC + bytes([1 << 4 | 0x0F]) + b"x"
+    with pytest.raises(ValueError):
+        decode(blob)
+
+
+@pytest.mark.skipif("zstd" not in codecs.COMPRESSORS, reason="zstandard not installed")
+def test_zstd_encodes_from_many_threads():
+    values = [
+        {"points": [[35.0 + i * 1e-4, -100.0 - n] for i in range(3000)]} for n in range(32)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        blobs = list(pool.map(lambda v: encode(v, compressor="zstd"), values * 4))
+    assert all(tags(blob)[1] == 2 for blob in blobs)
+    assert [decode(blob) for blob in blobs] == values * 4
@@ -0,0 +1,75 @@
+from fuel_route_api.core.stale_cache import SyncStaleCache
+from fuel_route_api.services import fuel_stop_service
+from fuel_route_api.services.fuel_stop_service import FuelStopService
+
+
+class MemoryCacheDeps:
+    def __init__(self):
+        self.data = {}
+
+    def get_from_cache(self, key):
+        return self.data.get(key)
+
+    def set_from_cache(self, key, value, timeout=600):
+        self.data[key] = value
+
+    def add_to_cache(self, key, value, timeout=600):
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    def delete_from_cache(self, key):
+        self.data.pop(key, None)
+
+
+class FixedKeys:
+    def sync_generate_cache_key(self, data, namespace="default", price_versioned=False):
+        return f"{namespace}:test"
+
+
+def test_infeasible_min_cost_plan_falls_back_to_sampled_and_is_cached(monkeypatch):
+    # ~690 miles due east; the only corridor station is at mile 400, beyond
+    # a 10 gallon * 30 mpg tank, so the exact planner has no answer.
+    route_points = [{"latitude": 40.0, "longitude": -100.0 + i * 0.1} for i in range(131)]
+    station = {
+        "station_id": "7",
+        "name": "Far Stop",
+        "retail_price": 3.25,
+        "detour_miles": 0.4,
+        "lat": 40.0,
+        "lon": -92.4,
+        "milepost": 400.0,
+    }
+    monkeypatch.setattr(
+        fuel_stop_service, "fetch_corridor_stations", lambda coords, corridor: [station]
+    )
+    monkeypatch.setattr(
+        fuel_stop_service.station_index,
+        "cheapest_near",
+        lambda lat, lon, radius_miles=50: {**station, "id": 7, "distance_miles": 0.4},
+    )
+
+    service = FuelStopService()
+    deps = MemoryCacheDeps()
+    service.cache_key_deps = FixedKeys()
+    service.sync_stale_cache = SyncStaleCache(deps)
+
+    result = service.sync_find_min_cost_fuel_stops(
+        route_points, 690.0, tank_capacity_gallons=10, mpg=30
+    )
+
+    assert result["planner"] == "sampled"
+    assert result["infeasible"].startswith("No fuel station reachable")
+    assert [s["station_id"] for s in result["fuel_stops"]] == ["7"]
+    assert result["total_cost"] == round(690.0 / 30 * 3.25, 2)
+
+    # Cached like any other plan, so the task writes its summary and the
+    # next request does not re-run the solver.
+    def no_query(coords, corridor):
+        raise AssertionError("corridor queried again")
+
+    monkeypatch.setattr(fuel_stop_service, "fetch_corridor_stations", no_query)
+    assert service.sync_find_min_cost_fuel_stops(
+        route_points, 690.0, tank_capacity_gallons=10, mpg=30
+    ) == result
@@ -0,0 +1,39 @@
+from fuel_route_api.core.gazetteer import Gazetteer, place_key
+
+
+def test_round_trip_lookup(tmp_path):
+    path = str(tmp_path / "places.gaz")
+    count = Gazetteer.write(
+        path,
+        [
+            ("Big Cabin", "OK", 36.54, -95.22),
+            ("St. Louis", "MO", 38.63, -90.24),
+            ("Springfield", "IL", 39.78, -89.65),
+            ("Springfield", "MO", 37.20, -93.29),
+        ],
+    )
+    assert count == 4
+
+    gaz = Gazetteer(path)
+    assert len(gaz) == 4
+    lat, lon = gaz.lookup("big  cabin", "ok")
+    assert abs(lat - 36.54) < 1e-4 and abs(lon + 95.22) < 1e-4
+    assert gaz.lookup("ST LOUIS", "MO") is not None
+    assert gaz.lookup("Springfield", "TX") is None
+
+    results = gaz.lookup_many([("Springfield", "MO"), ("Nowhere", "ZZ")])
+    assert abs(results[0][0] - 37.20) < 1e-4
+    assert results[1] is None
+
+
+def test_duplicate_places_are_averaged(tmp_path):
+    path = str(tmp_path / "places.gaz")
+    Gazetteer.write(path, [("Tomah", "WI", 43.0, -90.0), ("Tomah", "WI", 44.0, -91.0)])
+    lat, lon = Gazetteer(path).lookup("Tomah", "WI")
+    assert abs(lat - 43.5) < 1e-4 and abs(lon + 90.5) < 1e-4
+
+
+def test_missing_file_disables_lookup(tmp_path):
+    gaz = Gazetteer(str(tmp_path / "missing.gaz"))
+    assert gaz.lookup("Tomah", "WI") is None
+    assert place_key("Tomah", "WI") == place_key(" tomah ", "wi")
@@ -0,0 +1,117 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+
+from fuel_route_api.core.hedging import HedgePolicy, hedged
+from fuel_route_api.core.latency import LatencyHistogram
+from fuel_route_api.core.route_geometry import normalize_route
+
+
+def make_policy(**kwargs):
+    return HedgePolicy(histograms=defaultdict(LatencyHistogram), **kwargs)
+
+
+def provider(delay, result=None, error=None, log=None, name=None):
+    async def call():
+        if log is not None:
+            log.append(("start", name))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if log is not None:
+                log.append(("cancelled", name))
+            raise
+        if error:
+            raise error
+        return result
+
+    return call
+
+
+@pytest.mark.asyncio
+async def test_primary_within_delay_is_not_hedged():
+    log = []
+    winner, result = await hedged(
+        [
+            ("a", provider(0.01, "A", log=log, name="a")),
+            ("b", provider(0.01, "B", log=log, name="b")),
+        ],
+        make_policy(default_delay=0.2),
+    )
+    assert (winner, result) == ("a", "A")
+    assert log == [("start", "a")]
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    log = []
+    winner, result = await hedged(
+        [
+            ("a", provider(1.0, "A", log=log, name="a")),
+            ("b", provider(0.01, "B", log=log, name="b")),
+        ],
+        make_policy(default_delay=0.05),
+    )
+    await asyncio.sleep(0)
+    assert (winner, result) == ("b", "B")
+    assert ("cancelled", "a") in log
+
+
+@pytest.mark.asyncio
+async def test_failure_hedges_immediately_and_rejects_invalid():
+    policy = make_policy(default_delay=5.0)
+    winner, result = await asyncio.wait_for(
+        hedged(
+            [
+                ("a", provider(0.0, error=RuntimeError("down"))),
+                ("b", provider(0.0, {"routes": [{}]})),
+                ("c", provider(0.0, "C")),
+            ],
+            policy,
+            accept=lambda r: r if r == "C" else normalize_route(r),
+        ),
+        timeout=1.0,
+    )
+    assert (winner, result) == ("c", "C")
+
+
+@pytest.mark.asyncio
+async def test_all_failures_raise_primary_error():
+    with pytest.raises(RuntimeError, match="primary"):
+        await hedged(
+            [
+                ("a", provider(0.02, error=RuntimeError("primary"))),
+                ("b", provider(0.0, error=ValueError("secondary"))),
+            ],
+            make_policy(default_delay=0.0),
+        )
+
+
+def test_delay_tracks_p95_once_warm():
+    policy = make_policy(default_delay=1.0, min_samples=20, min_delay=0.01)
+    assert policy.delay("a") == 1.0
+    for _ in range(19):
+        policy.histograms["a"].record(0.1)
+    policy.histograms["a"].record(2.0)
+    assert 0.1 <= policy.delay("a") < 0.2
+
+
+def test_normalize_route_shapes():
+    tomtom = {
+        "routes": [
+            {
+                "summary": {"lengthInMeters": 1000},
+                "legs": [{"points": [{"latitude": 1, "longitude": 2}]}],
+            }
+        ]
+    }
+    mapbox = {
+        "routes": [
+            {"distance": 1000, "duration": 60, "geometry": {"coordinates": [[2, 1]]}}
+        ]
+    }
+    for data in (tomtom, mapbox):
+        route = normalize_route(data)["routes"][0]
+        assert route["points"] == [{"latitude": 1, "longitude": 2}]
+        assert route["summary"]["lengthInMeters"] == 1000
@@ -0,0 +1,38 @@
+import asyncio
+
+from fuel_route_api.core import http_session
+from fuel_route_api.core.http_pool import HttpPool
+
+
+def test_session_retries_match_task_policy():
+    session = http_session.create_session()
+    retry = session.get_adapter("https://api.geoapify.com").max_retries
+    assert retry.total == 3
+    assert retry.backoff_factor == 1
+    assert 503 in retry.status_forcelist
+    assert not retry.raise_on_status
+
+
+def test_session_is_reused_until_closed():
+    try:
+        first = http_session.get_session()
+        assert http_session.get_session() is first
+        http_session.close_session()
+        assert http_session.get_session() is not first
+    finally:
+        http_session.close_session()
+
+
+def test_pool_sessions_are_per_loop_and_closed_with_it():
+    pool = HttpPool()
+
+    async def take():
+        session = pool.session("tomtom")
+        assert pool.session("tomtom") is session
+        return session
+
+    first = asyncio.run(take())
+    second = asyncio.run(take())
+    assert first is not second
+    assert first.closed and second.closed
+    assert not pool.sessions
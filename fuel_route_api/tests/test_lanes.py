@@ -0,0 +1,80 @@
+from collections import Counter
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from fuel_route_api.core import lanes
+from fuel_route_api.core.lanes import DailyQuota, LaneTracker
+
+
+class SortedSets:
+    # The handful of sorted-set commands LaneTracker pipelines.
+
+    def __init__(self):
+        self.sets = {}
+
+    def pipeline(self, transaction=True):
+        return Pipeline(self)
+
+
+class Pipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.calls]
+
+    def _zincrby(self, key, amount, member):
+        self.redis.sets.setdefault(key, Counter())[member] += amount
+
+    def _expire(self, key, seconds):
+        return True
+
+    def _zunionstore(self, dest, keys):
+        self.redis.sets[dest] = sum((self.redis.sets.get(k, Counter()) for k in keys), Counter())
+
+    def _zrevrange(self, key, start, end, withscores=False):
+        ranked = sorted(self.redis.sets.get(key, {}).items(), key=lambda kv: -kv[1])
+        return [(m.encode(), float(score)) for m, score in ranked[start : end + 1]]
+
+    def _delete(self, key):
+        self.redis.sets.pop(key, None)
+
+
+def test_daily_quota_stops_at_limit(monkeypatch):
+    monkeypatch.setattr(lanes, "cache", LocMemCache("quota-test", {}))
+    quota = DailyQuota("warm-test", limit=3)
+    assert [quota.take() for _ in range(5)] == [True, True, True, False, False]
+
+
+def test_tracker_is_inert_without_redis(monkeypatch):
+    monkeypatch.setattr(lanes, "_redis", lambda: None)
+    tracker = LaneTracker(prefix="lanes-test")
+    tracker.record({"start_lat": 35.0, "start_lon": -97.0})
+    assert tracker.top(10) == []
+
+
+def test_top_merges_the_window_and_drops_older_days(monkeypatch):
+    redis = SortedSets()
+    monkeypatch.setattr(lanes, "_redis", lambda: redis)
+    tracker = LaneTracker(prefix="lanes-test", window_days=2)
+    a, b, c = {"lane": "a"}, {"lane": "b"}, {"lane": "c"}
+
+    for today, payloads in ((98, [c] * 5), (99, [a, b, b]), (100, [a, a])):
+        monkeypatch.setattr(tracker, "_today", lambda today=today: today)
+        for payload in payloads:
+            tracker.record(payload)
+
+    # Day 98 is outside the two-day window, so c's five hits do not count.
+    assert tracker.top(2) == [(a, 3), (b, 2)]
+    assert tracker.top(1) == [(a, 3)]
+    assert "lanes-test:top:100" not in redis.sets
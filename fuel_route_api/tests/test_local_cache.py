@@ -0,0 +1,66 @@
+import json
+import time
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from fuel_route_api.core import local_cache
+from fuel_route_api.core.local_cache import MISSING, LocalCache, TwoTierCache
+
+
+def test_lru_evicts_by_size():
+    lru = LocalCache(max_bytes=600, max_item_bytes=600)
+    for i in range(10):
+        lru.set(f"k{i}", "x" * 100, ttl=60)
+    assert lru.size <= 600
+    assert lru.get("k0") is MISSING
+    assert lru.get("k9") == "x" * 100
+
+
+def test_oversized_items_and_expiry():
+    lru = LocalCache(max_bytes=1000, max_item_bytes=100)
+    lru.set("big", "x" * 500, ttl=60)
+    assert lru.get("big") is MISSING
+    lru.set("short", 1, ttl=0.01)
+    time.sleep(0.02)
+    assert lru.get("short") is MISSING
+    assert lru.size == 0
+
+
+def test_returned_values_are_copies():
+    lru = LocalCache(max_bytes=10_000)
+    lru.set("route", {"points": [1, 2]}, ttl=60)
+    lru.get("route")["points"].append(3)
+    assert lru.get("route") == {"points": [1, 2]}
+
+
+def test_two_tier_hits_and_invalidation(monkeypatch):
+    monkeypatch.setattr(local_cache, "cache", LocMemCache("two-tier-test", {}))
+    tiers = TwoTierCache(enabled=True, max_bytes=10_000, local_ttl=60)
+
+    assert tiers.get("k") is None
+    tiers.set("k", {"v": 1}, timeout=300)
+    assert tiers.get("k") == {"v": 1}
+    assert tiers.stats()["local_hits"] == 1
+
+    # Another worker rewrote the key and announced it.
+    local_cache.cache.set("k", {"v": 2})
+    tiers._on_message({"data": json.dumps({"sender": "other", "keys": ["k"]})})
+    assert tiers.get("k") == {"v": 2}
+
+    stats = tiers.stats()
+    assert (stats["local_hits"], stats["redis_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["local_entries"] == 1
+
+
+def test_two_tier_many(monkeypatch):
+    monkeypatch.setattr(local_cache, "cache", LocMemCache("two-tier-many", {}))
+    tiers = TwoTierCache(enabled=True, max_bytes=10_000, local_ttl=60)
+
+    tiers.set_many({"a": 1, "b": 2}, timeout=300)
+    local_cache.cache.set("c", 3)
+    assert tiers.get_many(["a", "b", "c", "d"]) == {"a": 1, "b": 2, "c": 3}
+    stats = tiers.stats()
+    assert (stats["local_hits"], stats["redis_hits"], stats["misses"]) == (2, 1, 1)
+
+    assert tiers.add_many({"a": 10, "e": 5}, timeout=300) == {"a": False, "e": True}
+    assert tiers.get_many(["a", "e"]) == {"a": 1, "e": 5}
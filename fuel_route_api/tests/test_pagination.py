@@ -0,0 +1,73 @@
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal
+
+import pytest
+
+from fuel_route_api.core import pagination
+from fuel_route_api.core.pagination import KeysetPagination
+from fuel_route_api.models.models import FuelStation
+from fuel_route_api.services.fuel_routes_service import FuelRoutesService, price_bound
+
+
+def make_stations(states):
+    return [
+        FuelStation.objects.create(
+            opis_truckstop_id=str(i),
+            truckstop_name=f"STOP #{i}",
+            address=f"EXIT {i}",
+            city="Vinita",
+            state=state,
+            rack_id="307",
+            retail_price=Decimal("3.000") + i * Decimal("0.010"),
+        )
+        for i, state in enumerate(states)
+    ]
+
+
+def walk(queryset, limit):
+    paginator = KeysetPagination()
+    pages, cursor = [], None
+    while True:
+        page = paginator.paginate_queryset(
+            queryset, KeysetPagination.Input(cursor=cursor, limit=limit)
+        )
+        pages.append(page)
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+@pytest.fixture
+def exact_count(monkeypatch):
+    monkeypatch.setattr(pagination, "estimated_count", lambda queryset: queryset.count())
+
+
+@pytest.mark.django_db
+def test_cursor_walk_visits_every_station_once(exact_count):
+    stations = make_stations(["OK"] * 7)
+    pages = walk(FuelStation.objects.all(), limit=3)
+
+    assert [len(page["items"]) for page in pages] == [3, 3, 1]
+    assert [s.pk for page in pages for s in page["items"]] == [s.pk for s in stations]
+    # The cursor is the last row served, not the extra row fetched past it.
+    for page in pages[:-1]:
+        assert page["next_cursor"] == page["items"][-1].pk
+    assert all(page["total"] == 7 for page in pages)
+
+
+@pytest.mark.django_db
+def test_full_last_page_has_no_next_cursor(exact_count):
+    stations = make_stations(["OK", "TX", "OK", "OK", "TX", "OK", "OK", "OK"])
+    queryset = FuelRoutesService().station_queryset(state="ok")
+    pages = walk(queryset, limit=3)
+
+    assert [len(page["items"]) for page in pages] == [3, 3]
+    assert [s.pk for page in pages for s in page["items"]] == [
+        s.pk for s in stations if s.state == "OK"
+    ]
+
+
+def test_price_bounds_snap_onto_the_price_grid():
+    assert price_bound(3.0071, ROUND_CEILING) == Decimal("3.008")
+    assert price_bound(3.0079, ROUND_FLOOR) == Decimal("3.007")
+    assert price_bound(3.007, ROUND_CEILING) == Decimal("3.007")
+    assert price_bound(3.007, ROUND_FLOOR) == Decimal("3.007")
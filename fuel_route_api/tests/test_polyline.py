@@ -0,0 +1,108 @@
+import numpy as np
+
+from fuel_route_api.core.polyline import (
+    decode,
+    decode_points,
+    encode,
+    encode_points,
+    pack_route,
+    unpack_route,
+)
+from fuel_route_api.core.route_geometry import normalize_route
+
+
+def test_matches_reference_encoding():
+    # Example from Google's encoded polyline algorithm documentation.
+    encoded = encode([38.5, 40.7, 43.252], [-120.2, -120.95, -126.453])
+    assert encoded == "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+    lats, lons = decode(encoded)
+    assert np.allclose(lats, [38.5, 40.7, 43.252])
+    assert np.allclose(lons, [-120.2, -120.95, -126.453])
+
+
+def test_round_trip_within_precision():
+    rng = np.random.default_rng(1)
+    lats = 35 + np.cumsum(rng.normal(0, 0.01, 5000))
+    lons = -100 + np.cumsum(rng.normal(0, 0.01, 5000))
+    for precision in (5, 6):
+        out_lats, out_lons = decode(encode(lats, lons, precision), precision)
+        assert np.abs(out_lats - lats).max() <= 0.5 * 10.0**-precision + 1e-12
+        assert np.abs(out_lons - lons).max() <= 0.5 * 10.0**-precision + 1e-12
+
+
+def test_empty_and_repeated_points():
+    assert encode([], []) == ""
+    assert decode_points("") == []
+    points = [{"latitude": 40.0, "longitude": -75.0}] * 3
+    assert decode_points(encode_points(points)) == points
+
+
+def test_pack_route_round_trip():
+    route = {
+        "routes": [
+            {
+                "summary": {"lengthInMeters": 1200},
+                "points": [
+                    {"latitude": 40.0, "longitude": -75.0},
+                    {"latitude": 40.01, "longitude": -75.02},
+                ],
+            }
+        ]
+    }
+    packed = pack_route(route)
+    assert "points" not in packed["routes"][0]
+    assert unpack_route(packed) == route
+    assert unpack_route(route) is route
+
+
+def test_tomtom_legs_normalize_and_pack():
+    # Shape of a calculateRoute response: geometry only under legs[*].points.
+    leg_summary = {
+        "lengthInMeters": 61234,
+        "travelTimeInSeconds": 2510,
+        "departureTime": "2026-10-17T09:00:00-05:00",
+        "arrivalTime": "2026-10-17T09:41:50-05:00",
+    }
+    tomtom = {
+        "formatVersion": "0.0.12",
+        "routes": [
+            {
+                "summary": {
+                    **leg_summary,
+                    "lengthInMeters": 122468,
+                    "travelTimeInSeconds": 5020,
+                    "trafficDelayInSeconds": 0,
+                    "fuelConsumptionInLiters": 8.713,
+                },
+                "legs": [
+                    {
+                        "summary": leg_summary,
+                        "points": [
+                            {"latitude": 36.53810, "longitude": -95.22140},
+                            {"latitude": 36.58912, "longitude": -95.18803},
+                        ],
+                    },
+                    {
+                        "summary": leg_summary,
+                        "points": [
+                            {"latitude": 36.63870, "longitude": -95.15440},
+                            {"latitude": 36.87450, "longitude": -94.87750},
+                        ],
+                    },
+                ],
+                "sections": [
+                    {"startPointIndex": 0, "endPointIndex": 3, "sectionType": "TRAVEL_MODE"}
+                ],
+            }
+        ],
+    }
+    normalized = normalize_route(tomtom)
+    route = normalized["routes"][0]
+    assert len(route["points"]) == 4
+    assert route["summary"]["lengthInMeters"] == 122468
+
+    restored = unpack_route(pack_route(normalized))["routes"][0]
+    assert restored["summary"] == route["summary"]
+    for got, want in zip(restored["points"], route["points"]):
+        assert abs(got["latitude"] - want["latitude"]) < 1e-5
+        assert abs(got["longitude"] - want["longitude"]) < 1e-5
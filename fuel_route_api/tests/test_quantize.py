@@ -0,0 +1,58 @@
+import random
+
+from fuel_route_api.core.quantize import (
+    EndpointSnapper,
+    geohash_center,
+    geohash_encode,
+    replay_hit_rate,
+)
+
+
+def test_grid_snapping_merges_nearby_endpoints():
+    snapper = EndpointSnapper(mode="grid", precision=3)
+    a, err_a = snapper.snap_endpoints({"start": [40.71281, -74.00601], "finish": [41.0, -73.0]})
+    b, err_b = snapper.snap_endpoints({"start": [40.71292, -74.00588], "finish": [41.0, -73.0]})
+    assert a == b
+    assert 0 < err_a < 80 and 0 < err_b < 80
+
+
+def test_snapping_is_idempotent():
+    for snapper in (
+        EndpointSnapper(mode="grid", precision=3),
+        EndpointSnapper(mode="geohash", geohash_length=7),
+    ):
+        body = {"start_lat": 35.1234567, "start_lon": -97.7654321, "planner": "sampled"}
+        once, _ = snapper.snap_endpoints(body)
+        twice, error = snapper.snap_endpoints(once)
+        assert once == twice
+        assert error < 0.01
+        assert once["planner"] == "sampled"
+
+
+def test_geohash_round_trip():
+    # Reference value from the original geohash.org encoding.
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    lat, lon = geohash_center("u4pruydqqvj")
+    assert abs(lat - 57.64911) < 1e-5 and abs(lon - 10.40744) < 1e-5
+
+
+def test_replay_reports_higher_hit_rate_when_coarser():
+    rng = random.Random(3)
+    yards = [(rng.uniform(30, 45), rng.uniform(-110, -80)) for _ in range(5)]
+    requests = []
+    for _ in range(200):
+        lat, lon = rng.choice(yards)
+        requests.append(
+            {
+                "start_lat": lat + rng.uniform(-2e-4, 2e-4),
+                "start_lon": lon + rng.uniform(-2e-4, 2e-4),
+                "finish_lat": 39.0,
+                "finish_lon": -95.0,
+            }
+        )
+
+    raw = replay_hit_rate(requests, EndpointSnapper(mode="off"))
+    coarse = replay_hit_rate(requests, EndpointSnapper(mode="grid", precision=2))
+    assert raw["hit_rate"] == 0.0
+    assert coarse["hit_rate"] > 0.9
+    assert coarse["max_snap_error_m"] < 1000
@@ -0,0 +1,77 @@
+import itertools
+import random
+
+import pytest
+
+from fuel_route_api.core.refuel_solver import RefuelInfeasible, plan_refuel
+
+
+def brute_force_cost(mileposts, prices, route_miles, capacity, start_fuel):
+    # Integer DP over (station, fuel in tank) with mpg = 1.
+    positions = list(mileposts) + [route_miles]
+    best = {(None, start_fuel): 0.0}
+    for i, pos in enumerate(positions):
+        prev_pos = positions[i - 1] if i else 0
+        arrived = {}
+        for (_, fuel), cost in best.items():
+            left = fuel - (pos - prev_pos)
+            if left >= 0 and cost < arrived.get(left, float("inf")):
+                arrived[left] = cost
+        if i == len(mileposts):
+            return min(arrived.values()) if arrived else None
+        best = {}
+        for fuel, cost in arrived.items():
+            for buy in range(0, capacity - fuel + 1):
+                total = cost + buy * prices[i]
+                key = (i, fuel + buy)
+                if total < best.get(key, float("inf")):
+                    best[key] = total
+
+
+class TestRefuelSolver:
+    def test_no_stop_when_tank_covers_route(self):
+        plan = plan_refuel([100, 200], [3.0, 2.5], 300, 20, 30)
+        assert plan["stops"] == []
+        assert plan["total_cost"] == 0
+
+    def test_partial_fill_before_cheaper_station(self):
+        plan = plan_refuel(
+            [400, 600], [4.0, 2.0], 1000, 10, 50, start_fuel_gallons=8
+        )
+        first, second = plan["stops"]
+        assert first["milepost"] == 400
+        assert first["gallons"] == pytest.approx(4.0)
+        assert second["milepost"] == 600
+        assert second["gallons"] == pytest.approx(8.0)
+        assert plan["total_cost"] == pytest.approx(4 * 4.0 + 8 * 2.0)
+
+    def test_infeasible_gap(self):
+        with pytest.raises(RefuelInfeasible):
+            plan_refuel([100, 900], [3.0, 3.0], 1200, 10, 50)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            n = rng.randint(1, 7)
+            mileposts = sorted(rng.sample(range(1, 40), n))
+            prices = [rng.choice([1, 2, 3, 4, 5]) for _ in mileposts]
+            route_miles = rng.randint(mileposts[-1], 45)
+            capacity = rng.randint(5, 15)
+            start_fuel = rng.randint(0, capacity)
+
+            expected = brute_force_cost(
+                mileposts, prices, route_miles, capacity, start_fuel
+            )
+            if expected is None:
+                with pytest.raises(RefuelInfeasible):
+                    plan_refuel(
+                        mileposts, prices, route_miles, capacity, 1, start_fuel
+                    )
+                continue
+
+            plan = plan_refuel(mileposts, prices, route_miles, capacity, 1, start_fuel)
+            assert plan["total_cost"] == pytest.approx(expected)
+            assert all(
+                a["milepost"] < b["milepost"]
+                for a, b in itertools.pairwise(plan["stops"])
+            )
@@ -0,0 +1,113 @@
+import random
+
+import numpy as np
+
+from fuel_route_api.core.haversine import haversine_distance
+from fuel_route_api.core.road_graph import INF, RoadGraph
+
+SIZE = 25
+SPACING = 0.01
+
+
+def grid_edges(seed=0):
+    # SIZE x SIZE grid of two-way roads, each somewhat longer than the
+    # straight line between its ends, like real roads.
+    rng = random.Random(seed)
+    lats, lons = [], []
+    for r in range(SIZE):
+        for c in range(SIZE):
+            lats.append(35.0 + r * SPACING)
+            lons.append(-97.0 + c * SPACING)
+
+    sources, targets, lengths = [], [], []
+    for r in range(SIZE):
+        for c in range(SIZE):
+            u = r * SIZE + c
+            for v in ((u + 1) if c + 1 < SIZE else None, (u + SIZE) if r + 1 < SIZE else None):
+                if v is None:
+                    continue
+                meters = haversine_distance(lats[u], lons[u], lats[v], lons[v]) * 1609.34
+                length = meters * rng.uniform(1.0, 1.6)
+                sources += [u, v]
+                targets += [v, u]
+                lengths += [length, length]
+    return lats, lons, sources, targets, lengths
+
+
+def grid_graph(landmarks=4):
+    graph = RoadGraph(*grid_edges())
+    graph.build_landmarks(landmarks)
+    return graph
+
+
+def test_alt_matches_dijkstra_and_settles_fewer_nodes():
+    graph = grid_graph()
+    rng = random.Random(1)
+    for _ in range(20):
+        source, target = rng.randrange(len(graph)), rng.randrange(len(graph))
+        exact = graph._dijkstra(graph.forward, source)[target]
+        result = graph.shortest_path(source, target)
+        assert abs(result["length_m"] - exact) < 1e-6
+        assert result["nodes"][0] == source and result["nodes"][-1] == target
+
+    corner = graph.shortest_path(0, len(graph) - 1)
+    assert corner["settled"] < len(graph) / 2
+
+
+def test_route_returns_normalized_structure():
+    graph = grid_graph()
+    route = graph.route(35.0, -97.0, 35.0 + 10 * SPACING, -97.0 + 5 * SPACING)
+    summary = route["routes"][0]["summary"]
+    points = route["routes"][0]["points"]
+    assert summary["lengthInMeters"] > 0 and summary["travelTimeInSeconds"] > 0
+    assert points[0] == {"latitude": 35.0, "longitude": -97.0}
+    assert abs(points[-1]["latitude"] - (35.0 + 10 * SPACING)) < 1e-9
+
+
+def test_oneway_edges_and_unreachable_target():
+    graph = RoadGraph([35.0, 35.01, 35.02], [-97.0, -97.0, -97.0], [0, 1], [1, 2], [1200.0, 1200.0])
+    graph.build_landmarks(2)
+    assert graph.shortest_path(0, 2)["length_m"] == 2400.0
+    assert graph.shortest_path(2, 0) is None
+    assert graph._dijkstra(graph.forward, 2)[0] == INF
+
+
+def test_edge_list_and_saved_graph_round_trip(tmp_path):
+    lats, lons, sources, targets, lengths = grid_edges()
+    csv = tmp_path / "edges.csv"
+    rows = ["source,target,length_m,source_lat,source_lon,target_lat,target_lon"]
+    for u, v, length in list(zip(sources, targets, lengths))[::2]:
+        rows.append(f"{1000 + u},{1000 + v},{length},{lats[u]},{lons[u]},{lats[v]},{lons[v]}")
+    csv.write_text("\n".join(rows))
+
+    graph = RoadGraph.from_edge_list(str(csv))
+    graph.build_landmarks(3)
+    path = str(tmp_path / "graph.npz")
+    graph.save(path)
+    loaded = RoadGraph.load(path)
+
+    assert len(loaded) == SIZE * SIZE
+    assert loaded.landmarks == graph.landmarks
+    assert np.isclose(
+        loaded.shortest_path(0, len(loaded) - 1)["length_m"],
+        graph._dijkstra(graph.forward, 0)[len(graph) - 1],
+    )
+
+
+def test_edge_list_parses_osm_oneway_tags(tmp_path):
+    csv = tmp_path / "edges.csv"
+    csv.write_text(
+        "\n".join(
+            [
+                "source,target,length_m,source_lat,source_lon,target_lat,target_lon,oneway",
+                "1,2,1000,35.00,-97.0,35.01,-97.0,yes",
+                "2,3,1000,35.01,-97.0,35.02,-97.0,no",
+                "4,3,1000,35.03,-97.0,35.02,-97.0,-1",
+                "4,5,1000,35.03,-97.0,35.04,-97.0,",
+            ]
+        )
+    )
+    graph = RoadGraph.from_edge_list(str(csv))
+    edges = set(zip(*graph.edges[:2]))
+    # Nodes are renumbered in id order: 1..5 -> 0..4.
+    assert edges == {(0, 1), (1, 2), (2, 1), (2, 3), (3, 4), (4, 3)}
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from fuel_route_api.core.haversine import haversine_distance, haversine_distances
+from fuel_route_api.core.route_geometry import (
+    cumulative_miles,
+    resample,
+    route_arrays,
+    simplify,
+    simplify_coordinates,
+    simplify_route,
+)
+
+
+class TestRouteGeometry:
+    points = [
+        {"latitude": 36.5381, "longitude": -95.2214},
+        {"latitude": 38.0, "longitude": -94.0},
+        {"latitude": 44.0247, "longitude": -91.6393},
+    ]
+
+    def test_route_arrays_accepts_all_point_shapes(self):
+        expected_lats, expected_lons = route_arrays(self.points)
+        lat_lon = [{"lat": p["latitude"], "lon": p["longitude"]} for p in self.points]
+        lon_lat = [[p["longitude"], p["latitude"]] for p in self.points]
+
+        for shape in (lat_lon, lon_lat):
+            lats, lons = route_arrays(shape)
+            assert lats.flags["C_CONTIGUOUS"] and lats.dtype == np.float64
+            np.testing.assert_array_equal(lats, expected_lats)
+            np.testing.assert_array_equal(lons, expected_lons)
+
+    def test_cumulative_miles_matches_scalar_haversine(self):
+        lats, lons = route_arrays(self.points)
+        mileposts = cumulative_miles(lats, lons)
+        expected = sum(
+            haversine_distance(a["latitude"], a["longitude"], b["latitude"], b["longitude"])
+            for a, b in zip(self.points, self.points[1:])
+        )
+        assert mileposts[0] == 0
+        assert mileposts[-1] == pytest.approx(expected)
+
+    def test_resample_fixed_spacing(self):
+        lats, lons = route_arrays(self.points)
+        mileposts = cumulative_miles(lats, lons)
+        sample_lats, sample_lons, sample_miles = resample(lats, lons, mileposts, 50)
+
+        assert sample_miles[0] == 0
+        assert sample_miles[-1] == pytest.approx(mileposts[-1])
+        assert np.allclose(np.diff(sample_miles)[:-1], 50)
+        assert sample_lats[0] == lats[0] and sample_lats[-1] == lats[-1]
+        assert len(sample_lats) == len(sample_lons) == len(sample_miles)
+
+    def test_simplify_drops_collinear_points(self):
+        lats = np.linspace(36.0, 37.0, 500)
+        lons = np.linspace(-95.0, -94.0, 500)
+        np.testing.assert_array_equal(simplify(lats, lons, 0.01), [0, 499])
+
+    def test_simplify_respects_error_bound(self):
+        rng = np.random.default_rng(3)
+        lats = 36.0 + np.cumsum(rng.normal(0.001, 0.0003, 5000))
+        lons = -95.0 + np.cumsum(rng.normal(0.002, 0.0003, 5000))
+        tolerance = 0.1
+
+        kept = simplify(lats, lons, tolerance)
+        assert kept[0] == 0 and kept[-1] == len(lats) - 1
+        assert len(kept) < len(lats) / 4
+
+        # Every original vertex lies within tolerance of the simplified line.
+        dense_lats, dense_lons, _ = resample(
+            lats[kept], lons[kept], cumulative_miles(lats[kept], lons[kept]), 0.005
+        )
+        for lat, lon in zip(lats[::50], lons[::50]):
+            nearest = haversine_distances(lat, lon, dense_lats, dense_lons).min()
+            assert nearest <= tolerance + 0.01
+
+    def test_simplify_coordinates_keeps_pairs(self):
+        coordinates = [[-95.0, 36.0], [-94.5, 36.5], [-94.0, 37.0], [-93.0, 37.0]]
+        assert simplify_coordinates(coordinates, 0.5) == [
+            [-95.0, 36.0],
+            [-94.0, 37.0],
+            [-93.0, 37.0],
+        ]
+        assert simplify_coordinates(coordinates, 0) is coordinates
+
+    def test_simplify_route_keeps_summary(self):
+        route = {
+            "routes": [
+                {
+                    "summary": {"lengthInMeters": 300_000},
+                    "points": [
+                        {"latitude": lat, "longitude": lon}
+                        for lon, lat in [(-95.0, 36.0), (-94.5, 36.5), (-94.0, 37.0), (-93.0, 37.0)]
+                    ],
+                }
+            ]
+        }
+        simplified = simplify_route(route, 0.5)["routes"][0]
+        assert simplified["summary"] == {"lengthInMeters": 300_000}
+        assert [p["longitude"] for p in simplified["points"]] == [-95.0, -94.0, -93.0]
+        assert simplify_route(route, 0) is route
@@ -0,0 +1,93 @@
+import asyncio
+from collections import defaultdict
+
+import pytest
+from aiohttp import web
+
+from fuel_route_api.core.hedging import HedgePolicy
+from fuel_route_api.core.http_pool import http_pool
+from fuel_route_api.core.latency import LatencyHistogram
+from fuel_route_api.schema.schema import CoordinateSchema
+from fuel_route_api.services import mapbox_service, routing_service, tomtom_service
+from fuel_route_api.services.routing_service import RoutingService
+
+
+class NoCache:
+    async def get_from_cache(self, key):
+        return None
+
+    async def set_from_cache(self, key, value, timeout=600):
+        pass
+
+
+class AnyKey:
+    async def validate_usa_coordinates(self, lat, lon):
+        return True
+
+    async def generate_cache_key(self, data, namespace="default", price_versioned=False):
+        return f"{namespace}:{data['provider']}"
+
+
+@pytest.mark.asyncio
+async def test_slow_tomtom_is_hedged_by_mapbox_and_cancelled(monkeypatch):
+    started, cancelled = asyncio.Event(), asyncio.Event()
+
+    async def tomtom_route(request):
+        started.set()
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return web.json_response({})
+
+    async def mapbox_route(request):
+        # The middle vertex is on the line, so the facade drops it.
+        return web.json_response(
+            {
+                "routes": [
+                    {
+                        "geometry": {"coordinates": [[-95.0, 36.0], [-94.5, 36.5], [-94.0, 37.0]]},
+                        "distance": 145_000,
+                        "duration": 5_400,
+                    }
+                ]
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/routing/1/calculateRoute/{path}/json", tomtom_route)
+    app.router.add_get("/directions/v5/mapbox/driving/{path}", mapbox_route)
+    runner = web.AppRunner(app, handler_cancellation=True)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+    monkeypatch.setattr(tomtom_service, "TOMTOM_BASE_URL", base_url)
+    monkeypatch.setattr(tomtom_service, "TOMTOM_API_KEY", "test")
+    monkeypatch.setattr(mapbox_service, "MAPBOX_BASE_URL", base_url)
+    monkeypatch.setattr(mapbox_service, "MAPBOX_API_KEY", "test")
+    monkeypatch.setattr(
+        routing_service,
+        "hedge_policy",
+        HedgePolicy(default_delay=0.05, histograms=defaultdict(LatencyHistogram)),
+    )
+    service = RoutingService(providers=["tomtom", "mapbox"])
+    for provider in (service.tomtom_service, service.mapbox_service):
+        provider.cache_deps = NoCache()
+        provider.cache_key_deps = AnyKey()
+
+    try:
+        route = await service.get_route(
+            CoordinateSchema(start_lat=36.0, start_lon=-95.0, finish_lat=37.0, finish_lon=-94.0)
+        )
+        assert started.is_set()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+    finally:
+        await http_pool.close()
+        await runner.cleanup()
+
+    summary = route["routes"][0]["summary"]
+    assert summary["lengthInMeters"] == 145_000
+    assert [p["longitude"] for p in route["routes"][0]["points"]] == [-95.0, -94.0]
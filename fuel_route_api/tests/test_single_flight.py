@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from fuel_route_api.core.single_flight import DistributedSingleFlight, SingleFlight
+
+
+class MemoryCacheDeps:
+    def __init__(self):
+        self.data = {}
+
+    async def get_from_cache(self, key):
+        return self.data.get(key)
+
+    async def add_from_cache(self, key, value, timeout=600):
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete_from_cache(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return calls
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(20)))
+    assert results == [1] * 20
+    assert not flight.in_flight("k")
+    assert await flight.do("k", work) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_and_are_not_cached():
+    flight = SingleFlight()
+
+    async def boom():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("provider down")
+
+    results = await asyncio.gather(
+        *(flight.do("k", boom) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def ok():
+        return "ok"
+
+    assert await flight.do("k", ok) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_others():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.03)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("k", work))
+    second = asyncio.ensure_future(flight.do("k", work))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    assert await second == "done"
+
+
+@pytest.mark.asyncio
+async def test_follower_reads_leader_result():
+    shared = MemoryCacheDeps()
+    # Two flights with separate local state behave like two workers.
+    leader = DistributedSingleFlight("t", shared, poll_interval=0.005)
+    follower = DistributedSingleFlight("t", shared, poll_interval=0.005)
+    calls = []
+
+    async def work(name):
+        calls.append(name)
+        await asyncio.sleep(0.03)
+        shared.data["result"] = name
+        return name
+
+    async def read():
+        return shared.data.get("result")
+
+    results = await asyncio.gather(
+        leader.do("k", lambda: work("leader"), read),
+        follower.do("k", lambda: work("follower"), read),
+    )
+    assert results == ["leader", "leader"]
+    assert calls == ["leader"]
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+from fuel_route_api.core import stale_cache
+from fuel_route_api.core.stale_cache import AsyncStaleCache, unwrap, wrap
+
+
+class MemoryCacheDeps:
+    def __init__(self):
+        self.data = {}
+
+    async def get_from_cache(self, key):
+        return self.data.get(key)
+
+    async def set_from_cache(self, key, value, timeout=600):
+        self.data[key] = value
+
+    async def add_from_cache(self, key, value, timeout=600):
+        if key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def delete_from_cache(self, key):
+        self.data.pop(key, None)
+
+
+def test_envelope_round_trip_and_legacy_entries():
+    assert unwrap(wrap([1], soft_ttl=60)) == ([1], False)
+    assert unwrap(wrap([1], soft_ttl=0)) == ([1], True)
+    assert unwrap({"routes": []}) == ({"routes": []}, False)
+    assert unwrap(None) == (None, False)
+
+
+@pytest.mark.asyncio
+async def test_stale_value_served_while_one_refresh_runs():
+    deps = MemoryCacheDeps()
+    cache = AsyncStaleCache(deps)
+    refreshes = 0
+
+    async def refresh():
+        nonlocal refreshes
+        refreshes += 1
+        await asyncio.sleep(0.02)
+        await cache.set("k", "new", soft_ttl=60)
+
+    await cache.set("k", "old", soft_ttl=60)
+    assert await cache.get("k", refresh) == "old"
+    assert refreshes == 0
+
+    await cache.set("k", "old", soft_ttl=0)
+    results = await asyncio.gather(*(cache.get("k", refresh) for _ in range(5)))
+    assert results == ["old"] * 5
+    assert deps.data.get("k:refresh") == 1
+
+    await asyncio.gather(*stale_cache._refreshing)
+    assert refreshes == 1
+    assert "k:refresh" not in deps.data
+    assert await cache.peek("k") == ("new", False)
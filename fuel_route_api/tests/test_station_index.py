@@ -0,0 +1,55 @@
+import numpy as np
+
+from fuel_route_api.core.route_geometry import cumulative_miles
+from fuel_route_api.core.station_index import StationIndex
+
+
+class TestStationIndex:
+    rows = [
+        (1, "7", "WOODSHED OF BIG CABIN", "Big Cabin", 3.007, 36.5381, -95.2214),
+        (2, "9", "KWIK TRIP #796", "Tomah", 3.287, 43.9786, -90.5040),
+        (3, "11", "PILOT #123", "Vinita", 2.899, 36.6387, -95.1544),
+        (4, "12", "LOVES #456", "Miami", 3.499, 36.8745, -94.8775),
+    ]
+
+    def build(self):
+        index = StationIndex()
+        index.build(self.rows)
+        return index
+
+    def test_within_radius(self):
+        index = self.build()
+        candidates, distances = index.within(36.5381, -95.2214, 10)
+        ids = sorted(int(index.columns.pks[i]) for i in candidates)
+        assert ids == [1, 3]
+        assert all(d <= 10 for d in distances)
+
+    def test_cheapest_near_prefers_price(self):
+        index = self.build()
+        cheapest = index.cheapest_near(36.5381, -95.2214, radius_miles=50)
+        assert cheapest["id"] == 3
+        assert cheapest["retail_price"] == 2.899
+        assert cheapest["distance_miles"] < 10
+
+    def test_cheapest_near_none_when_empty_area(self):
+        index = self.build()
+        assert index.cheapest_near(30.0, -110.0, radius_miles=50) is None
+
+    def test_empty_index(self):
+        index = StationIndex()
+        index.build([])
+        assert len(index) == 0
+        assert index.cheapest_near(36.5, -95.2) is None
+
+    def test_corridor_projects_onto_route(self):
+        index = self.build()
+        lats = np.linspace(36.0, 44.5, 200)
+        lons = np.linspace(-95.3, -90.4, 200)
+        mileposts = cumulative_miles(lats, lons)
+
+        stations = index.corridor(lats, lons, mileposts, corridor_miles=20)
+        assert {s["id"] for s in stations} >= {1, 3}
+        assert all(s["detour_miles"] <= 20 for s in stations)
+        assert [s["milepost"] for s in stations] == sorted(
+            s["milepost"] for s in stations
+        )
@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from fuel_route_api.core import station_snapshot as snapshot_module
+from fuel_route_api.core.codecs import decode, encode
+from fuel_route_api.core.station_snapshot import StationSnapshot, StationSnapshotStore
+
+
+class LocMemCacheDeps:
+    def __init__(self):
+        self.cache = LocMemCache("snapshot-test", {})
+
+    def get_from_cache(self, key):
+        return self.cache.get(key)
+
+    def set_from_cache(self, key, value, timeout=600):
+        self.cache.set(key, value, timeout)
+
+
+ROWS = [
+    (3, "11", "PILOT #123", "I-44, EXIT 289", "Vinita", "OK", "307", Decimal("2.899"), 36.6387, -95.1544),
+    (1, "7", "WOODSHED OF BIG CABIN", "I-44, EXIT 283", "Big Cabin", "OK", "283", Decimal("3.007"), 36.5381, -95.2214),
+    (2, "9", "KWIK TRIP #796", "I-94, EXIT 143", "Tomah", "WI", "1", Decimal("3.287"), 43.9786, -90.5040),
+    (4, "12", "LOVES #456", "I-44, EXIT 313", "Miami", "OK", "307", Decimal("3.499"), None, None),
+]
+
+
+def test_rows_come_back_in_id_order_and_exact():
+    snapshot = StationSnapshot.from_rows(1, ROWS)
+    selection = snapshot.select()
+    assert selection.count() == 4
+    page = selection[0:2]
+    assert [row["id"] for row in page] == [1, 2]
+    assert page[0]["retail_price"] == Decimal("3.007")
+    assert selection[3]["latitude"] is None
+
+
+def test_filters_run_on_columns():
+    snapshot = StationSnapshot.from_rows(1, ROWS)
+    assert [r["id"] for r in snapshot.select(state="ok")] == [1, 3, 4]
+    assert [r["id"] for r in snapshot.select(max_price=3.007)] == [1, 3]
+    assert [r["id"] for r in snapshot.select(state="OK", min_price=3.0)] == [1, 4]
+
+
+def test_payload_round_trips_through_codec():
+    snapshot = StationSnapshot.from_rows(5, ROWS)
+    restored = StationSnapshot.from_payload(decode(encode(snapshot.to_payload())))
+    assert restored.version == 5
+    assert list(restored.select()) == list(snapshot.select())
+
+
+def test_store_builds_once_per_price_version(monkeypatch):
+    version = {"value": 1}
+    loads = []
+    monkeypatch.setattr(snapshot_module, "get_price_version", lambda: version["value"])
+    store = StationSnapshotStore(LocMemCacheDeps(), check_interval=0)
+    monkeypatch.setattr(store, "_load_rows", lambda: loads.append(1) or ROWS)
+
+    assert len(store.get()) == 4
+    store.snapshot = None
+    store.get()
+    assert len(loads) == 1
+
+    version["value"] = 2
+    assert store.get().version == 2
+    assert len(loads) == 2
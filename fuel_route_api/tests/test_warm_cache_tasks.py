@@ -0,0 +1,63 @@
+from django.core.cache.backends.locmem import LocMemCache
+
+from fuel_route_api.core import lanes
+from fuel_route_api.core.env import WARM_BEFORE_EXPIRY_SECONDS
+from fuel_route_api.core.lanes import DailyQuota
+from fuel_route_api.tasks import warm_cache_tasks
+
+
+class Lanes:
+    def __init__(self, payloads):
+        self.payloads = payloads
+
+    def top(self, k):
+        return [(payload, 10) for payload in self.payloads[:k]]
+
+
+class SummaryTtls:
+    # django-redis' ttl(): 0 for a missing key.
+    def __init__(self, ttls):
+        self.ttls = ttls
+
+    def ttl(self, key):
+        return self.ttls.get(key, 0)
+
+
+class LaneKeys:
+    def sync_generate_cache_key(self, data, namespace="default", price_versioned=False):
+        return data["lane"]
+
+
+def run_warmer(monkeypatch, payloads, ttls, quota_limit):
+    monkeypatch.setattr(lanes, "cache", LocMemCache("warm-test", {}))
+    monkeypatch.setattr(warm_cache_tasks, "lane_tracker", Lanes(payloads))
+    monkeypatch.setattr(warm_cache_tasks, "cache", SummaryTtls(ttls))
+    monkeypatch.setattr(warm_cache_tasks, "CacheKeyDependencies", LaneKeys)
+    monkeypatch.setattr(warm_cache_tasks, "warm_quota", DailyQuota("warm-test", quota_limit))
+    queued = []
+    monkeypatch.setattr(
+        warm_cache_tasks.warm_lane, "delay", lambda payload, key: queued.append(key)
+    )
+    return warm_cache_tasks.warm_popular_lanes(), queued
+
+
+def test_lanes_with_time_left_are_not_warmed(monkeypatch):
+    result, queued = run_warmer(
+        monkeypatch,
+        [{"lane": "fresh"}, {"lane": "expiring"}, {"lane": "missing"}],
+        {
+            "route:fresh:summary": WARM_BEFORE_EXPIRY_SECONDS + 60,
+            "route:expiring:summary": WARM_BEFORE_EXPIRY_SECONDS - 60,
+        },
+        quota_limit=10,
+    )
+    assert queued == ["expiring", "missing"]
+    assert result == {"lanes": 3, "queued": 2}
+
+
+def test_exhausted_quota_stops_the_loop(monkeypatch):
+    result, queued = run_warmer(
+        monkeypatch, [{"lane": name} for name in "abcd"], {}, quota_limit=2
+    )
+    assert queued == ["a", "b"]
+    assert result == {"lanes": 4, "queued": 2}